@@ -0,0 +1,20 @@
+"""Shared FastAPI dependencies for the API routes."""
+
+import asyncio
+
+from fastapi import HTTPException
+
+from ..models import Project
+from ..services import ProjectService
+
+
+async def get_project(project_id: str) -> Project:
+    """Load the project named by the ``project_id`` path parameter or raise 404.
+
+    FastAPI caches dependency results per request, so sub-dependencies that
+    also ask for the project share this single load.
+    """
+    project = await asyncio.to_thread(ProjectService.load, project_id)
+    if project is None:
+        raise HTTPException(status_code=404, detail="Project not found")
+    return project
@@ -0,0 +1,32 @@
+"""Response classes shared by the API routes."""
+
+from typing import Any
+
+import orjson
+from fastapi.responses import FileResponse, JSONResponse
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response rendered with orjson instead of the stdlib encoder.
+
+    FastAPI has deprecated its own ``ORJSONResponse`` in favour of
+    response-model serialization, but most routes here return plain dicts,
+    so this keeps orjson on that path without the deprecation warning.
+    """
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(
+            content,
+            option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY,
+        )
+
+
+class LargeFileResponse(FileResponse):
+    """FileResponse that reads 1 MiB per threadpool hop instead of 64 KiB.
+
+    Keeps FileResponse's Content-Length, ETag and Range handling, which a
+    hand-rolled StreamingResponse would lose, while cutting the per-chunk
+    thread round-trips 16x for multi-hundred-MB downloads.
+    """
+
+    chunk_size = 1024 * 1024
@@ -1,5 +1,7 @@
 from fastapi import APIRouter
 
+from ..responses import ORJSONResponse
+
 from .accounts import router as accounts_router
 from .projects import router as projects_router
 from .startup import router as startup_router
@@ -20,7 +22,7 @@ from .lan_transfer import router as lan_transfer_router
 # TEMPORARILY DISABLED - Subtitle video generation feature
 # from .subtitles import router as subtitles_router
 
-api_router = APIRouter(prefix="/api")
+api_router = APIRouter(prefix="/api", default_response_class=ORJSONResponse)
 api_router.include_router(accounts_router)
 api_router.include_router(projects_router)
 api_router.include_router(startup_router)
@@ -1,4 +1,4 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import FileResponse, Response
 
 from ...services.account_service import AccountService
@@ -6,6 +6,26 @@ from ...services.account_service import AccountService
 
 router = APIRouter(prefix="/accounts", tags=["accounts"])
 
+# 1x1 transparent PNG served when an account has no avatar on disk.
+_PLACEHOLDER_PNG = (
+    b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01"
+    b"\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89"
+    b"\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01"
+    b"\r\n\xb4\x00\x00\x00\x00IEND\xaeB`\x82"
+)
+_PLACEHOLDER_ETAG = '"placeholder-v1"'
+# The placeholder and the real avatar share one unversioned URL, so browsers
+# must revalidate (cheap 304 via ETag) to notice a newly uploaded avatar.
+_AVATAR_CACHE_CONTROL = "no-cache"
+
+
+def _etag_matches(request: Request, etag: str) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    candidates = {tag.strip() for tag in if_none_match.split(",")}
+    return "*" in candidates or etag in candidates
+
 
 @router.get("")
 async def list_accounts():
@@ -14,16 +34,29 @@ async def list_accounts():
 
 
 @router.get("/{account_id}/avatar")
-async def get_account_avatar(account_id: str):
+async def get_account_avatar(account_id: str, request: Request):
     """Serve the avatar image for an account."""
     path, content_type = AccountService.get_avatar_path(account_id)
-    if path is None or not path.exists():
-        # Return a 1x1 transparent PNG as placeholder
+    try:
+        stat = path.stat() if path is not None else None
+    except OSError:
+        stat = None
+
+    if stat is None:
+        headers = {
+            "Cache-Control": _AVATAR_CACHE_CONTROL,
+            "ETag": _PLACEHOLDER_ETAG,
+        }
+        if _etag_matches(request, _PLACEHOLDER_ETAG):
+            return Response(status_code=304, headers=headers)
         return Response(
-            content=b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01"
-            b"\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89"
-            b"\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01"
-            b"\r\n\xb4\x00\x00\x00\x00IEND\xaeB`\x82",
+            content=_PLACEHOLDER_PNG,
             media_type="image/png",
+            headers=headers,
         )
-    return FileResponse(path, media_type=content_type)
+
+    etag = f'W/"{stat.st_mtime_ns ^ stat.st_size:x}"'
+    headers = {"Cache-Control": _AVATAR_CACHE_CONTROL, "ETag": etag}
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers=headers)
+    return FileResponse(path, media_type=content_type, headers=headers)
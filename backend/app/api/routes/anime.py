@@ -2,10 +2,15 @@
 
 import asyncio
 import json
+import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from contextlib import AsyncExitStack
+from operator import itemgetter
 from pathlib import Path
 
+import orjson
+from aiofiles.ospath import exists as aio_exists, isdir as aio_isdir
 from fastapi import APIRouter, HTTPException, Query
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
@@ -23,10 +28,53 @@ from ...services.library_hydration_service import (
     SeriesDeleteBlockedError,
     SeriesRenameConflictError,
 )
+from ...utils.sse import EventSourceResponse, sse_data
 
 router = APIRouter(prefix="/anime", tags=["anime"])
 
-VIDEO_EXTENSIONS = {".mkv", ".mp4", ".avi", ".webm", ".mov", ".m4v"}
+VIDEO_EXTENSIONS = frozenset(AnimeLibraryService.VIDEO_EXTENSIONS)
+_VIDEO_EXTENSIONS_CI = VIDEO_EXTENSIONS | frozenset(ext.upper() for ext in VIDEO_EXTENSIONS)
+_BROWSE_PROBE_WORKERS = 16
+
+
+async def _validate_dir(path: Path) -> tuple[bool, bool]:
+    """Return ``(exists, is_dir)`` for *path* without blocking the event loop.
+
+    The common case (a directory) costs one executor round-trip; ``exists``
+    is only probed to pick the right error message.
+    """
+    if await aio_isdir(path):
+        return True, True
+    return await aio_exists(path), False
+
+
+def _is_video_name(name: str) -> bool:
+    """Return True when the bare file name carries a video extension.
+
+    All-lower and all-upper suffixes hit ``_VIDEO_EXTENSIONS_CI`` directly;
+    only mixed-case names pay for a ``lower()`` copy.
+    """
+    dot = name.rfind(".")
+    if dot == -1:
+        return False
+    ext = name[dot:]
+    return ext in _VIDEO_EXTENSIONS_CI or ext.lower() in VIDEO_EXTENSIONS
+
+
+def _dir_has_videos(path: str) -> bool:
+    """Return True as soon as *path* directly contains one video file.
+
+    The extension is checked before ``is_file`` so non-video children never
+    cost a type lookup, and the scan stops on the first hit.
+    """
+    try:
+        with os.scandir(path) as children:
+            for child in children:
+                if _is_video_name(child.name) and child.is_file():
+                    return True
+    except OSError:
+        return False
+    return False
 
 
 def _preflight_error_payload(
@@ -292,7 +340,8 @@ async def browse_directories(path: str | None = Query(default=None)):
     """Browse directories on the server filesystem."""
     browse_path = Path(path) if path else Path.home()
 
-    if not browse_path.exists() or not browse_path.is_dir():
+    exists, is_dir = await _validate_dir(browse_path)
+    if not exists or not is_dir:
         raise HTTPException(status_code=400, detail=f"Not a valid directory: {browse_path}")
 
     parent_path = str(browse_path.parent) if browse_path != browse_path.parent else None
@@ -300,51 +349,60 @@ async def browse_directories(path: str | None = Query(default=None)):
     def _scan_path() -> tuple[list[dict], list[dict]]:
         dirs = []
         files = []
-        try:
-            raw_entries = list(browse_path.iterdir())
-        except PermissionError:
-            return [], []
-
-        def _safe_mtime(e: Path) -> float:
+        def _safe_mtime(e: os.DirEntry) -> float:
             try:
                 return e.stat().st_mtime
             except (OSError, ValueError):
                 return 0.0
 
-        raw_entries.sort(key=_safe_mtime, reverse=True)
+        # Skip hidden entries before stat'ing them and compute each mtime once;
+        # it is both the sort key and the value returned to the client.
+        try:
+            with os.scandir(browse_path) as it:
+                raw_entries = [
+                    (_safe_mtime(entry), entry)
+                    for entry in it
+                    if not entry.name.startswith(".")
+                ]
+        except PermissionError:
+            return [], []
+
+        raw_entries.sort(key=itemgetter(0), reverse=True)
 
-        for entry in raw_entries:
-            if entry.name.startswith("."):
-                continue
+        subdirs: list[tuple[float, os.DirEntry]] = []
+        for mtime, entry in raw_entries:
             try:
                 is_dir = entry.is_dir()
                 is_file = entry.is_file()
             except OSError:
                 continue
             if is_dir:
-                try:
-                    has_videos = any(
-                        child.suffix.lower() in VIDEO_EXTENSIONS
-                        for child in entry.iterdir()
-                        if child.is_file()
-                    )
-                except (PermissionError, OSError):
-                    has_videos = False
-                dirs.append({
-                    "name": entry.name,
-                    "path": str(entry),
-                    "is_dir": True,
-                    "has_videos": has_videos,
-                    "mtime": _safe_mtime(entry),
-                })
-            elif is_file and entry.suffix.lower() in VIDEO_EXTENSIONS:
+                subdirs.append((mtime, entry))
+            elif is_file and _is_video_name(entry.name):
                 files.append({
                     "name": entry.name,
-                    "path": str(entry),
+                    "path": entry.path,
                     "is_dir": False,
                     "has_videos": False,
-                    "mtime": _safe_mtime(entry),
+                    "mtime": mtime,
                 })
+
+        # Sub-directory probes are independent readdir calls; on network
+        # mounts their latency dominates, so run them concurrently.
+        if subdirs:
+            max_workers = min(_BROWSE_PROBE_WORKERS, len(subdirs))
+            with ThreadPoolExecutor(max_workers=max_workers) as executor:
+                probes = list(executor.map(_dir_has_videos, [e.path for _, e in subdirs]))
+        else:
+            probes = []
+        for (mtime, entry), has_videos in zip(subdirs, probes):
+            dirs.append({
+                "name": entry.name,
+                "path": entry.path,
+                "is_dir": True,
+                "has_videos": has_videos,
+                "mtime": mtime,
+            })
         return dirs, files
 
     try:
@@ -370,6 +428,41 @@ async def list_indexed_anime(library_type: LibraryType = Query(...)):
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.get("/list.ndjson")
+async def stream_indexed_anime(library_type: LibraryType = Query(...)):
+    """Stream indexed series as NDJSON, one ``{"name": ...}`` object per line.
+
+    Unlike ``/list`` nothing is buffered: each line is flushed as soon as its
+    series has been resolved, so large libraries start rendering immediately.
+
+    The catalog, series states and pin counts are loaded (by resolving the
+    first series) before the response starts, so those failures still return
+    a 500 like ``/list``. A failure once streaming has begun ends the body with
+    a final ``{"error": ...}`` line.
+    """
+    details = LibraryHydrationService.iter_source_details(library_type=library_type)
+    try:
+        first = await anext(details)
+    except StopAsyncIteration:
+        first = None
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=str(e))
+
+    async def generate():
+        if first is None:
+            return
+        try:
+            yield orjson.dumps({"name": first["name"]}) + b"\n"
+            async for item in details:
+                yield orjson.dumps({"name": item["name"]}) + b"\n"
+        except Exception as e:
+            yield orjson.dumps({"error": str(e)}) + b"\n"
+        finally:
+            await details.aclose()
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 class IndexAnimeRequest(BaseModel):
     source_path: str
     library_type: LibraryType
@@ -387,11 +480,12 @@ class IndexAnimeRequest(BaseModel):
 async def index_anime(request: IndexAnimeRequest):
     """Index a new anime folder into the library with SSE progress."""
     source_folder = Path(request.source_path)
+    exists, is_dir = await _validate_dir(source_folder)
 
-    if not source_folder.exists():
+    if not exists:
         raise HTTPException(status_code=400, detail=f"Source folder not found: {request.source_path}")
 
-    if not source_folder.is_dir():
+    if not is_dir:
         raise HTTPException(status_code=400, detail=f"Source path is not a directory: {request.source_path}")
 
     target_anime_name = request.anime_name or source_folder.name
@@ -419,23 +513,38 @@ async def index_anime(request: IndexAnimeRequest):
         ):
             if progress.status == "error":
                 saw_error = True
-                yield f"data: {json.dumps(progress.to_dict())}\n\n"
+                yield sse_data(progress.to_dict())
                 return
             if progress.status == "complete":
                 final_complete = progress.to_dict()
                 break
-            yield f"data: {json.dumps(progress.to_dict())}\n\n"
+            yield sse_data(progress.to_dict())
 
         if saw_error:
             return
-        yield f"data: {json.dumps({'status': 'indexing', 'progress': 0.97, 'message': 'Packaging release...', 'anime_name': target_anime_name})}\n\n"
+        yield sse_data(
+            {
+                "status": "indexing",
+                "progress": 0.97,
+                "message": "Packaging release...",
+                "anime_name": target_anime_name,
+            }
+        )
         try:
             publish_result = await LibraryHydrationService.publish_series_release(
                 library_type=request.library_type,
                 display_name=target_anime_name,
             )
         except Exception as exc:
-            yield f"data: {json.dumps({'status': 'error', 'progress': 0.0, 'message': str(exc), 'error': str(exc), 'anime_name': target_anime_name})}\n\n"
+            yield sse_data(
+                {
+                    "status": "error",
+                    "progress": 0.0,
+                    "message": str(exc),
+                    "error": str(exc),
+                    "anime_name": target_anime_name,
+                }
+            )
             return
         AnimeMatcherService.mark_series_updated(
             request.library_type,
@@ -450,16 +559,9 @@ async def index_anime(request: IndexAnimeRequest):
             }
         final_complete["series_id"] = str(publish_result["series_id"])
         final_complete["storage_release_id"] = str(publish_result["release_id"])
-        yield f"data: {json.dumps(final_complete)}\n\n"
-
-    return StreamingResponse(
-        stream_progress(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        },
-    )
+        yield sse_data(final_complete)
+
+    return EventSourceResponse(stream_progress())
 
 
 class UpdateAnimeRequest(BaseModel):
@@ -520,16 +622,23 @@ async def update_anime(request: UpdateAnimeRequest):
             ):
                 if progress.status == "error":
                     saw_error = True
-                    yield f"data: {json.dumps(progress.to_dict())}\n\n"
+                    yield sse_data(progress.to_dict())
                     return
                 if progress.status == "complete":
                     final_complete = progress.to_dict()
                     break
-                yield f"data: {json.dumps(progress.to_dict())}\n\n"
+                yield sse_data(progress.to_dict())
 
             if saw_error:
                 return
-            yield f"data: {json.dumps({'status': 'indexing', 'progress': 0.97, 'message': 'Publishing updated release...', 'anime_name': request.anime_name})}\n\n"
+            yield sse_data(
+                {
+                    "status": "indexing",
+                    "progress": 0.97,
+                    "message": "Publishing updated release...",
+                    "anime_name": request.anime_name,
+                }
+            )
 
             expected_min_episodes: int | None = None
             if final_complete is not None:
@@ -547,7 +656,15 @@ async def update_anime(request: UpdateAnimeRequest):
                     merge_existing_release=bool(series_id),
                 )
             except Exception as exc:
-                yield f"data: {json.dumps({'status': 'error', 'progress': 0.0, 'message': str(exc), 'error': str(exc), 'anime_name': request.anime_name})}\n\n"
+                yield sse_data(
+                    {
+                        "status": "error",
+                        "progress": 0.0,
+                        "message": str(exc),
+                        "error": str(exc),
+                        "anime_name": request.anime_name,
+                    }
+                )
                 return
             AnimeMatcherService.mark_series_updated(
                 request.library_type,
@@ -562,16 +679,9 @@ async def update_anime(request: UpdateAnimeRequest):
                 }
             final_complete["series_id"] = str(publish_result["series_id"])
             final_complete["storage_release_id"] = str(publish_result["release_id"])
-            yield f"data: {json.dumps(final_complete)}\n\n"
-
-    return StreamingResponse(
-        stream_progress(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        },
-    )
+            yield sse_data(final_complete)
+
+    return EventSourceResponse(stream_progress())
 
 
 class RemoveAnimeFilesRequest(BaseModel):
@@ -599,16 +709,9 @@ async def remove_anime_files(request: RemoveAnimeFilesRequest):
                     request.library_type,
                     progress.anime_name or request.anime_name,
                 )
-            yield f"data: {json.dumps(progress.to_dict())}\n\n"
-
-    return StreamingResponse(
-        stream_progress(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        },
-    )
+            yield sse_data(progress.to_dict())
+
+    return EventSourceResponse(stream_progress())
 
 
 class CheckFoldersRequest(BaseModel):
@@ -619,11 +722,12 @@ class CheckFoldersRequest(BaseModel):
 async def check_folders(request: CheckFoldersRequest):
     """Check available folders in a path that could be indexed."""
     source_path = Path(request.path)
+    exists, is_dir = await _validate_dir(source_path)
 
-    if not source_path.exists():
+    if not exists:
         raise HTTPException(status_code=400, detail=f"Path not found: {request.path}")
 
-    if not source_path.is_dir():
+    if not is_dir:
         raise HTTPException(status_code=400, detail=f"Path is not a directory: {request.path}")
 
     folders = await AnimeLibraryService.get_available_folders(source_path)
@@ -641,71 +745,6 @@ class ValidateBatchFoldersRequest(BaseModel):
     library_type: LibraryType
 
 
-class ConflictDetails(BaseModel):
-    new_episodes: list[str]
-    removed_episodes: list[str]
-    existing_episode_count: int
-    existing_torrent_count: int
-
-
-class FolderValidationResult(BaseModel):
-    path: str
-    name: str
-    has_videos: bool
-    suggested_path: str | None = None
-    resolution: str = "new"
-    series_id: str | None = None
-    storage_release_id: str | None = None
-    conflict_details: ConflictDetails | None = None
-    orphan_reason: str | None = None
-
-
-def _find_first_video_dir(root: Path) -> str | None:
-    """BFS for the first subdirectory that directly contains video files."""
-    from collections import deque
-
-    queue = deque([root])
-    while queue:
-        current = queue.popleft()
-        try:
-            children = sorted(current.iterdir())
-        except PermissionError:
-            continue
-        for child in children:
-            if not child.is_dir() or child.name.startswith("."):
-                continue
-            try:
-                has_vids = any(
-                    f.suffix.lower() in VIDEO_EXTENSIONS
-                    for f in child.iterdir()
-                    if f.is_file()
-                )
-            except (PermissionError, OSError):
-                continue
-            if has_vids:
-                return str(child)
-            queue.append(child)
-    return None
-
-
-def _batch_episode_stems(video_names: list[str]) -> set[str]:
-    """Normalize batch comparison to logical episode names without extensions."""
-    return {Path(video_name).stem for video_name in video_names}
-
-
-def _validate_batch_folders_sync(
-    paths: list[str],
-    library_type: LibraryType,
-) -> list[dict]:
-    items = [{"path": path} for path in paths]
-    return asyncio.run(
-        IndexationPreflightService.validate_batch_items(
-            items=items,
-            library_type=library_type,
-        )
-    )
-
-
 @router.post("/validate-batch-folders")
 async def validate_batch_folders(request: ValidateBatchFoldersRequest):
     """Validate a batch of folders for indexation, detecting conflicts."""
@@ -804,7 +843,8 @@ async def index_anime_async(request: IndexAnimeAsyncRequest):
     from ...services.indexation_queue import indexation_queue
 
     source_folder = Path(request.source_path)
-    if not source_folder.exists() or not source_folder.is_dir():
+    exists, is_dir = await _validate_dir(source_folder)
+    if not exists or not is_dir:
         raise HTTPException(status_code=400, detail=f"Invalid source: {request.source_path}")
     target_anime_name = request.anime_name or source_folder.name
     preflight = await IndexationPreflightService.preflight_source(
@@ -836,7 +876,8 @@ async def update_anime_async(request: UpdateAnimeAsyncRequest):
     from ...services.indexation_queue import indexation_queue
 
     source_folder = Path(request.source_path)
-    if not source_folder.exists() or not source_folder.is_dir():
+    exists, is_dir = await _validate_dir(source_folder)
+    if not exists or not is_dir:
         raise HTTPException(status_code=400, detail=f"Invalid source: {request.source_path}")
 
     preflight = await IndexationPreflightService.preflight_source(
@@ -871,13 +912,9 @@ async def stream_jobs():
 
     async def generate():
         async for data in indexation_queue.stream_all_jobs():
-            yield f"data: {json.dumps(data)}\n\n"
+            yield sse_data(data)
 
-    return StreamingResponse(
-        generate(),
-        media_type="text/event-stream",
-        headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
-    )
+    return EventSourceResponse(generate())
 
 
 # ---------------------------------------------------------------------------
@@ -1128,15 +1165,11 @@ async def replace_torrents(
                 async for progress in TorrentReplacerService.replace_torrents(
                     full_request, qbt
                 ):
-                    yield f"data: {json.dumps(progress.model_dump(mode='json'))}\n\n"
+                    yield sse_data(progress.model_dump(mode="json"))
         finally:
             await qbt.close()
 
-    return StreamingResponse(
-        stream_progress(),
-        media_type="text/event-stream",
-        headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
-    )
+    return EventSourceResponse(stream_progress())
 
 
 @router.post("/{source_name}/torrents/replace/confirm-reindex")
@@ -1169,15 +1202,11 @@ async def confirm_reindex(
                 async for progress in TorrentReplacerService.execute_reindex(
                     full_request, qbt
                 ):
-                    yield f"data: {json.dumps(progress.model_dump(mode='json'))}\n\n"
+                    yield sse_data(progress.model_dump(mode="json"))
         finally:
             await qbt.close()
 
-    return StreamingResponse(
-        stream_progress(),
-        media_type="text/event-stream",
-        headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
-    )
+    return EventSourceResponse(stream_progress())
 
 
 # Request bodies for torrent replacement endpoints (avoid circular import issues)
@@ -1,17 +1,115 @@
 """Gap resolution routes for extending clips that hit the configured speed floor."""
 
+import asyncio
 import json
+import os
+import threading
+from pathlib import Path
 from typing import Any
-from fastapi import APIRouter, HTTPException
+
+import orjson
+from aiofiles.ospath import exists as aio_exists
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 from ...config import settings
+from ...models import Project, SceneMatch
 from ...services import ProjectService
 from ...services.gap_resolution import GapResolutionService
 from ...utils.timing import compute_adjusted_scene_end_times
+from ..deps import get_project
 
 router = APIRouter(prefix="/projects/{project_id}/gaps", tags=["gap-resolution"])
 
 
+# Parsed transcription payloads keyed by path, validated against
+# (st_mtime_ns, st_size) so repeated gap requests skip the re-read and parse.
+_TRANS_CACHE: dict[str, tuple[int, int, dict]] = {}
+_TRANS_CACHE_MAX_ENTRIES = 64
+# Loads run in asyncio.to_thread workers; serialize the evict+insert steps of
+# both transcription caches so concurrent evictions never race on one key.
+_TRANS_CACHE_LOCK = threading.Lock()
+
+
+def _load_transcription(path: Path) -> dict:
+    """Return the parsed transcription JSON at *path*, reusing a cached parse.
+
+    Raises ``OSError`` when the file is gone (its cache entry is evicted) and
+    ``json.JSONDecodeError`` when the content is not valid JSON.
+    """
+    key = str(path)
+    try:
+        st = os.stat(key)
+    except OSError:
+        _TRANS_CACHE.pop(key, None)
+        _TRANS_PATH_CACHE.pop(str(path.parent), None)
+        raise
+    cached = _TRANS_CACHE.get(key)
+    if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+        return cached[2]
+
+    data = orjson.loads(path.read_bytes())
+    with _TRANS_CACHE_LOCK:
+        _TRANS_CACHE.pop(key, None)
+        while len(_TRANS_CACHE) >= _TRANS_CACHE_MAX_ENTRIES:
+            _TRANS_CACHE.pop(next(iter(_TRANS_CACHE)))
+        _TRANS_CACHE[key] = (st.st_mtime_ns, st.st_size, data)
+    return data
+
+
+def _matches_by_scene_index(matches: list[SceneMatch]) -> dict[int, SceneMatch]:
+    """Index matches by scene, keeping the first entry like the old linear scans."""
+    by_index: dict[int, SceneMatch] = {}
+    for match in matches:
+        by_index.setdefault(match.scene_index, match)
+    return by_index
+
+
+_PRIMARY_TRANSCRIPTION = "gap_detection_transcription.json"
+_FALLBACK_TRANSCRIPTION = ("output", "transcription_timing.json")
+# project_dir -> resolved primary transcription path. Only the primary file is
+# memoized: it outranks the fallback, so a hit stays correct until the file is
+# deleted, at which point _load_transcription evicts it.
+_TRANS_PATH_CACHE: dict[str, str] = {}
+
+
+def _resolve_transcription(project_dir: Path) -> Path | None:
+    """Return the gap-detection transcription, falling back to the timing export."""
+    key = str(project_dir)
+    cached = _TRANS_PATH_CACHE.get(key)
+    if cached is not None:
+        return Path(cached)
+
+    primary = os.path.join(key, _PRIMARY_TRANSCRIPTION)
+    if os.path.exists(primary):
+        with _TRANS_CACHE_LOCK:
+            while len(_TRANS_PATH_CACHE) >= _TRANS_CACHE_MAX_ENTRIES:
+                _TRANS_PATH_CACHE.pop(next(iter(_TRANS_PATH_CACHE)))
+            _TRANS_PATH_CACHE[key] = primary
+        return Path(primary)
+
+    fallback = os.path.join(key, *_FALLBACK_TRANSCRIPTION)
+    if os.path.exists(fallback):
+        return Path(fallback)
+    return None
+
+
+def _load_project_transcription(project_dir: Path) -> dict | None:
+    """Resolve and parse the project's transcription, or None when absent.
+
+    A memoized path whose file has since been deleted is evicted by
+    ``_load_transcription``; resolve once more so the fallback still applies.
+    """
+    for _ in range(2):
+        path = _resolve_transcription(project_dir)
+        if path is None:
+            return None
+        try:
+            return _load_transcription(path)
+        except FileNotFoundError:
+            continue
+    return None
+
+
 class GapsConfigResponse(BaseModel):
     """Gap feature flags and timing configuration."""
 
@@ -20,12 +118,11 @@ class GapsConfigResponse(BaseModel):
 
 
 @router.get("/config")
-async def get_gaps_config(project_id: str) -> GapsConfigResponse:
+async def get_gaps_config(
+    project_id: str,
+    project: Project = Depends(get_project),
+) -> GapsConfigResponse:
     """Get gaps feature flags."""
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     return GapsConfigResponse(
         full_auto_enabled=settings.gaps_full_auto_enabled,
         min_speed_factor=project.resolved_min_playback_speed(),
@@ -74,16 +171,15 @@ class ComputeSpeedResponse(BaseModel):
 
 
 @router.get("")
-async def get_gaps(project_id: str) -> GapsResponse:
+async def get_gaps(
+    project_id: str,
+    project: Project = Depends(get_project),
+) -> GapsResponse:
     """Get all gaps that need resolution for this project.
 
     This should be called after the transcription step in processing
     to detect which scenes have gaps.
     """
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     project_dir = ProjectService.get_project_dir(project_id)
 
     # Load matches
@@ -97,21 +193,8 @@ async def get_gaps(project_id: str) -> GapsResponse:
         )
 
     # Load transcription (from the gap detection step - should have been saved)
-    transcription_path = project_dir / "gap_detection_transcription.json"
-    if not transcription_path.exists():
-        # Try regular transcription
-        transcription_path = project_dir / "output" / "transcription_timing.json"
-        if not transcription_path.exists():
-            return GapsResponse(
-                has_gaps=False,
-                gaps=[],
-                total_gap_duration=0.0,
-                min_speed_factor=project.resolved_min_playback_speed(),
-            )
-
     try:
-        transcription_data = json.loads(transcription_path.read_text())
-        scene_timings = transcription_data.get("scenes", [])
+        transcription_data = await asyncio.to_thread(_load_project_transcription, project_dir)
     except (json.JSONDecodeError, KeyError):
         return GapsResponse(
             has_gaps=False,
@@ -119,6 +202,14 @@ async def get_gaps(project_id: str) -> GapsResponse:
             total_gap_duration=0.0,
             min_speed_factor=project.resolved_min_playback_speed(),
         )
+    if transcription_data is None:
+        return GapsResponse(
+            has_gaps=False,
+            gaps=[],
+            total_gap_duration=0.0,
+            min_speed_factor=project.resolved_min_playback_speed(),
+        )
+    scene_timings = transcription_data.get("scenes", [])
 
     # Calculate gaps
     gaps = GapResolutionService.calculate_gaps(
@@ -144,16 +235,15 @@ class AllCandidatesResponse(BaseModel):
 
 
 @router.get("/all-candidates")
-async def get_all_candidates(project_id: str) -> AllCandidatesResponse:
+async def get_all_candidates(
+    project_id: str,
+    project: Project = Depends(get_project),
+) -> AllCandidatesResponse:
     """Get AI candidates for ALL gaps in a single batch request.
 
     Loads matches/transcription once, calculates gaps once, then generates
     candidates sequentially to avoid subprocess storms (ffprobe, pyscenedetect).
     """
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     project_dir = ProjectService.get_project_dir(project_id)
 
     # Load matches ONCE
@@ -162,17 +252,13 @@ async def get_all_candidates(project_id: str) -> AllCandidatesResponse:
         return AllCandidatesResponse(candidates_by_scene={})
 
     # Load transcription ONCE
-    transcription_path = project_dir / "gap_detection_transcription.json"
-    if not transcription_path.exists():
-        transcription_path = project_dir / "output" / "transcription_timing.json"
-        if not transcription_path.exists():
-            return AllCandidatesResponse(candidates_by_scene={})
-
     try:
-        transcription_data = json.loads(transcription_path.read_text())
-        scene_timings = transcription_data.get("scenes", [])
+        transcription_data = await asyncio.to_thread(_load_project_transcription, project_dir)
     except (json.JSONDecodeError, KeyError):
         return AllCandidatesResponse(candidates_by_scene={})
+    if transcription_data is None:
+        return AllCandidatesResponse(candidates_by_scene={})
+    scene_timings = transcription_data.get("scenes", [])
 
     # Calculate gaps ONCE
     gaps = GapResolutionService.calculate_gaps(matches.matches, scene_timings)
@@ -194,17 +280,17 @@ async def get_all_candidates(project_id: str) -> AllCandidatesResponse:
 
 
 @router.get("/{scene_index}/candidates")
-async def get_gap_candidates(project_id: str, scene_index: int) -> GapCandidatesResponse:
+async def get_gap_candidates(
+    project_id: str,
+    scene_index: int,
+    project: Project = Depends(get_project),
+) -> GapCandidatesResponse:
     """Get AI candidates for resolving a specific gap.
 
     Runs pyscenedetect on the source episode (with caching) and generates
     candidates ranked to avoid same-episode overlap first, then minimize
     extra source while preferring cut-aligned extensions.
     """
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     project_dir = ProjectService.get_project_dir(project_id)
 
     # Load matches
@@ -213,17 +299,13 @@ async def get_gap_candidates(project_id: str, scene_index: int) -> GapCandidates
         raise HTTPException(status_code=400, detail="No matches found")
 
     # Load transcription
-    transcription_path = project_dir / "gap_detection_transcription.json"
-    if not transcription_path.exists():
-        transcription_path = project_dir / "output" / "transcription_timing.json"
-        if not transcription_path.exists():
-            raise HTTPException(status_code=400, detail="No transcription found")
-
     try:
-        transcription_data = json.loads(transcription_path.read_text())
-        scene_timings = transcription_data.get("scenes", [])
+        transcription_data = await asyncio.to_thread(_load_project_transcription, project_dir)
     except (json.JSONDecodeError, KeyError):
         raise HTTPException(status_code=400, detail="Invalid transcription data")
+    if transcription_data is None:
+        raise HTTPException(status_code=400, detail="No transcription found")
+    scene_timings = transcription_data.get("scenes", [])
 
     # Calculate gaps to find this specific scene
     gaps = GapResolutionService.calculate_gaps(matches.matches, scene_timings)
@@ -263,16 +345,15 @@ class AutoFillResponse(BaseModel):
 
 
 @router.post("/auto-fill")
-async def auto_fill_all_gaps(project_id: str) -> AutoFillResponse:
+async def auto_fill_all_gaps(
+    project_id: str,
+    project: Project = Depends(get_project),
+) -> AutoFillResponse:
     """Automatically fill all gaps with their best AI candidate.
 
     For each gap, generates candidates and applies the overlap-aware best choice.
     Gaps without valid candidates are skipped.
     """
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     project_dir = ProjectService.get_project_dir(project_id)
 
     # Load matches
@@ -281,17 +362,13 @@ async def auto_fill_all_gaps(project_id: str) -> AutoFillResponse:
         raise HTTPException(status_code=400, detail="No matches found")
 
     # Load transcription
-    transcription_path = project_dir / "gap_detection_transcription.json"
-    if not transcription_path.exists():
-        transcription_path = project_dir / "output" / "transcription_timing.json"
-        if not transcription_path.exists():
-            raise HTTPException(status_code=400, detail="No transcription found")
-
     try:
-        transcription_data = json.loads(transcription_path.read_text())
-        scene_timings = transcription_data.get("scenes", [])
+        transcription_data = await asyncio.to_thread(_load_project_transcription, project_dir)
     except (json.JSONDecodeError, KeyError):
         raise HTTPException(status_code=400, detail="Invalid transcription data")
+    if transcription_data is None:
+        raise HTTPException(status_code=400, detail="No transcription found")
+    scene_timings = transcription_data.get("scenes", [])
 
     # Calculate all gaps
     gaps = GapResolutionService.calculate_gaps(matches.matches, scene_timings)
@@ -321,6 +398,8 @@ async def auto_fill_all_gaps(project_id: str) -> AutoFillResponse:
         selected_by_scene = {}
         overlap_seconds_by_scene = {}
 
+    matches_by_index = _matches_by_scene_index(matches.matches)
+
     for gap in gaps:
         candidates = candidates_by_scene.get(gap.scene_index, [])
 
@@ -340,14 +419,13 @@ async def auto_fill_all_gaps(project_id: str) -> AutoFillResponse:
             best = candidates[0]
 
         # Find and update the match
-        for match in matches.matches:
-            if match.scene_index == gap.scene_index:
-                match.start_time = best.start_time
-                match.end_time = best.end_time
-                # Convert Fraction to float for Pydantic model
-                match.speed_ratio = float(best.effective_speed)
-                match.confirmed = True
-                break
+        match = matches_by_index.get(gap.scene_index)
+        if match is not None:
+            match.start_time = best.start_time
+            match.end_time = best.end_time
+            # Convert Fraction to float for Pydantic model
+            match.speed_ratio = float(best.effective_speed)
+            match.confirmed = True
 
         overlap_seconds = overlap_seconds_by_scene.get(gap.scene_index, 0.0)
         if used_overlap_aware and overlap_seconds > 0:
@@ -382,21 +460,24 @@ async def auto_fill_all_gaps(project_id: str) -> AutoFillResponse:
 
 
 @router.post("/auto-fill-and-resolve")
-async def auto_fill_and_resolve(project_id: str) -> AutoFillResponse:
+async def auto_fill_and_resolve(
+    project_id: str,
+    project: Project = Depends(get_project),
+) -> AutoFillResponse:
     """Auto-fill all gaps and mark as resolved in a single request.
 
     Combines auto-fill + mark-resolved to save an HTTP round trip.
     """
-    result = await auto_fill_all_gaps(project_id)
+    result = await auto_fill_all_gaps(project_id, project)
 
     # Mark gaps as resolved
     project_dir = ProjectService.get_project_dir(project_id)
-    (project_dir / "gaps_resolved.flag").touch()
+    await asyncio.to_thread((project_dir / "gaps_resolved.flag").touch)
 
     return result
 
 
-@router.put("/{scene_index}")
+@router.put("/{scene_index}", dependencies=[Depends(get_project)])
 async def update_gap_timing(
     project_id: str,
     scene_index: int,
@@ -407,64 +488,59 @@ async def update_gap_timing(
     This updates the match data with the new extended timing.
     If skipped=True, we mark the scene as having an intentional gap.
     """
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     # Load matches
     matches = ProjectService.load_matches(project_id)
     if not matches:
         raise HTTPException(status_code=400, detail="No matches found")
 
     # Find and update the match
-    match_found = False
-    for match in matches.matches:
-        if match.scene_index == scene_index:
-            match.start_time = request.start_time
-            match.end_time = request.end_time
-
-            # Recalculate speed ratio based on scene duration
-            # We need to load transcription to get target duration
-            project_dir = ProjectService.get_project_dir(project_id)
-            transcription_path = project_dir / "gap_detection_transcription.json"
-            if transcription_path.exists():
-                try:
-                    transcription_data = json.loads(transcription_path.read_text())
-                    scene_timings = transcription_data.get("scenes", [])
-
-                    # Compute adjusted end times to eliminate gaps between scenes
-                    adjusted_ends = compute_adjusted_scene_end_times(
-                        scenes=scene_timings,
-                        get_scene_index=lambda s: s.get("scene_index"),
-                        get_first_word_start=lambda s: s["words"][0]["start"] if s.get("words") else None,
-                        get_last_word_end=lambda s: s["words"][-1]["end"] if s.get("words") else None,
-                    )
-
-                    scene_timing = next(
-                        (s for s in scene_timings if s.get("scene_index") == scene_index),
-                        None,
-                    )
-                    if scene_timing and scene_timing.get("words"):
-                        words = scene_timing["words"]
-                        # Use adjusted end time to eliminate gaps between scenes
-                        timeline_end = adjusted_ends.get(scene_index, words[-1]["end"])
-                        target_duration = timeline_end - words[0]["start"]
-                        # Use the Fraction-based compute function for precision
-                        speed_frac = GapResolutionService.compute_raw_speed_for_timing(
-                            request.start_time,
-                            request.end_time,
-                            target_duration,
-                        )
-                        match.speed_ratio = float(speed_frac)  # Convert to float for model
-                except (json.JSONDecodeError, KeyError):
-                    pass
+    match = _matches_by_scene_index(matches.matches).get(scene_index)
+    if match is None:
+        raise HTTPException(status_code=404, detail=f"Match for scene {scene_index} not found")
 
-            match.confirmed = True
-            match_found = True
-            break
+    match.start_time = request.start_time
+    match.end_time = request.end_time
 
-    if not match_found:
-        raise HTTPException(status_code=404, detail=f"Match for scene {scene_index} not found")
+    # Recalculate speed ratio based on scene duration
+    # We need to load transcription to get target duration
+    project_dir = ProjectService.get_project_dir(project_id)
+    transcription_path = project_dir / "gap_detection_transcription.json"
+    if await aio_exists(transcription_path):
+        try:
+            transcription_data = await asyncio.to_thread(
+                _load_transcription, transcription_path
+            )
+            scene_timings = transcription_data.get("scenes", [])
+
+            # Compute adjusted end times to eliminate gaps between scenes
+            adjusted_ends = compute_adjusted_scene_end_times(
+                scenes=scene_timings,
+                get_scene_index=lambda s: s.get("scene_index"),
+                get_first_word_start=lambda s: s["words"][0]["start"] if s.get("words") else None,
+                get_last_word_end=lambda s: s["words"][-1]["end"] if s.get("words") else None,
+            )
+
+            timings_by_index: dict[int, dict] = {}
+            for timing in scene_timings:
+                if "scene_index" in timing:
+                    timings_by_index.setdefault(timing["scene_index"], timing)
+            scene_timing = timings_by_index.get(scene_index)
+            if scene_timing and scene_timing.get("words"):
+                words = scene_timing["words"]
+                # Use adjusted end time to eliminate gaps between scenes
+                timeline_end = adjusted_ends.get(scene_index, words[-1]["end"])
+                target_duration = timeline_end - words[0]["start"]
+                # Use the Fraction-based compute function for precision
+                speed_frac = GapResolutionService.compute_raw_speed_for_timing(
+                    request.start_time,
+                    request.end_time,
+                    target_duration,
+                )
+                match.speed_ratio = float(speed_frac)  # Convert to float for model
+        except (json.JSONDecodeError, KeyError):
+            pass
+
+    match.confirmed = True
 
     # Save updated matches
     ProjectService.save_matches(project_id, matches)
@@ -507,25 +583,21 @@ async def compute_speed(project_id: str, request: ComputeSpeedRequest) -> Comput
     )
 
 
-@router.post("/mark-resolved")
+@router.post("/mark-resolved", dependencies=[Depends(get_project)])
 async def mark_gaps_resolved(project_id: str):
     """Mark gap resolution as complete, allowing processing to continue.
 
     This updates the project phase and creates a flag file.
     """
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     project_dir = ProjectService.get_project_dir(project_id)
 
     # Create a flag file indicating gaps have been resolved
-    (project_dir / "gaps_resolved.flag").touch()
+    await asyncio.to_thread((project_dir / "gaps_resolved.flag").touch)
 
     return {"status": "ok", "message": "Gap resolution complete"}
 
 
-@router.post("/reset")
+@router.post("/reset", dependencies=[Depends(get_project)])
 async def reset_gaps(project_id: str):
     """Reset gap resolution state, allowing gaps to be reprocessed.
 
@@ -533,10 +605,6 @@ async def reset_gaps(project_id: str):
     original timings (before any gap resolution was applied).
     The original matches are stored when gap detection first runs.
     """
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     project_dir = ProjectService.get_project_dir(project_id)
 
     # Remove the gaps_resolved flag
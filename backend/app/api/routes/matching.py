@@ -1,18 +1,22 @@
 import asyncio
 import logging
 import math
+import os
+from collections.abc import Iterable, Iterator
 from contextlib import suppress
-from fastapi import APIRouter, HTTPException, Query
-from fastapi.responses import FileResponse, StreamingResponse
+from functools import lru_cache
+from aiofiles.ospath import exists as aio_exists
+from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi.responses import FileResponse, Response
 from pydantic import BaseModel
-import json
 from pathlib import Path
 import re
 
 logger = logging.getLogger("uvicorn.error")
 
 from ...config import settings
-from ...models import ProjectPhase, MatchList, SceneMatch, Scene, SceneList
+from ...library_types import LibraryType
+from ...models import Project, ProjectPhase, MatchList, SceneMatch, Scene, SceneList
 from ...services import (
     ProjectService,
     AnimeMatcherService,
@@ -22,6 +26,9 @@ from ...services import (
     LibraryHydrationService,
 )
 from ...services.match_playback_service import MatchPlaybackService
+from ...utils.sse import EventSourceResponse, sse_data
+from ..deps import get_project
+from ..responses import ORJSONResponse
 
 router = APIRouter(prefix="/projects/{project_id}", tags=["matching"])
 
@@ -100,7 +107,7 @@ def _canonical_episode_option(episode: str) -> str:
     return _strip_known_media_extension(clean_episode)
 
 
-def _dedupe_episode_options(episodes: list[str]) -> list[str]:
+def _dedupe_episode_options(episodes: Iterable[str]) -> list[str]:
     """Collapse path/filename variants to one extensionless manual-selection value."""
     options = {
         canonical
@@ -148,12 +155,9 @@ def _serialize_scenes(scenes: SceneList) -> list[dict[str, float | int]]:
     ]
 
 
-@router.get("/matches/config")
+@router.get("/matches/config", dependencies=[Depends(get_project)])
 async def get_matches_config(project_id: str):
     """Get matches feature flags."""
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
     return {"full_auto_enabled": settings.matches_full_auto_enabled}
 
 
@@ -174,9 +178,19 @@ class PrepareScenePlaybackRequest(BaseModel):
     force: bool = False
 
 
+_NORMALIZE_RE = re.compile(r"[^a-z0-9]+")
+# Every ASCII byte outside [a-z0-9], for the bytes.translate fast path.
+_NORMALIZE_ASCII_DROP = bytes(
+    c for c in range(128) if not (0x61 <= c <= 0x7A or 0x30 <= c <= 0x39)
+)
+
+
 def _normalize_name(value: str) -> str:
     """Normalize folder/anime names for robust matching."""
-    return re.sub(r"[^a-z0-9]+", "", value.lower())
+    lowered = value.lower()
+    if lowered.isascii():
+        return lowered.encode("ascii").translate(None, _NORMALIZE_ASCII_DROP).decode("ascii")
+    return _NORMALIZE_RE.sub("", lowered)
 
 
 def _resolve_anime_source_dir(library_root: Path, anime_name: str) -> Path | None:
@@ -188,12 +202,55 @@ def _resolve_anime_source_dir(library_root: Path, anime_name: str) -> Path | Non
     if direct.exists() and direct.is_dir():
         return direct
 
-    target = _normalize_name(anime_name)
-    for child in library_root.iterdir():
-        if child.is_dir() and _normalize_name(child.name) == target:
-            return child
+    return _library_index(
+        str(library_root),
+        library_root.stat().st_mtime_ns,
+    ).get(_normalize_name(anime_name))
+
+
+@lru_cache(maxsize=8)
+def _library_index(library_root: str, mtime_ns: int) -> dict[str, Path]:
+    """Map normalized folder names to anime dirs for one library snapshot.
 
-    return None
+    ``mtime_ns`` is only part of the cache key: adding, removing or renaming a
+    series folder bumps the library root mtime and forces a rescan.
+    """
+    index: dict[str, Path] = {}
+    with os.scandir(library_root) as it:
+        for entry in it:
+            if entry.is_dir():
+                index.setdefault(_normalize_name(entry.name), Path(entry.path))
+    return index
+
+
+EPISODE_VIDEO_EXTENSIONS = frozenset({".mp4", ".mkv", ".avi", ".webm", ".mov", ".m4v"})
+_EPISODE_VIDEO_SUFFIXES = tuple(sorted(EPISODE_VIDEO_EXTENSIONS))
+
+
+def _iter_episode_videos(root: Path) -> Iterator[str]:
+    """Yield every video file path below ``root`` in a single scandir walk.
+
+    Like ``Path.glob("**/*.mp4")``, symlinked directories are not descended
+    into, while symlinked video files are still yielded.
+    """
+    stack = [str(root)]
+    while stack:
+        current = stack.pop()
+        try:
+            with os.scandir(current) as it:
+                for entry in it:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            stack.append(entry.path)
+                        elif (
+                            entry.name.lower().endswith(_EPISODE_VIDEO_SUFFIXES)
+                            and entry.is_file()
+                        ):
+                            yield entry.path
+                    except OSError:
+                        continue
+        except OSError:
+            continue
 
 
 def _build_episode_source_dirs(project) -> list[Path]:
@@ -228,36 +285,105 @@ def _build_episode_source_dirs(project) -> list[Path]:
     return source_dirs
 
 
+def _is_under(path: Path, root: Path) -> bool:
+    try:
+        path.resolve().relative_to(root.resolve())
+        return True
+    except ValueError:
+        return False
+
+
+def _is_library_source(path: Path, library_root: Path | None) -> bool:
+    return (
+        library_root is not None
+        and path.exists()
+        and (_is_under(path, library_root) or path.resolve() == library_root.resolve())
+    )
+
+
+def _resolve_episode_sources(project, library_root: Path | None) -> tuple[list[Path], bool]:
+    """Return the episode source dirs and whether any lives in the library."""
+    source_dirs = _build_episode_source_dirs(project)
+    return source_dirs, any(_is_library_source(src, library_root) for src in source_dirs)
+
+
+def _scan_source_dir_sync(src_path: Path) -> list[str]:
+    if src_path.is_dir():
+        return list(_iter_episode_videos(src_path))
+    if src_path.is_file() and src_path.suffix.lower() in EPISODE_VIDEO_EXTENSIONS:
+        return [str(src_path)]
+    return []
+
+
+def _collect_episodes(
+    source_dirs: list[Path],
+    library_root: Path | None,
+    manifest: dict | None,
+    library_type: LibraryType | str | None,
+) -> set[str]:
+    """Gather episode paths for every source dir; blocking, run off the loop."""
+    episodes: set[str] = set()
+    manifest_episodes: list[str] = (
+        AnimeLibraryService.list_episode_paths(
+            manifest,
+            library_type=library_type,
+        )
+        if manifest
+        else []
+    )
+
+    for src_path in source_dirs:
+        manifest_hit = False
+        if manifest is not None and _is_library_source(src_path, library_root):
+            src_resolved = src_path.resolve()
+            src_is_dir = src_resolved.is_dir()
+            src_is_file = not src_is_dir and src_resolved.is_file()
+            for episode in manifest_episodes:
+                episode_path = Path(episode)
+                if (src_is_dir and _is_under(episode_path, src_resolved)) or (
+                    src_is_file and episode_path.resolve() == src_resolved
+                ):
+                    episodes.add(episode)
+                    manifest_hit = True
+
+        # The cached manifest can lag behind the actual library contents for a
+        # scoped series folder. When it yields nothing for that source, fall
+        # back to a direct filesystem scan so manual match selection still has
+        # episodes to offer.
+        if not manifest_hit:
+            episodes.update(_scan_source_dir_sync(src_path))
+
+    return episodes
+
+
 @router.post("/sources")
-async def set_sources(project_id: str, request: SetSourcesRequest):
+async def set_sources(
+    project_id: str,
+    request: SetSourcesRequest,
+    project: Project = Depends(get_project),
+):
     """Set source episode paths for the project."""
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    # Validate paths exist
-    for path in request.paths:
-        if not Path(path).exists():
-            raise HTTPException(status_code=400, detail=f"Path not found: {path}")
+    # Validate paths exist (one thread hop for all stat calls)
+    missing = await asyncio.to_thread(
+        lambda: [path for path in request.paths if not os.path.exists(path)]
+    )
+    if missing:
+        raise HTTPException(status_code=400, detail=f"Path not found: {missing[0]}")
 
     project.source_paths = request.paths
-    ProjectService.save(project)
+    await asyncio.to_thread(ProjectService.save, project)
 
     return {"status": "ok", "source_paths": project.source_paths}
 
 
 @router.get("/sources")
-async def get_sources(project_id: str):
+async def get_sources(project_id: str, project: Project = Depends(get_project)):
     """Get source episode paths."""
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     return {"source_paths": project.source_paths}
 
 
 @router.get("/sources/episodes")
-async def list_episodes(project_id: str):
+async def list_episodes(project_id: str, project: Project = Depends(get_project)):
     """List episodes available for manual matching.
 
     Episodes are returned as canonical extensionless values. The source-video
@@ -266,71 +392,27 @@ async def list_episodes(project_id: str):
     episode keys as selectable values even if the episode is not hydrated yet;
     saving that match can hydrate the selected episode before clip prep.
     """
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    VIDEO_EXTENSIONS = {".mp4", ".mkv", ".avi", ".webm", ".mov", ".m4v"}
-    episodes: list[str] = []
-
     library_root = AnimeLibraryService.get_library_path(project.library_type)
-    source_dirs = _build_episode_source_dirs(project)
-
-    def _is_under(path: Path, root: Path) -> bool:
-        try:
-            path.resolve().relative_to(root.resolve())
-            return True
-        except ValueError:
-            return False
-
-    def _scan_source_dir_sync(src_path: Path) -> list[str]:
-        found: list[str] = []
-        if src_path.is_dir():
-            for ext in VIDEO_EXTENSIONS:
-                found.extend(str(f.resolve()) for f in src_path.glob(f"*{ext}"))
-                found.extend(str(f.resolve()) for f in src_path.glob(f"**/*{ext}"))
-        elif src_path.is_file() and src_path.suffix.lower() in VIDEO_EXTENSIONS:
-            found.append(str(src_path.resolve()))
-        return found
+    source_dirs, uses_library = await asyncio.to_thread(
+        _resolve_episode_sources,
+        project,
+        library_root,
+    )
 
     manifest: dict | None = None
-    if library_root and any(_is_under(src, library_root) or src.resolve() == library_root.resolve() for src in source_dirs if src.exists()):
+    if uses_library:
         manifest = await AnimeLibraryService.ensure_episode_manifest(
             library_type=project.library_type,
         )
 
-    manifest_episodes: list[str] = (
-        AnimeLibraryService.list_episode_paths(
-            manifest,
-            library_type=project.library_type,
-        )
-        if manifest
-        else []
+    episodes = await asyncio.to_thread(
+        _collect_episodes,
+        source_dirs,
+        library_root,
+        manifest,
+        project.library_type,
     )
 
-    for src_path in source_dirs:
-        manifest_hits_before = len(episodes)
-        if (
-            manifest is not None
-            and library_root is not None
-            and src_path.exists()
-            and (_is_under(src_path, library_root) or src_path.resolve() == library_root.resolve())
-        ):
-            src_resolved = src_path.resolve()
-            for episode in manifest_episodes:
-                episode_path = Path(episode)
-                if src_resolved.is_dir() and _is_under(episode_path, src_resolved):
-                    episodes.append(episode)
-                elif src_resolved.is_file() and episode_path.resolve() == src_resolved:
-                    episodes.append(episode)
-
-        # The cached manifest can lag behind the actual library contents for a
-        # scoped series folder. When it yields nothing for that source, fall
-        # back to a direct filesystem scan so manual match selection still has
-        # episodes to offer.
-        if len(episodes) == manifest_hits_before:
-            episodes.extend(await asyncio.to_thread(_scan_source_dir_sync, src_path))
-
     episodes = _dedupe_episode_options(episodes)
 
     if project.series_id:
@@ -357,15 +439,40 @@ async def list_episodes(project_id: str):
                 exc,
             )
 
-    return {"episodes": episodes}
+    return ORJSONResponse({"episodes": episodes})
+
+
+def _persist_match_start(project, merged_scenes: SceneList | None) -> None:
+    """Write the pre-match tiny-scene merge (if any) and the MATCHING phase."""
+    if merged_scenes is not None:
+        ProjectService.save_scenes(project.id, merged_scenes)
+    ProjectService.save(project)
+
+
+def _persist_match_result(project, scenes: SceneList, matches: MatchList) -> None:
+    """Write the aligned scenes, matches and MATCH_VALIDATION phase in one go."""
+    ProjectService.save_scenes(project.id, scenes)
+    ProjectService.save_matches(project.id, matches)
+    project.phase = ProjectPhase.MATCH_VALIDATION
+    ProjectService.save(project)
 
 
 @router.post("/matches/find")
-async def find_matches(project_id: str, request: FindMatchesRequest):
+async def find_matches(
+    project_id: str,
+    request: FindMatchesRequest,
+    project: Project = Depends(get_project),
+):
     """Find anime source matches for all scenes with optional continuous scene merging."""
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
+    # Cheap project-local checks first, so a doomed request never waits on
+    # Storage Box hydration.
+    scenes = await asyncio.to_thread(ProjectService.load_scenes, project_id)
+    if not scenes or not scenes.scenes:
+        raise HTTPException(status_code=400, detail="No scenes detected yet")
+
+    video_path = Path(project.video_path) if project.video_path else None
+    if not video_path or not await aio_exists(video_path):
+        raise HTTPException(status_code=400, detail="Video not found")
 
     if project.series_id:
         try:
@@ -383,18 +490,9 @@ async def find_matches(project_id: str, request: FindMatchesRequest):
         if request.source_path
         else AnimeLibraryService.get_library_path(project.library_type)
     )
-    if not source_path.exists():
+    if not await aio_exists(source_path):
         raise HTTPException(status_code=400, detail="Source path not found")
 
-    # Load scenes
-    scenes = ProjectService.load_scenes(project_id)
-    if not scenes or not scenes.scenes:
-        raise HTTPException(status_code=400, detail="No scenes detected yet")
-
-    video_path = Path(project.video_path) if project.video_path else None
-    if not video_path or not video_path.exists():
-        raise HTTPException(status_code=400, detail="Video not found")
-
     # Pre-match: absorb tiny scenes that produce poor matches
     TINY_SCENE_THRESHOLD = 0.35
     merged_scenes, tiny_merge_log = scenes.merge_tiny_scenes(TINY_SCENE_THRESHOLD)
@@ -405,25 +503,28 @@ async def find_matches(project_id: str, request: FindMatchesRequest):
             TINY_SCENE_THRESHOLD,
         )
         scenes = merged_scenes
-        ProjectService.save_scenes(project_id, scenes)
 
-    # Update phase
+    # Persist the tiny-scene merge and the MATCHING phase in one thread hop.
     project.phase = ProjectPhase.MATCHING
-    ProjectService.save(project)
+    await asyncio.to_thread(
+        _persist_match_start,
+        project,
+        scenes if tiny_merge_log else None,
+    )
 
     # Get anime name for filtering (if set on project)
     anime_name = project.anime_name
 
     async def stream_progress():
         if tiny_merge_log:
-            yield "data: " + json.dumps({
+            yield sse_data({
                 "status": "matching",
                 "progress": 0.0,
                 "message": f"Merged {len(tiny_merge_log)} tiny scene(s) (< {TINY_SCENE_THRESHOLD}s)",
                 "current_scene": 0,
                 "total_scenes": len(scenes.scenes),
                 "error": None,
-            }) + "\n\n"
+            })
 
         # Global scene aligner: dense correspondences, segmentation DP and
         # the Stage-5 native arbitration layer produce the final scene list
@@ -444,14 +545,14 @@ async def find_matches(project_id: str, request: FindMatchesRequest):
             else 1
         )
         if indexation_queue.available_heavy_slots() < matching_slots:
-            yield "data: " + json.dumps({
+            yield sse_data({
                 "status": "matching",
                 "progress": 0.0,
                 "message": "Waiting for a heavy-processing slot…",
                 "current_scene": 0,
                 "total_scenes": len(scenes.scenes),
                 "error": None,
-            }) + "\n\n"
+            })
 
         completed = False
         # AnimeMatcherService owns one process-global model/index manager.
@@ -469,75 +570,54 @@ async def find_matches(project_id: str, request: FindMatchesRequest):
                     if progress.status == "complete":
                         completed = True
                         continue
-                    yield f"data: {json.dumps(progress.to_dict())}\n\n"
+                    yield sse_data(progress.to_dict())
                 if progress.status == "error":
                     project.phase = ProjectPhase.SCENE_VALIDATION
-                    ProjectService.save(project)
+                    await asyncio.to_thread(ProjectService.save, project)
                     return
 
         align_result = SceneAlignerService.get_last_result()
         if not completed or align_result is None:
-            yield (
-                "data: "
-                + json.dumps(
-                    {
-                        "status": "error",
-                        "progress": 0.0,
-                        "message": "",
-                        "current_scene": 0,
-                        "total_scenes": len(scenes.scenes),
-                        "error": "Matching completed without results",
-                    }
-                )
-                + "\n\n"
-            )
+            yield sse_data({
+                "status": "error",
+                "progress": 0.0,
+                "message": "",
+                "current_scene": 0,
+                "total_scenes": len(scenes.scenes),
+                "error": "Matching completed without results",
+            })
             project.phase = ProjectPhase.SCENE_VALIDATION
-            ProjectService.save(project)
+            await asyncio.to_thread(ProjectService.save, project)
             return
 
         final_scenes = align_result.scenes
         final_matches = align_result.matches
-        ProjectService.save_scenes(project_id, final_scenes)
-        ProjectService.save_matches(project_id, final_matches)
-        project.phase = ProjectPhase.MATCH_VALIDATION
-        ProjectService.save(project)
-
-        yield (
-            "data: "
-            + json.dumps(
-                {
-                    "status": "complete",
-                    "progress": 1.0,
-                    "message": f"Matched {len(final_matches.matches)} scenes.",
-                    "current_scene": len(final_matches.matches),
-                    "total_scenes": len(final_scenes.scenes),
-                    "error": None,
-                    "matches": final_matches.model_dump(),
-                }
-            )
-            + "\n\n"
+        await asyncio.to_thread(
+            _persist_match_result,
+            project,
+            final_scenes,
+            final_matches,
         )
 
-    return StreamingResponse(
-        stream_progress(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        },
-    )
+        yield sse_data({
+            "status": "complete",
+            "progress": 1.0,
+            "message": f"Matched {len(final_matches.matches)} scenes.",
+            "current_scene": len(final_matches.matches),
+            "total_scenes": len(final_scenes.scenes),
+            "error": None,
+            "matches": final_matches.model_dump(),
+        })
+
+    return EventSourceResponse(stream_progress())
 
 
 @router.post("/matches/deferred-download")
-async def deferred_download(project_id: str):
+async def deferred_download(project_id: str, project: Project = Depends(get_project)):
     """Check for missing source episodes, recover from source or download via qBittorrent.
 
     Always returns an SSE stream so the frontend can track progress phases.
     """
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     matches = ProjectService.load_matches(project_id)
     if not matches:
         raise HTTPException(status_code=400, detail="No matches found")
@@ -548,13 +628,14 @@ async def deferred_download(project_id: str):
 
     if not anime_name:
         async def _skipped():
-            yield f"data: {json.dumps({'status': 'complete', 'phase': 'check', 'message': 'No anime name set', 'progress': 1.0})}\n\n"
+            yield sse_data({
+                "status": "complete",
+                "phase": "check",
+                "message": "No anime name set",
+                "progress": 1.0,
+            })
 
-        return StreamingResponse(
-            _skipped(),
-            media_type="text/event-stream",
-            headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
-        )
+        return EventSourceResponse(_skipped())
 
     from ...services.deferred_download import DeferredDownloadService
 
@@ -643,84 +724,54 @@ async def deferred_download(project_id: str):
                 event = await event_queue.get()
                 if event is None:
                     break
-                yield f"data: {json.dumps(event)}\n\n"
+                yield sse_data(event)
         finally:
             if not producer_task.done():
                 producer_task.cancel()
                 with suppress(BaseException):
                     await producer_task
 
-    return StreamingResponse(
-        stream_progress(),
-        media_type="text/event-stream",
-        headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
-    )
+    return EventSourceResponse(stream_progress())
 
 
-@router.post("/matches/playback/prepare")
+@router.post("/matches/playback/prepare", dependencies=[Depends(get_project)])
 async def prepare_matches_playback(project_id: str, request: PreparePlaybackRequest):
     """Prepare browser-safe clips for /matches playback and Fast Watch."""
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     async def stream_progress():
         async for progress in MatchPlaybackService.prepare_playback(
             project_id,
             force=request.force,
         ):
-            yield f"data: {json.dumps(progress.to_dict())}\n\n"
-
-    return StreamingResponse(
-        stream_progress(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        },
-    )
+            yield sse_data(progress.to_dict())
+
+    return EventSourceResponse(stream_progress())
 
 
-@router.post("/matches/playback/prepare-scene/{scene_index}")
+@router.post("/matches/playback/prepare-scene/{scene_index}", dependencies=[Depends(get_project)])
 async def prepare_matches_playback_scene(
     project_id: str,
     scene_index: int,
     request: PrepareScenePlaybackRequest,
 ):
     """Prepare playback clip assets for one scene after manual match updates."""
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     async def stream_progress():
         async for progress in MatchPlaybackService.prepare_scene_playback(
             project_id,
             scene_index=scene_index,
             force=request.force,
         ):
-            yield f"data: {json.dumps(progress.to_dict())}\n\n"
-
-    return StreamingResponse(
-        stream_progress(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        },
-    )
+            yield sse_data(progress.to_dict())
+
+    return EventSourceResponse(stream_progress())
 
 
-@router.get("/matches/playback/manifest")
+@router.get("/matches/playback/manifest", dependencies=[Depends(get_project)])
 async def get_matches_playback_manifest(project_id: str):
     """Get the current prepared playback manifest for /matches."""
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     return await MatchPlaybackService.get_manifest(project_id)
 
 
-@router.get("/matches/playback/clip/{scene_index}/{track}")
+@router.get("/matches/playback/clip/{scene_index}/{track}", dependencies=[Depends(get_project)])
 async def get_matches_playback_clip(
     project_id: str,
     scene_index: int,
@@ -728,10 +779,6 @@ async def get_matches_playback_clip(
     fingerprint: str | None = Query(default=None),
 ):
     """Serve one prepared playback clip."""
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     if track not in {"tiktok", "source"}:
         raise HTTPException(status_code=400, detail="Invalid track")
     track_name = "tiktok" if track == "tiktok" else "source"
@@ -756,13 +803,9 @@ async def get_matches_playback_clip(
     )
 
 
-@router.get("/matches/playback/clips/{clip_id}")
+@router.get("/matches/playback/clips/{clip_id}", dependencies=[Depends(get_project)])
 async def get_matches_playback_clip_by_id(project_id: str, clip_id: str):
     """Serve one prepared playback clip by stable content-addressed clip id."""
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     try:
         clip_path = MatchPlaybackService.get_clip_path_by_id(project_id, clip_id)
     except FileNotFoundError as exc:
@@ -778,27 +821,25 @@ async def get_matches_playback_clip_by_id(project_id: str, clip_id: str):
     )
 
 
-@router.get("/matches")
+@router.get("/matches", dependencies=[Depends(get_project)])
 async def get_matches(project_id: str):
     """Get all matches for a project."""
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
-    matches = ProjectService.load_matches(project_id)
+    matches = await asyncio.to_thread(ProjectService.load_matches, project_id)
     if not matches:
         return {"matches": []}
 
-    return {"matches": [m.model_dump() for m in matches.matches]}
+    # MatchList is exactly {"matches": [...]}, so pydantic-core can emit the
+    # response body directly without model_dump() dicts or a second encoder.
+    return Response(content=matches.model_dump_json(), media_type="application/json")
 
 
 @router.post("/matches/merge-with-previous/{scene_index}")
-async def merge_with_previous(project_id: str, scene_index: int):
+async def merge_with_previous(
+    project_id: str,
+    scene_index: int,
+    project: Project = Depends(get_project),
+):
     """Manually merge one scene into the previous scene and re-match only it."""
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     scenes = ProjectService.load_scenes(project_id)
     if not scenes or not scenes.scenes:
         raise HTTPException(status_code=404, detail="No scenes found")
@@ -851,6 +892,7 @@ async def merge_with_previous(project_id: str, scene_index: int):
         indexation_queue.MAX_CONCURRENT if fast_matching.decode_enabled() else 1
     )
     rematched_matches: MatchList | None = None
+    merged_from = merged_matches.matches[merged_scene_index].merged_from
     async with indexation_queue.matching_lock():
         async with indexation_queue.heavy_slot("partial_matching", slots=partial_slots):
             async for progress in AnimeMatcherService.match_scenes(
@@ -863,9 +905,6 @@ async def merge_with_previous(project_id: str, scene_index: int):
                 existing_matches=merged_matches,
             ):
                 if progress.status == "complete" and progress.matches:
-                    merged_from = merged_matches.matches[merged_scene_index].merged_from
-                    if merged_scene_index < len(progress.matches.matches):
-                        progress.matches.matches[merged_scene_index].merged_from = merged_from
                     rematched_matches = progress.matches
                     continue
 
@@ -881,16 +920,22 @@ async def merge_with_previous(project_id: str, scene_index: int):
             detail="Merged scene re-match completed without results",
         )
 
-    ProjectService.save_scenes(project_id, merged_scenes)
-    ProjectService.save_matches(project_id, rematched_matches)
+    # The matcher rebuilds the SceneMatch for the re-matched scene; carry the
+    # merge chain over so undo-merge can still restore the original scenes.
+    if merged_scene_index < len(rematched_matches.matches):
+        rematched_matches.matches[merged_scene_index].merged_from = merged_from
 
-    project.phase = ProjectPhase.MATCH_VALIDATION
-    ProjectService.save(project)
+    await asyncio.to_thread(
+        _persist_match_result,
+        project,
+        merged_scenes,
+        rematched_matches,
+    )
 
-    return {
+    return ORJSONResponse({
         "scenes": _serialize_scenes(merged_scenes),
         "matches": [m.model_dump() for m in rematched_matches.matches],
-    }
+    })
 
 
 class UpdateMatchRequest(BaseModel):
@@ -913,7 +958,12 @@ class BatchUpdateMatchesRequest(BaseModel):
 
 
 @router.put("/matches/{scene_index}")
-async def update_match(project_id: str, scene_index: int, request: UpdateMatchRequest):
+async def update_match(
+    project_id: str,
+    scene_index: int,
+    request: UpdateMatchRequest,
+    project: Project = Depends(get_project),
+):
     """Update or confirm a match for a scene."""
     _validate_match_timing(
         request.start_time,
@@ -921,16 +971,12 @@ async def update_match(project_id: str, scene_index: int, request: UpdateMatchRe
         scene_index=scene_index,
     )
 
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     matches = ProjectService.load_matches(project_id)
     if not matches:
         raise HTTPException(status_code=404, detail="No matches found")
 
     # Find the match for this scene
-    match = next((m for m in matches.matches if m.scene_index == scene_index), None)
+    match = matches.get(scene_index)
     if not match:
         raise HTTPException(status_code=404, detail="Match not found for scene")
 
@@ -952,7 +998,7 @@ async def update_match(project_id: str, scene_index: int, request: UpdateMatchRe
     # Recalculate speed ratio using scene index mapping (not positional offset).
     scenes = ProjectService.load_scenes(project_id)
     if scenes:
-        scene = next((s for s in scenes.scenes if s.index == scene_index), None)
+        scene = scenes.get(scene_index)
         if scene is not None:
             scene_duration = scene.end_time - scene.start_time
             source_duration = match.end_time - match.start_time
@@ -965,12 +1011,12 @@ async def update_match(project_id: str, scene_index: int, request: UpdateMatchRe
 
 
 @router.put("/matches")
-async def update_matches_batch(project_id: str, request: BatchUpdateMatchesRequest):
+async def update_matches_batch(
+    project_id: str,
+    request: BatchUpdateMatchesRequest,
+    project: Project = Depends(get_project),
+):
     """Batch update multiple scene matches and persist once."""
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     matches = ProjectService.load_matches(project_id)
     if not matches:
         raise HTTPException(status_code=404, detail="No matches found")
@@ -1020,16 +1066,15 @@ async def update_matches_batch(project_id: str, request: BatchUpdateMatchesReque
                 match.speed_ratio = scene_duration / source_duration
 
     ProjectService.save_matches(project_id, matches)
-    return {"status": "ok", "matches": [m.model_dump() for m in matches.matches]}
+    return ORJSONResponse({
+        "status": "ok",
+        "matches": [m.model_dump() for m in matches.matches],
+    })
 
 
-@router.post("/matches/undo-merge/{scene_index}")
+@router.post("/matches/undo-merge/{scene_index}", dependencies=[Depends(get_project)])
 async def undo_merge(project_id: str, scene_index: int):
     """Undo a merge for a specific scene, restoring original sub-scenes."""
-    project = ProjectService.load(project_id)
-    if not project:
-        raise HTTPException(status_code=404, detail="Project not found")
-
     result = SceneMergerService.undo_merge(project_id, scene_index)
     if not result:
         raise HTTPException(
@@ -1038,7 +1083,7 @@ async def undo_merge(project_id: str, scene_index: int):
         )
 
     restored_scenes, restored_matches = result
-    return {
+    return ORJSONResponse({
         "scenes": _serialize_scenes(restored_scenes),
         "matches": [m.model_dump() for m in restored_matches.matches],
-    }
+    })
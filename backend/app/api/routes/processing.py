@@ -4,8 +4,8 @@ import asyncio
 import mimetypes
 import shutil
 from fastapi import APIRouter, HTTPException, UploadFile, File, Form
-from fastapi.responses import StreamingResponse, FileResponse
-from typing import Optional, Any
+from fastapi.responses import FileResponse
+from typing import Any, BinaryIO, Optional
 import json
 import re
 import tempfile
@@ -37,6 +37,8 @@ from ...services import (
 from ...services.forced_alignment import ForcedAlignmentService
 from ...services.llm_config_service import LLMConfigService
 from ...services.template_service import TemplateService
+from ...utils.sse import EventSourceResponse, sse_data
+from ..responses import LargeFileResponse
 
 router = APIRouter(prefix="/projects/{project_id}", tags=["processing"])
 
@@ -209,14 +211,19 @@ def _upload_manifest_and_persist(
         lock.release()
 
 
-async def _write_upload_to_path(upload: UploadFile, destination: Path) -> None:
-    """Stream uploaded file to disk in chunks."""
+def _copy_upload_sync(source: BinaryIO, destination: Path) -> None:
+    source.seek(0)
     with destination.open("wb") as out:
-        while True:
-            chunk = await upload.read(UPLOAD_CHUNK_SIZE)
-            if not chunk:
-                break
-            out.write(chunk)
+        shutil.copyfileobj(source, out, UPLOAD_CHUNK_SIZE)
+
+
+async def _write_upload_to_path(upload: UploadFile, destination: Path) -> None:
+    """Stream uploaded file to disk in chunks.
+
+    The whole copy runs in one worker thread instead of a threadpool hop per
+    ``upload.read`` chunk with the ``write`` calls blocking the event loop.
+    """
+    await asyncio.to_thread(_copy_upload_sync, upload.file, destination)
 
 
 def _is_wave_file(path: Path) -> bool:
@@ -239,7 +246,43 @@ def _normalize_audio_file_to_wav(input_path: Path, output_path: Path) -> None:
     audio.export(str(output_path), format="wav")
 
 
+def _concat_same_format_wavs(part_paths: list[Path], output_path: Path) -> bool:
+    """Append PCM frames of WAV parts that share one format.
+
+    Returns False without writing anything when a part is not a plain WAV or
+    its channels/sample width/rate differ from the first part.
+    """
+    if not part_paths:
+        return False
+    try:
+        params = []
+        for part_path in part_paths:
+            with wave.open(str(part_path), "rb") as wav_file:
+                params.append(wav_file.getparams())
+    except (wave.Error, EOFError):
+        return False
+    first = params[0]
+    if first.comptype != "NONE" or any(
+        (p.nchannels, p.sampwidth, p.framerate, p.comptype)
+        != (first.nchannels, first.sampwidth, first.framerate, first.comptype)
+        for p in params[1:]
+    ):
+        return False
+
+    with wave.open(str(output_path), "wb") as out:
+        out.setnchannels(first.nchannels)
+        out.setsampwidth(first.sampwidth)
+        out.setframerate(first.framerate)
+        for part_path in part_paths:
+            with wave.open(str(part_path), "rb") as wav_file:
+                while frames := wav_file.readframes(UPLOAD_CHUNK_SIZE // (first.nchannels * first.sampwidth)):
+                    out.writeframes(frames)
+    return True
+
+
 def _concat_audio_parts_to_wav(part_paths: list[Path], output_path: Path) -> None:
+    if _concat_same_format_wavs(part_paths, output_path):
+        return
     combined = AudioSegment.empty()
     for part_path in part_paths:
         combined += AudioSegment.from_file(str(part_path))
@@ -465,16 +508,9 @@ async def automate_script(project_id: str, request: ScriptAutomateRequest):
             pause_after_script=request.pause_after_script,
             skip_overlay=request.skip_overlay,
         ):
-            yield f"data: {json.dumps(event)}\n\n"
-
-    return StreamingResponse(
-        stream_progress(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        },
-    )
+            yield sse_data(event)
+
+    return EventSourceResponse(stream_progress())
 
 
 @router.post("/script/tts/prepare")
@@ -637,20 +673,12 @@ async def upload_restructured_script(
                     )
                 stored_part_paths.append(normalized_part_path)
 
-            def _concat_parts_to_wav() -> None:
-                combined_audio: Optional[AudioSegment] = None
-                for part_path in stored_part_paths:
-                    segment = AudioSegment.from_file(str(part_path))
-                    if combined_audio is None:
-                        combined_audio = segment
-                    else:
-                        combined_audio = combined_audio + segment
-                if combined_audio is None:
-                    raise ValueError("Failed to process audio parts")
-                combined_audio.export(str(audio_path), format="wav")
-
             try:
-                await asyncio.to_thread(_concat_parts_to_wav)
+                await asyncio.to_thread(
+                    _concat_audio_parts_to_wav,
+                    stored_part_paths,
+                    audio_path,
+                )
             except Exception:
                 raise HTTPException(
                     status_code=400,
@@ -1102,23 +1130,16 @@ async def process_project(project_id: str):
             matches.matches,
             reference_transcription=reference_transcription,
         ):
-            yield f"data: {json.dumps(progress.to_dict())}\n\n"
+            yield sse_data(progress.to_dict())
 
             if progress.status == "complete":
                 project.phase = ProjectPhase.COMPLETE
-                ProjectService.save(project)
+                await asyncio.to_thread(ProjectService.save, project)
             elif progress.status == "error":
                 # Keep phase as processing so user can retry
                 pass
 
-    return StreamingResponse(
-        stream_progress(),
-        media_type="text/event-stream",
-        headers={
-            "Cache-Control": "no-cache",
-            "Connection": "keep-alive",
-        },
-    )
+    return EventSourceResponse(stream_progress())
 
 
 @router.post("/duration-warning/acknowledge")
@@ -1146,7 +1167,7 @@ async def download_bundle(project_id: str):
     if not bundle_path.exists():
         raise HTTPException(status_code=404, detail="Bundle not found. Run processing first.")
 
-    return FileResponse(
+    return LargeFileResponse(
         path=bundle_path,
         filename=f"atr_project_{project_id}.zip",
         media_type="application/zip",
@@ -1165,18 +1186,31 @@ async def create_bundle(project_id: str):
         raise HTTPException(status_code=400, detail="No matches found")
 
     async def stream_progress():
-        yield f"data: {json.dumps({'status': 'processing', 'step': 'bundle', 'progress': 0.1, 'message': 'Building ZIP bundle...'})}\n\n"
+        yield sse_data({
+            "status": "processing",
+            "step": "bundle",
+            "progress": 0.1,
+            "message": "Building ZIP bundle...",
+        })
         try:
             await asyncio.to_thread(ExportService.build_bundle, project, matches.matches)
-            yield f"data: {json.dumps({'status': 'complete', 'step': 'bundle', 'progress': 1.0, 'message': 'Bundle ready', 'download_url': f'/api/projects/{project_id}/download/bundle'})}\n\n"
+            yield sse_data({
+                "status": "complete",
+                "step": "bundle",
+                "progress": 1.0,
+                "message": "Bundle ready",
+                "download_url": f"/api/projects/{project_id}/download/bundle",
+            })
         except Exception as exc:
-            yield f"data: {json.dumps({'status': 'error', 'step': 'bundle', 'progress': 0.0, 'error': str(exc), 'message': 'Bundle generation failed'})}\n\n"
+            yield sse_data({
+                "status": "error",
+                "step": "bundle",
+                "progress": 0.0,
+                "error": str(exc),
+                "message": "Bundle generation failed",
+            })
 
-    return StreamingResponse(
-        stream_progress(),
-        media_type="text/event-stream",
-        headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
-    )
+    return EventSourceResponse(stream_progress())
 
 
 @router.post("/exports/gdrive")
@@ -1193,13 +1227,17 @@ async def upload_to_gdrive(project_id: str, auto: bool = False):
             folder_url = f"https://drive.google.com/drive/folders/{folder_id}"
 
         async def stream_skipped_auto():
-            yield f"data: {json.dumps({'status': 'complete', 'step': 'gdrive', 'progress': 1.0, 'message': 'Auto-upload skipped: project already uploaded once.', 'folder_url': folder_url, 'folder_id': folder_id, 'skipped_auto': True})}\n\n"
-
-        return StreamingResponse(
-            stream_skipped_auto(),
-            media_type="text/event-stream",
-            headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
-        )
+            yield sse_data({
+                "status": "complete",
+                "step": "gdrive",
+                "progress": 1.0,
+                "message": "Auto-upload skipped: project already uploaded once.",
+                "folder_url": folder_url,
+                "folder_id": folder_id,
+                "skipped_auto": True,
+            })
+
+        return EventSourceResponse(stream_skipped_auto())
 
     matches = ProjectService.load_matches(project_id)
     if not matches:
@@ -1245,19 +1283,13 @@ async def upload_to_gdrive(project_id: str, auto: bool = False):
         }
 
     async def stream_progress():
-        yield (
-            "data: "
-            + json.dumps(
-                {
-                    "status": "processing",
-                    "step": "gdrive",
-                    "progress": 0.1,
-                    "message": "Preparing Drive upload...",
-                    "phase": "manifest",
-                }
-            )
-            + "\n\n"
-        )
+        yield sse_data({
+            "status": "processing",
+            "step": "gdrive",
+            "progress": 0.1,
+            "message": "Preparing Drive upload...",
+            "phase": "manifest",
+        })
         try:
             loop = asyncio.get_running_loop()
             progress_queue: asyncio.Queue[dict[str, Any] | object] = asyncio.Queue()
@@ -1282,7 +1314,7 @@ async def upload_to_gdrive(project_id: str, auto: bool = False):
                 payload = await progress_queue.get()
                 if payload is sentinel:
                     break
-                yield f"data: {json.dumps(_gdrive_progress_to_sse_payload(payload))}\n\n"
+                yield sse_data(_gdrive_progress_to_sse_payload(payload))
 
             result = await worker
             asyncio.create_task(
@@ -1293,32 +1325,35 @@ async def upload_to_gdrive(project_id: str, auto: bool = False):
                 )
             )
 
-            yield (
-                "data: "
-                + json.dumps(
-                    {
-                        "status": "complete",
-                        "step": "gdrive",
-                        "progress": 1.0,
-                        "message": "Upload complete",
-                        "phase": "complete",
-                        "folder_url": result["folder_url"],
-                        "folder_id": result["folder_id"],
-                        "file_count": result.get("file_count"),
-                        "files_completed": result.get("file_count"),
-                        "total_bytes": result.get("total_bytes"),
-                        "uploaded_bytes": result.get("total_bytes"),
-                    }
-                )
-                + "\n\n"
-            )
+            yield sse_data({
+                "status": "complete",
+                "step": "gdrive",
+                "progress": 1.0,
+                "message": "Upload complete",
+                "phase": "complete",
+                "folder_url": result["folder_url"],
+                "folder_id": result["folder_id"],
+                "file_count": result.get("file_count"),
+                "files_completed": result.get("file_count"),
+                "total_bytes": result.get("total_bytes"),
+                "uploaded_bytes": result.get("total_bytes"),
+            })
         except DriveUploadInProgressError as exc:
-            yield f"data: {json.dumps({'status': 'error', 'step': 'gdrive', 'progress': 0.0, 'error': str(exc), 'error_code': 'upload_in_progress', 'message': 'Drive upload already running for this project'})}\n\n"
+            yield sse_data({
+                "status": "error",
+                "step": "gdrive",
+                "progress": 0.0,
+                "error": str(exc),
+                "error_code": "upload_in_progress",
+                "message": "Drive upload already running for this project",
+            })
         except Exception as exc:
-            yield f"data: {json.dumps({'status': 'error', 'step': 'gdrive', 'progress': 0.0, 'error': str(exc), 'message': 'Drive upload failed'})}\n\n"
-
-    return StreamingResponse(
-        stream_progress(),
-        media_type="text/event-stream",
-        headers={"Cache-Control": "no-cache", "Connection": "keep-alive"},
-    )
+            yield sse_data({
+                "status": "error",
+                "step": "gdrive",
+                "progress": 0.0,
+                "error": str(exc),
+                "message": "Drive upload failed",
+            })
+
+    return EventSourceResponse(stream_progress())
@@ -57,16 +57,17 @@ def _is_path_allowed(path: Path, source_dirs: list[Path]) -> bool:
 
 
 def _search_episode_sync(episode_name: str, source_dirs: list[Path], video_extensions: set[str]) -> Path | None:
+    file_names = {f"{episode_name}{ext}" for ext in video_extensions}
     for src_path in source_dirs:
         if src_path.is_dir():
-            for ext in video_extensions:
-                candidate = src_path / f"{episode_name}{ext}"
+            for name in file_names:
+                candidate = src_path / name
                 if candidate.exists():
                     return candidate
-            for ext in video_extensions:
-                for match in src_path.rglob(f"*{ext}"):
-                    if match.stem == episode_name:
-                        return match
+            # One walk for every extension instead of one rglob per extension.
+            for match in src_path.rglob("*"):
+                if match.name in file_names:
+                    return match
         elif src_path.is_file() and src_path.stem == episode_name:
             return src_path
     return None
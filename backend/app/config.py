@@ -28,11 +28,25 @@ class Settings(BaseSettings):
     library_state_db_path: Path = Path(__file__).parent.parent / "data" / "library_state.db"
     ffmpeg_binary: str | None = None
     ffprobe_binary: str | None = None
+    # Probe codec/pix_fmt in-process with PyAV when installed (ffprobe otherwise).
+    pyav_probe_enabled: bool = True
 
     # anime_searcher
     anime_searcher_path: Path = Path(__file__).parent.parent.parent / "modules" / "anime_searcher"
     anime_library_path: Path = Path(__file__).parent.parent.parent / "modules" / "anime_searcher" / "library"
     sscd_model_path: Path | None = None  # User should set this
+    # List indexed series with anime_searcher's IndexManager in this process
+    # when it is importable, instead of spawning the searcher CLI.
+    anime_searcher_inprocess: bool = True
+    # Parallel directory listings for the episode manifest scan; raise this
+    # when the library lives on an NFS/SMB mount (1 = serial walk).
+    anime_library_scan_max_workers: int = 1
+    # Store symlinked library episodes under their target path in the episode
+    # manifest (one realpath per link). Disable to keep the link path.
+    anime_library_resolve_symlinks: bool = True
+    # Hard-link imported .mp4 sources into the library when they share a
+    # filesystem instead of duplicating the bytes.
+    anime_library_hardlink: bool = True
 
     # Accounts
     accounts_config_path: Path = PROJECT_ROOT / "config" / "accounts" / "config.yaml"
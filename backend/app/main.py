@@ -22,6 +22,7 @@ os.environ.setdefault("MALLOC_ARENA_MAX", "4")
 os.environ.setdefault("MALLOC_TRIM_THRESHOLD_", "131072")
 
 from fastapi import FastAPI
+from fastapi.routing import APIRoute
 from fastapi.middleware.cors import CORSMiddleware
 
 from .config import settings
@@ -203,11 +204,22 @@ async def lifespan(app: FastAPI):
     backend_executor.shutdown(wait=True, cancel_futures=True)
 
 
+def _route_unique_id(route: APIRoute) -> str:
+    """OpenAPI operation id as ``<tag>_<endpoint name>``.
+
+    Endpoint names are unique within each router tag, so this stays unique
+    while skipping the path/method string munging of FastAPI's default.
+    """
+    tag = route.tags[0] if route.tags else "default"
+    return f"{tag}_{route.name}"
+
+
 app = FastAPI(
     title="Anime TikTok Reproducer",
     description="Web app to remaster TikToks by finding anime source clips",
     version="0.1.0",
     lifespan=lifespan,
+    generate_unique_id_function=_route_unique_id,
 )
 
 # CORS middleware for frontend
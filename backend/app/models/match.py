@@ -54,3 +54,15 @@ class MatchList(BaseModel):
     """List of matches for a project."""
 
     matches: list[SceneMatch] = []
+
+    def get(self, scene_index: int) -> SceneMatch | None:
+        """Return the match for ``scene_index``, checking its list position first.
+
+        Matches are stored in scene order, so the positional probe hits for
+        everything but partially re-matched or legacy lists.
+        """
+        if 0 <= scene_index < len(self.matches):
+            match = self.matches[scene_index]
+            if match.scene_index == scene_index:
+                return match
+        return next((m for m in self.matches if m.scene_index == scene_index), None)
@@ -23,6 +23,12 @@ class SceneList(BaseModel):
         for i, scene in enumerate(self.scenes):
             scene.index = i
 
+    def get(self, index: int) -> Scene | None:
+        """Return the scene with ``index``, checking its list position first."""
+        if 0 <= index < len(self.scenes) and self.scenes[index].index == index:
+            return self.scenes[index]
+        return next((s for s in self.scenes if s.index == index), None)
+
     def validate_continuity(self) -> bool:
         """Check that scenes are continuous with no gaps."""
         if not self.scenes:
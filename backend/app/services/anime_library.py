@@ -1,6 +1,7 @@
 """Service for managing the anime library (indexing, listing, copying)."""
 
 import asyncio
+import errno
 import hashlib
 import json
 import logging
@@ -8,18 +9,32 @@ import os
 import re
 import subprocess
 import shutil
+import sys
 import threading
 import tempfile
 import unicodedata
 from collections import deque
-from contextlib import suppress
-from dataclasses import dataclass, replace
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from contextlib import AbstractAsyncContextManager, nullcontext, suppress
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, AsyncIterator
+from typing import Any, AsyncIterator, Callable, Iterable, Iterator
 
+import orjson
 from PIL import Image
 
+try:
+    import av
+except ImportError:  # pragma: no cover - exercised only when dependency missing
+    av = None
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
 from ..config import settings
 from ..library_types import DEFAULT_LIBRARY_TYPE, LibraryType, coerce_library_type, resolve_scoped_library_path
 from ..utils.media_binaries import (
@@ -31,8 +46,52 @@ from ..utils.subprocess_runner import CommandTimeoutError, run_command, terminat
 
 logger = logging.getLogger("uvicorn.error")
 
+# ioctl request number for FICLONE (linux/fs.h): share all extents of a file.
+_FICLONE = 0x40049409
+# copy_file_range/sendfile errors that mean "not supported here", not I/O failure.
+_KERNEL_COPY_FALLBACK_ERRNOS = frozenset(
+    {errno.EXDEV, errno.ENOSYS, errno.EINVAL, errno.EOPNOTSUPP, errno.ENOTSOCK}
+)
 
-@dataclass
+
+# Keyed on the settings value itself, so tests or reloads that swap
+# ``settings.anime_library_path`` / ``settings.cache_dir`` get fresh paths.
+@lru_cache(maxsize=64)
+def _scoped_library_path(
+    library_root: Path,
+    library_type: LibraryType | str | None,
+) -> Path:
+    return resolve_scoped_library_path(library_root, library_type)
+
+
+@lru_cache(maxsize=64)
+def _episode_manifest_path(
+    cache_dir: Path,
+    library_type: LibraryType | str | None,
+) -> Path:
+    scoped_type = coerce_library_type(library_type).value
+    return cache_dir / f"episodes_manifest__{scoped_type}.json"
+
+
+def _write_bytes_atomic(path: Path, data: bytes) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(path.suffix + ".tmp")
+    tmp_path.write_bytes(data)
+    tmp_path.replace(path)
+
+
+def _path_stem(path: str) -> str:
+    name = os.path.basename(path)
+    dot = name.rfind(".")
+    return name[:dot] if dot > 0 else name
+
+
+def _set_future_result(future: asyncio.Future, result: object) -> None:
+    if not future.done():
+        future.set_result(result)
+
+
+@dataclass(slots=True)
 class IndexProgress:
     """Progress information for anime indexing."""
 
@@ -108,6 +167,11 @@ class SourceVideoScan:
 
     readable_files: tuple[Path, ...] = ()
     invalid_files: tuple[Path, ...] = ()
+    probes: dict[Path, "SourceMediaProbe"] = field(
+        default_factory=dict,
+        compare=False,
+        hash=False,
+    )
 
     @property
     def has_direct_videos(self) -> bool:
@@ -195,7 +259,11 @@ class SubtitleSidecarEntry:
 class AnimeLibraryService:
     """Service for managing the anime library."""
 
-    VIDEO_EXTENSIONS = {".mkv", ".mp4", ".avi", ".webm", ".mov", ".m4v"}
+    VIDEO_EXTENSIONS = frozenset({".mkv", ".mp4", ".avi", ".webm", ".mov", ".m4v"})
+    # Lower-case suffix tuples for ``name.lower().endswith(...)`` filtering.
+    VIDEO_SUFFIXES = tuple(sorted(VIDEO_EXTENSIONS))
+    LIBRARY_EPISODE_SUFFIXES = (".mp4",)
+    TRANSIENT_VIDEO_STEM_SUFFIXES = (".import.tmp", ".normalize.tmp")
     TEXT_SUBTITLE_CODECS = {
         "ass",
         "mov_text",
@@ -223,16 +291,25 @@ class AnimeLibraryService:
     SEARCHER_ENGINE_PROFILE = "sscd_exact_resize_v1"
     SEARCHER_CUDA_OOM_BATCH_RETRY_LIMIT = 1
     SEARCHER_CUDA_OOM_RETRY_REASON = "cuda_oom_batch_downshift"
+    SEARCHER_PROGRESS_MIN_INTERVAL_SECONDS = 0.1
     PREVIEW_PROXY_TIMEOUT_SECONDS = 3600.0
     SOURCE_NORMALIZATION_TIMEOUT_SECONDS = 7200.0
     SUBTITLE_EXTRACTION_TIMEOUT_SECONDS = 1800.0
     FFPROBE_TIMEOUT_SECONDS = 30.0
+    PROBE_CACHE_MAX_ENTRIES = 4096
+    EPISODE_MANIFEST_TTL_SECONDS = 60.0
     SOURCE_NORMALIZATION_AUDIO_BITRATE = "192k"
     SOURCE_NORMALIZATION_AUDIO_RATE = "48000"
     SOURCE_NORMALIZATION_PROFILE_H264_MP4_AAC = "h264_mp4_aac"
     GPU_HWACCEL = "cuda"
     GPU_H264_ENCODER = "h264_nvenc"
     LIBRARY_IMPORT_TRANSCODE_TIMEOUT_SECONDS = 7200.0
+    LIBRARY_IMPORT_COPY_PARALLEL = 4
+    LIBRARY_IMPORT_REMUX_PARALLEL = 2
+    # NVENC caps concurrent encode sessions on consumer GPUs.
+    LIBRARY_IMPORT_TRANSCODE_PARALLEL = 1
+    FAST_COPY_BUFSIZE = 1024 * 1024
+    FAST_COPY_SENDFILE_CHUNK = 4 * 1024 * 1024
     PREMIERE_NATIVE_VIDEO_CODECS = {"h264", "hevc"}
     PREMIERE_SAFE_MP4_AUDIO_CODECS = {"aac", "ac3", "eac3"}
     _CUDA_DECODERS: dict[str, str] = {
@@ -241,6 +318,41 @@ class AnimeLibraryService:
         "hevc": "hevc_cuvid",
         "vp9": "vp9_cuvid",
     }
+    # Argv pieces for _build_gpu_h264_base_cmd, built once. Known codecs force
+    # their hardware decoder so conversion stays GPU-only.
+    _GPU_H264_HWACCEL_ARGS = (
+        "ffmpeg",
+        "-y",
+        "-hwaccel",
+        GPU_HWACCEL,
+        "-hwaccel_output_format",
+        GPU_HWACCEL,
+    )
+    _GPU_H264_INPUT_ARGS: dict[str, tuple[str, ...]] = {
+        "av1": (*_GPU_H264_HWACCEL_ARGS, "-c:v", "av1_cuvid"),
+        "h264": (*_GPU_H264_HWACCEL_ARGS, "-c:v", "h264_cuvid"),
+        "hevc": (*_GPU_H264_HWACCEL_ARGS, "-c:v", "hevc_cuvid"),
+    }
+    _GPU_H264_OUTPUT_ARGS = (
+        "-map",
+        "0:v:0",
+        "-vf",
+        "scale_cuda=format=nv12",
+        "-c:v",
+        GPU_H264_ENCODER,
+        "-preset",
+        "p5",
+        "-rc",
+        "constqp",
+        "-qp",
+        "23",
+        "-b:v",
+        "0",
+        "-profile:v",
+        "high",
+        "-movflags",
+        "+faststart",
+    )
     _CUDA_OOM_MARKERS = (
         "cuda out of memory",
         "torch.cuda.outofmemoryerror",
@@ -250,11 +362,21 @@ class AnimeLibraryService:
     )
 
     _episode_manifest_cache: dict[str, dict] = {}
+    _episode_manifest_mtimes: dict[str, int] = {}
     _episode_manifest_locks: dict[str, asyncio.Lock] = {}
-    _preview_generation_lock: asyncio.Lock | None = None
-    _preview_generation_inflight: set[str] = set()
-    _preview_proxy_locks_guard = threading.Lock()
+    _preview_generation_futures: dict[str, asyncio.Future] = {}
     _preview_proxy_locks: dict[str, threading.Lock] = {}
+    _preview_proxy_waiters_guard = threading.Lock()
+    _preview_proxy_waiters: dict[str, list[asyncio.Future]] = {}
+    _probe_cache_lock = threading.Lock()
+    _probe_cache: dict[str, dict] = {}
+    _probe_cache_loaded = False
+    _probe_cache_dirty = False
+    _index_metadata_cache: dict[Path, tuple[int, object]] = {}
+    _indexed_anime_cache: dict[str, tuple[tuple[int, int], list[str]]] = {}
+    _indexed_anime_locks: dict[str, asyncio.Lock] = {}
+    _searcher_inprocess_unavailable = False
+    _fast_copy_buffers = threading.local()
     _LANGUAGE_ALIASES = {
         "en": "en",
         "eng": "en",
@@ -331,6 +453,8 @@ class AnimeLibraryService:
         }
     )
     _SAFE_EPISODE_FILENAME_INVALID_RE = re.compile(r"[^A-Za-z0-9\[\]\(\) ._&+-]+")
+    # "done/total" counters in plain-text searcher output, e.g. "frame 12/340".
+    _SEARCHER_TEXT_COUNTER_RE = re.compile(rb"(\d+)\s*/\s*(\d+)")
 
     @staticmethod
     def get_library_root() -> Path:
@@ -343,7 +467,20 @@ class AnimeLibraryService:
         library_type: LibraryType | str | None = None,
     ) -> Path:
         """Get the scoped typed library path from settings."""
-        return resolve_scoped_library_path(cls.get_library_root(), library_type)
+        return _scoped_library_path(cls.get_library_root(), library_type)
+
+    @classmethod
+    def series_exists(
+        cls,
+        anime_name: str,
+        library_type: LibraryType | str | None = None,
+    ) -> bool:
+        """Return True when a local series directory exists for *anime_name*.
+
+        Single stat of the expected directory; use it instead of enumerating
+        the whole library when only one series matters.
+        """
+        return os.path.isdir(cls.get_library_path(library_type) / anime_name)
 
     @staticmethod
     def get_anime_searcher_path() -> Path:
@@ -414,6 +551,26 @@ class AnimeLibraryService:
             return None
         return fps
 
+    @classmethod
+    def _load_json_cached(cls, path: Path) -> object:
+        """Return the parsed JSON at *path*, reparsing only when its mtime changes.
+
+        The returned object is shared between callers and must not be mutated.
+        Raises ``OSError`` when the file is gone (its cache entry is evicted)
+        and ``json.JSONDecodeError`` when the content is not valid JSON.
+        """
+        try:
+            mtime_ns = path.stat().st_mtime_ns
+        except OSError:
+            cls._index_metadata_cache.pop(path, None)
+            raise
+        cached = cls._index_metadata_cache.get(path)
+        if cached is not None and cached[0] == mtime_ns:
+            return cached[1]
+        payload = orjson.loads(path.read_bytes())
+        cls._index_metadata_cache[path] = (mtime_ns, payload)
+        return payload
+
     @classmethod
     def _get_indexed_series_fps_sync(
         cls,
@@ -425,7 +582,7 @@ class AnimeLibraryService:
         manifest_path = index_dir / cls.MANIFEST_FILE
         if manifest_path.exists():
             try:
-                payload = json.loads(manifest_path.read_text())
+                payload = cls._load_json_cached(manifest_path)
             except (json.JSONDecodeError, OSError):
                 payload = None
 
@@ -585,34 +742,37 @@ class AnimeLibraryService:
     def _parse_searcher_progress_line(
         cls,
         *,
-        line: str,
+        line: bytes,
         status: str,
         total_files: int,
         progress_start: float,
         progress_span: float,
         text_line_index: int,
     ) -> IndexProgress | None:
-        line_str = line.strip()
-        if not line_str:
+        raw_line = line.strip()
+        if not raw_line:
             return None
 
-        try:
-            payload = json.loads(line_str)
-        except json.JSONDecodeError:
-            denominator = max(total_files * 100, 1)
-            return IndexProgress(
-                status=status,
-                message=line_str[:100],
-                progress=progress_start + progress_span * (text_line_index / denominator),
-                total_files=total_files,
-            )
+        # Only JSON objects are progress events; anything else is plain text
+        # and is decoded just for the progress message.
+        payload = None
+        if raw_line.startswith(b"{"):
+            try:
+                payload = orjson.loads(raw_line)
+            except orjson.JSONDecodeError:
+                payload = None
 
         if not isinstance(payload, dict) or "event" not in payload:
-            denominator = max(total_files * 100, 1)
+            fraction = text_line_index / max(total_files * 100, 1)
+            counter = cls._SEARCHER_TEXT_COUNTER_RE.search(raw_line)
+            if counter is not None:
+                done, total = int(counter.group(1)), int(counter.group(2))
+                if 0 < total and done <= total:
+                    fraction = done / total
             return IndexProgress(
                 status=status,
-                message=line_str[:100],
-                progress=progress_start + progress_span * (text_line_index / denominator),
+                message=raw_line.decode("utf-8", errors="replace")[:100],
+                progress=progress_start + progress_span * min(fraction, 1.0),
                 total_files=total_files,
             )
 
@@ -705,8 +865,7 @@ class AnimeLibraryService:
         library_type: LibraryType | str | None = None,
     ) -> Path:
         """Get path for cached episode index manifest."""
-        scoped_type = coerce_library_type(library_type).value
-        return settings.cache_dir / f"episodes_manifest__{scoped_type}.json"
+        return _episode_manifest_path(settings.cache_dir, library_type)
 
     @classmethod
     def _get_manifest_lock(
@@ -720,12 +879,6 @@ class AnimeLibraryService:
             cls._episode_manifest_locks[scoped_type] = lock
         return lock
 
-    @classmethod
-    def _get_preview_generation_lock(cls) -> asyncio.Lock:
-        if cls._preview_generation_lock is None:
-            cls._preview_generation_lock = asyncio.Lock()
-        return cls._preview_generation_lock
-
     @classmethod
     def _existing_prepared_library_stems_sync(cls, dest_dir: Path) -> set[str]:
         stems: set[str] = set()
@@ -736,9 +889,8 @@ class AnimeLibraryService:
 
         for entry in entries:
             if (
-                not entry.is_file()
-                or entry.suffix.lower() != ".mp4"
-                or cls.is_transient_library_video_path(entry)
+                not cls._is_library_video_name(entry.name, cls.LIBRARY_EPISODE_SUFFIXES)
+                or not entry.is_file()
             ):
                 continue
             stems.add(entry.stem)
@@ -775,21 +927,127 @@ class AnimeLibraryService:
     @classmethod
     def is_transient_library_video_path(cls, path: Path) -> bool:
         """Return True for importer-owned temporary media artifacts."""
-        if path.suffix.lower() not in cls.VIDEO_EXTENSIONS:
+        name = path.name.lower()
+        if not name.endswith(cls.VIDEO_SUFFIXES):
             return False
-        stem = path.stem.lower()
-        return stem.endswith(".import.tmp") or stem.endswith(".normalize.tmp")
+        return name[: name.rfind(".")].endswith(cls.TRANSIENT_VIDEO_STEM_SUFFIXES)
+
+    @classmethod
+    def _is_library_video_name(
+        cls,
+        name: str,
+        suffixes: tuple[str, ...] = VIDEO_SUFFIXES,
+    ) -> bool:
+        """Return True for a video file name that is not an import temp file."""
+        lowered = name.lower()
+        if not lowered.endswith(suffixes):
+            return False
+        return not lowered[: lowered.rfind(".")].endswith(cls.TRANSIENT_VIDEO_STEM_SUFFIXES)
 
     @classmethod
     def _get_preview_proxy_lock(cls, source_path: Path) -> threading.Lock:
         """Return a per-source lock to serialize sync preview proxy generation."""
         key = str(source_path.resolve())
-        with cls._preview_proxy_locks_guard:
-            lock = cls._preview_proxy_locks.get(key)
-            if lock is None:
-                lock = threading.Lock()
-                cls._preview_proxy_locks[key] = lock
-            return lock
+        lock = cls._preview_proxy_locks.get(key)
+        if lock is None:
+            # dict.setdefault is atomic under the GIL, so racing threads all
+            # end up with the same per-source lock without a global guard.
+            lock = cls._preview_proxy_locks.setdefault(key, threading.Lock())
+        return lock
+
+    @classmethod
+    def _scan_video_dir(
+        cls,
+        directory: str,
+        suffixes: tuple[str, ...],
+    ) -> tuple[list[str], list[tuple[str, str]]]:
+        """List one directory, returning ``(subdirs, [(path, stem)])``.
+
+        Paths stay the ``DirEntry.path`` strings; symlinked files are only run
+        through ``realpath`` when ``anime_library_resolve_symlinks`` is on.
+        """
+        resolve_symlinks = settings.anime_library_resolve_symlinks
+        subdirs: list[str] = []
+        videos: list[tuple[str, str]] = []
+        try:
+            with os.scandir(directory) as it:
+                entries = list(it)
+        except OSError:
+            return subdirs, videos
+        for entry in entries:
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append(entry.path)
+                    continue
+                name = entry.name
+                if not cls._is_library_video_name(name, suffixes):
+                    continue
+                stem = name[: name.rfind(".")]
+                if entry.is_symlink():
+                    if entry.is_file():
+                        path = entry.path
+                        videos.append(
+                            (os.path.realpath(path) if resolve_symlinks else path, stem)
+                        )
+                elif entry.is_file(follow_symlinks=False):
+                    videos.append((entry.path, stem))
+            except OSError:
+                continue
+        return subdirs, videos
+
+    @classmethod
+    def _iter_video_files(
+        cls,
+        root: str,
+        suffixes: tuple[str, ...] = LIBRARY_EPISODE_SUFFIXES,
+    ) -> Iterator[tuple[str, str]]:
+        """Yield ``(real_path, stem)`` for library videos below ``root``.
+
+        Walks with ``os.scandir`` so the entry type comes from the directory
+        listing instead of an extra stat per file. Symlinked directories are
+        not descended into (matching ``Path.rglob``); symlinked files are
+        resolved and kept when they point at a regular file.
+        """
+        real_root = os.path.realpath(root)
+        if not os.path.isdir(real_root):
+            return
+        pending = deque([real_root])
+        while pending:
+            subdirs, videos = cls._scan_video_dir(pending.pop(), suffixes)
+            pending.extend(subdirs)
+            yield from videos
+
+    @classmethod
+    def _concurrent_scan(
+        cls,
+        root: str,
+        max_workers: int = 16,
+        suffixes: tuple[str, ...] = LIBRARY_EPISODE_SUFFIXES,
+    ) -> list[tuple[str, str]]:
+        """Same result as ``_iter_video_files`` with many directories listed at once.
+
+        Meant for network mounts where each ``scandir`` is round-trip bound;
+        on local disks the serial walk is just as fast.
+        """
+        real_root = os.path.realpath(root)
+        if not os.path.isdir(real_root):
+            return []
+        videos: list[tuple[str, str]] = []
+        with ThreadPoolExecutor(
+            max_workers=max(1, max_workers),
+            thread_name_prefix="library-scan",
+        ) as pool:
+            inflight = {pool.submit(cls._scan_video_dir, real_root, suffixes)}
+            while inflight:
+                done, inflight = wait(inflight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    subdirs, found = future.result()
+                    videos.extend(found)
+                    inflight.update(
+                        pool.submit(cls._scan_video_dir, subdir, suffixes)
+                        for subdir in subdirs
+                    )
+        return videos
 
     @classmethod
     def _scan_library_episodes_sync(
@@ -799,61 +1057,116 @@ class AnimeLibraryService:
         """Scan library once and build fast stem -> path index."""
         scoped_type = coerce_library_type(library_type)
         library_path = cls.get_library_path(scoped_type)
-        episodes: list[str] = []
-        by_stem: dict[str, list[str]] = {}
 
-        if library_path.exists():
-            for entry in library_path.rglob("*"):
-                if (
-                    not entry.is_file()
-                    or entry.suffix.lower() != ".mp4"
-                    or cls.is_transient_library_video_path(entry)
-                ):
-                    continue
-                resolved = str(entry.resolve())
-                episodes.append(resolved)
+        scan_workers = settings.anime_library_scan_max_workers
+        if scan_workers > 1:
+            videos = cls._concurrent_scan(str(library_path), scan_workers)
+        else:
+            videos = cls._iter_video_files(str(library_path))
+        return cls._write_episode_manifest_sync(scoped_type, videos)
 
-                stem = entry.stem
-                for key in (stem, stem.lower()):
-                    by_stem.setdefault(key, []).append(resolved)
+    @classmethod
+    def _write_episode_manifest_sync(
+        cls,
+        scoped_type: LibraryType,
+        videos: Iterable[tuple[str, str]],
+    ) -> dict:
+        """Write the manifest for ``(path, stem)`` pairs.
+
+        ``by_stem`` is keyed by the lower-cased stem only; lookups lower-case
+        the query. Pairs are sorted by path once up front, so every bucket is
+        built already sorted and duplicate paths are adjacent.
+        """
+        episodes: list[str] = []
+        by_stem: dict[str, list[str]] = {}
+        for path, stem in sorted(set(videos)):
+            if not episodes or episodes[-1] != path:
+                episodes.append(path)
+            bucket = by_stem.setdefault(stem.lower(), [])
+            if not bucket or bucket[-1] != path:
+                bucket.append(path)
 
-        episodes = sorted(set(episodes))
-        by_stem = {k: sorted(set(v)) for k, v in by_stem.items()}
         manifest = {
             "generated_at": datetime.now(timezone.utc).isoformat(),
-            "library_root": str(library_path.resolve()),
+            "library_root": str(cls.get_library_path(scoped_type).resolve()),
             "episodes": episodes,
             "by_stem": by_stem,
         }
 
         manifest_path = cls.get_episode_manifest_path(scoped_type)
-        manifest_path.parent.mkdir(parents=True, exist_ok=True)
-        manifest_path.write_text(json.dumps(manifest, indent=2))
+        _write_bytes_atomic(
+            manifest_path,
+            orjson.dumps(manifest, option=orjson.OPT_APPEND_NEWLINE),
+        )
         cls._episode_manifest_cache[scoped_type.value] = manifest
+        cls._episode_manifest_mtimes[scoped_type.value] = manifest_path.stat().st_mtime_ns
+        cls._flush_probe_cache_sync()
         return manifest
 
+    @classmethod
+    def _refresh_series_manifest_sync(
+        cls,
+        anime_name: str,
+        library_type: LibraryType | str | None = None,
+    ) -> dict:
+        """Rescan one series folder and merge it into the existing manifest.
+
+        Entries are attributed to a series by path prefix, so a manifest that
+        holds resolved symlinks pointing outside the library root falls back
+        to a full rescan; otherwise their stale entries could never be dropped.
+        """
+        scoped_type = coerce_library_type(library_type)
+        current = cls._load_episode_manifest_sync(scoped_type)
+        if current is None:
+            return cls._scan_library_episodes_sync(scoped_type)
+
+        library_prefix = os.path.realpath(cls.get_library_path(scoped_type)) + os.sep
+        if not all(path.startswith(library_prefix) for path in current.get("episodes", ())):
+            return cls._scan_library_episodes_sync(scoped_type)
+
+        series_root = os.path.realpath(cls.get_library_path(scoped_type) / anime_name)
+        prefix = series_root + os.sep
+
+        videos = [
+            (path, key)
+            for key, paths in current.get("by_stem", {}).items()
+            for path in paths
+            if not path.startswith(prefix)
+        ]
+        videos.extend(cls._iter_video_files(series_root))
+        return cls._write_episode_manifest_sync(scoped_type, videos)
+
     @classmethod
     def _load_episode_manifest_sync(
         cls,
         library_type: LibraryType | str | None = None,
     ) -> dict | None:
-        """Load cached episode manifest if present."""
+        """Load cached episode manifest if present.
+
+        The parsed manifest is kept in memory and only re-read when the file's
+        mtime no longer matches the one it was parsed from.
+        """
         scoped_type = coerce_library_type(library_type)
         cached = cls._episode_manifest_cache.get(scoped_type.value)
-        if cached is not None:
-            return cached
-
         manifest_path = cls.get_episode_manifest_path(scoped_type)
-        if not manifest_path.exists():
-            return None
+        try:
+            mtime_ns = manifest_path.stat().st_mtime_ns
+        except OSError:
+            return cached
+        if (
+            cached is not None
+            and cls._episode_manifest_mtimes.get(scoped_type.value) == mtime_ns
+        ):
+            return cached
 
         try:
-            manifest = json.loads(manifest_path.read_text())
-            if not isinstance(manifest.get("by_stem"), dict):
+            manifest = orjson.loads(manifest_path.read_bytes())
+            if not isinstance(manifest, dict) or not isinstance(manifest.get("by_stem"), dict):
                 return None
             cls._episode_manifest_cache[scoped_type.value] = manifest
+            cls._episode_manifest_mtimes[scoped_type.value] = mtime_ns
             return manifest
-        except (json.JSONDecodeError, OSError):
+        except (orjson.JSONDecodeError, OSError):
             return None
 
     @classmethod
@@ -876,6 +1189,20 @@ class AnimeLibraryService:
                     return manifest
             return await asyncio.to_thread(cls._scan_library_episodes_sync, library_type)
 
+    @classmethod
+    async def refresh_series(
+        cls,
+        anime_name: str,
+        library_type: LibraryType | str | None = None,
+    ) -> dict:
+        """Update the episode manifest for one series without a full library scan."""
+        async with cls._get_manifest_lock(library_type):
+            return await asyncio.to_thread(
+                cls._refresh_series_manifest_sync,
+                anime_name,
+                library_type,
+            )
+
     @classmethod
     def resolve_episode_path(
         cls,
@@ -885,36 +1212,38 @@ class AnimeLibraryService:
         library_type: LibraryType | str | None = None,
     ) -> Path | None:
         """Resolve an episode path using cached manifest (no recursive scan)."""
-        candidate = Path(episode_name)
-        if candidate.is_absolute() and candidate.exists():
-            return candidate
-
-        library_path = cls.get_library_path(library_type)
-        if candidate.suffix and not candidate.is_absolute():
-            full = (library_path / candidate).resolve()
-            if full.exists():
-                return full
+        is_absolute = os.path.isabs(episode_name)
+        if is_absolute and os.path.exists(episode_name):
+            return Path(episode_name)
+
+        name = os.path.basename(episode_name)
+        dot = name.rfind(".")
+        has_suffix = 0 < dot < len(name) - 1
+        if has_suffix and not is_absolute:
+            full = os.path.realpath(
+                os.path.join(cls.get_library_path(library_type), episode_name)
+            )
+            if os.path.exists(full):
+                return Path(full)
 
         manifest_data = manifest or cls._load_episode_manifest_sync(library_type)
         if manifest_data is None:
             return None
 
-        lookup_keys = []
-        stem = Path(episode_name).stem if Path(episode_name).suffix else episode_name
-        for key in (episode_name, stem):
-            lookup_keys.append(key)
-            lookup_keys.append(key.lower())
+        stem = name[:dot] if has_suffix else episode_name
 
         seen: set[str] = set()
         by_stem = manifest_data.get("by_stem", {})
-        for key in lookup_keys:
-            for raw_path in by_stem.get(key, []):
+        for query in (episode_name, stem):
+            bucket = by_stem.get(query.lower(), ())
+            # Keys are case-folded; still try exact-case file names first.
+            exact = [raw_path for raw_path in bucket if _path_stem(raw_path) == query]
+            for raw_path in (*exact, *bucket):
                 if raw_path in seen:
                     continue
                 seen.add(raw_path)
-                path = Path(raw_path)
-                if path.exists():
-                    return path
+                if os.path.exists(raw_path):
+                    return Path(raw_path)
         return None
 
     @classmethod
@@ -924,11 +1253,29 @@ class AnimeLibraryService:
         *,
         library_type: LibraryType | str | None = None,
     ) -> list[str]:
-        """Return known episode absolute paths from manifest."""
+        """Return known episode absolute paths from manifest.
+
+        A manifest generated within ``EPISODE_MANIFEST_TTL_SECONDS`` is trusted
+        as-is; older ones get a per-path existence check.
+        """
         manifest_data = manifest or cls._load_episode_manifest_sync(library_type)
         if manifest_data is None:
             return []
-        return [p for p in manifest_data.get("episodes", []) if Path(p).exists()]
+        episodes = manifest_data.get("episodes", [])
+        if cls._is_manifest_fresh(manifest_data):
+            return list(episodes)
+        return [p for p in episodes if os.path.exists(p)]
+
+    @classmethod
+    def _is_manifest_fresh(cls, manifest: dict) -> bool:
+        try:
+            generated_at = datetime.fromisoformat(str(manifest.get("generated_at")))
+        except ValueError:
+            return False
+        if generated_at.tzinfo is None:
+            return False
+        age = (datetime.now(timezone.utc) - generated_at).total_seconds()
+        return 0 <= age < cls.EPISODE_MANIFEST_TTL_SECONDS
 
     @classmethod
     def _get_source_normalization_profile(cls) -> str:
@@ -938,22 +1285,20 @@ class AnimeLibraryService:
     @classmethod
     def _list_direct_video_files_sync(cls, folder: Path) -> list[Path]:
         try:
-            return sorted(
-                entry
-                for entry in folder.iterdir()
-                if (
-                    entry.is_file()
-                    and entry.suffix.lower() in cls.VIDEO_EXTENSIONS
-                    and not cls.is_transient_library_video_path(entry)
+            with os.scandir(folder) as entries:
+                return sorted(
+                    Path(entry.path)
+                    for entry in entries
+                    if cls._is_library_video_name(entry.name) and entry.is_file()
                 )
-            )
-        except (OSError, PermissionError):
+        except OSError:
             return []
 
     @classmethod
     def _scan_source_video_paths_sync(cls, source_paths: list[Path]) -> SourceVideoScan:
         readable_files: list[Path] = []
         invalid_files: list[Path] = []
+        unique_paths: list[Path] = []
         seen_paths: set[str] = set()
 
         for source_path in source_paths:
@@ -964,16 +1309,22 @@ class AnimeLibraryService:
             if key in seen_paths:
                 continue
             seen_paths.add(key)
+            unique_paths.append(source_path)
 
-            probe = cls._probe_media_sync(source_path)
+        probes = cls._batch_probe_media_sync(unique_paths)
+        readable_probes: dict[Path, SourceMediaProbe] = {}
+        for source_path in unique_paths:
+            probe = probes.get(source_path)
             if probe is None or probe.duration is None:
                 invalid_files.append(source_path)
             else:
                 readable_files.append(source_path)
+                readable_probes[source_path] = probe
 
         return SourceVideoScan(
             readable_files=tuple(readable_files),
             invalid_files=tuple(invalid_files),
+            probes=readable_probes,
         )
 
     @classmethod
@@ -1547,6 +1898,22 @@ class AnimeLibraryService:
             target_language=None,
         )
 
+    @classmethod
+    def _batch_probe_media_sync(
+        cls,
+        paths: list[Path],
+        max_workers: int | None = None,
+    ) -> dict[Path, SourceMediaProbe | None]:
+        """Probe many files with a bounded number of ffprobe processes in flight."""
+        if len(paths) <= 1:
+            return {path: cls._probe_media_sync(path) for path in paths}
+        workers = max(1, min(len(paths), max_workers or os.cpu_count() or 4))
+        with ThreadPoolExecutor(
+            max_workers=workers,
+            thread_name_prefix="media-probe",
+        ) as pool:
+            return dict(zip(paths, pool.map(cls._probe_media_sync, paths)))
+
     @classmethod
     def probe_source_media_sync(cls, source_path: Path) -> SourceMediaProbe | None:
         """Public sync probe wrapper used by source inspection and tests."""
@@ -2417,7 +2784,7 @@ class AnimeLibraryService:
         if result.returncode != 0:
             return []
         try:
-            payload = json.loads(result.stdout.decode("utf-8"))
+            payload = orjson.loads(result.stdout)
         except json.JSONDecodeError:
             return []
 
@@ -2839,9 +3206,104 @@ class AnimeLibraryService:
         key = cls._build_preview_proxy_key(source_path)
         return cls.get_preview_proxy_dir() / f"{key}.mp4"
 
+    @classmethod
+    def get_probe_cache_path(cls) -> Path:
+        """On-disk copy of the video stream probe cache."""
+        return settings.cache_dir / "ffprobe_cache.json"
+
+    @classmethod
+    def _load_probe_cache_locked(cls) -> dict[str, dict]:
+        if cls._probe_cache_loaded:
+            return cls._probe_cache
+        cls._probe_cache_loaded = True
+        try:
+            payload = orjson.loads(cls.get_probe_cache_path().read_bytes())
+        except (OSError, orjson.JSONDecodeError):
+            return cls._probe_cache
+        if isinstance(payload, dict):
+            for key, stream in payload.items():
+                if isinstance(stream, dict):
+                    cls._probe_cache.setdefault(key, stream)
+        return cls._probe_cache
+
+    @classmethod
+    def _flush_probe_cache_sync(cls) -> None:
+        """Persist probe results gathered since the last flush."""
+        cache_path = cls.get_probe_cache_path()
+        with cls._probe_cache_lock:
+            if not cls._probe_cache_dirty:
+                return
+            cls._probe_cache_dirty = False
+            try:
+                _write_bytes_atomic(cache_path, orjson.dumps(cls._probe_cache))
+            except OSError as exc:
+                logger.warning("Failed to write ffprobe cache %s: %s", cache_path, exc)
+
+    @classmethod
+    def _probe_video_stream_sync(cls, video_path: Path) -> dict | None:
+        """Return ffprobe stream info for the first video stream.
+
+        Results are cached under the same (path, size, mtime) key as preview
+        proxies, so a file is probed once until its content changes.
+        """
+        try:
+            key = cls._build_preview_proxy_key(video_path)
+        except OSError:
+            return cls._run_video_stream_probe_sync(video_path)
+
+        with cls._probe_cache_lock:
+            cached = cls._load_probe_cache_locked().get(key)
+        if cached is not None:
+            return dict(cached)
+
+        stream = cls._run_video_stream_probe_sync(video_path)
+        if stream is not None:
+            with cls._probe_cache_lock:
+                cache = cls._load_probe_cache_locked()
+                cache[key] = dict(stream)
+                while len(cache) > cls.PROBE_CACHE_MAX_ENTRIES:
+                    cache.pop(next(iter(cache)))
+                cls._probe_cache_dirty = True
+        return stream
+
+    @classmethod
+    def _run_video_stream_probe_sync(cls, video_path: Path) -> dict | None:
+        if av is not None and settings.pyav_probe_enabled:
+            stream = cls._pyav_video_stream_probe_sync(video_path)
+            if stream is not None:
+                return stream
+        return cls._ffprobe_video_stream_probe_sync(video_path)
+
+    @staticmethod
+    def _pyav_video_stream_probe_sync(video_path: Path) -> dict | None:
+        """Read codec, pix_fmt and duration in-process through libav.
+
+        Returns None (so the caller falls back to ffprobe) when the file cannot
+        be opened or the header does not expose a pixel format.
+        """
+        try:
+            with av.open(str(video_path)) as container:
+                if not container.streams.video:
+                    return None
+                codec_context = container.streams.video[0].codec_context
+                codec = codec_context.codec
+                codec_name = getattr(codec, "canonical_name", None) or codec_context.name
+                pix_fmt = codec_context.pix_fmt
+                duration_us = container.duration
+        except Exception as exc:
+            logger.debug("PyAV probe failed for %s: %s", video_path, exc)
+            return None
+        if not codec_name or not pix_fmt:
+            return None
+        stream: dict = {"codec_name": codec_name, "pix_fmt": pix_fmt}
+        if duration_us is not None:
+            stream["format_duration"] = str(duration_us / 1_000_000)
+        return stream
+
     @staticmethod
-    def _probe_video_stream_sync(video_path: Path) -> dict | None:
-        """Return ffprobe stream info for the first video stream."""
+    def _ffprobe_video_stream_probe_sync(video_path: Path) -> dict | None:
+        # The container duration rides along in the same ffprobe run (as
+        # ``format_duration``) so proxy validation needs no second process.
         cmd = rewrite_media_command(
             [
                 "ffprobe",
@@ -2850,7 +3312,7 @@ class AnimeLibraryService:
                 "-select_streams",
                 "v:0",
                 "-show_entries",
-                "stream=codec_name,pix_fmt",
+                "stream=codec_name,pix_fmt:format=duration",
                 "-of",
                 "json",
                 str(video_path),
@@ -2881,7 +3343,19 @@ class AnimeLibraryService:
         if not streams:
             return None
         stream = streams[0]
-        return stream if isinstance(stream, dict) else None
+        if not isinstance(stream, dict):
+            return None
+        format_payload = payload.get("format")
+        if isinstance(format_payload, dict) and "duration" in format_payload:
+            stream["format_duration"] = format_payload["duration"]
+        return stream
+
+    @classmethod
+    def _video_stream_duration_sync(cls, stream: dict, video_path: Path) -> float | None:
+        """Container duration for a probed stream, probing again only if it is missing."""
+        if "format_duration" not in stream:
+            return cls._probe_video_duration_sync(video_path)
+        return cls._parse_ffprobe_duration(stream.get("format_duration"))
 
     @staticmethod
     def _probe_video_duration_sync(video_path: Path) -> float | None:
@@ -2933,7 +3407,7 @@ class AnimeLibraryService:
             return False
         codec = str(stream.get("codec_name", "")).strip().lower()
         pix_fmt = str(stream.get("pix_fmt", "")).strip().lower()
-        duration = cls._probe_video_duration_sync(proxy_path)
+        duration = cls._video_stream_duration_sync(stream, proxy_path)
         return (
             codec == "h264"
             and pix_fmt in {"yuv420p", "yuvj420p"}
@@ -2958,47 +3432,12 @@ class AnimeLibraryService:
     ) -> list[str]:
         """Build a strict GPU-only ffmpeg command for H.264 MP4 output."""
         codec = (source_codec or "").strip().lower()
-        cmd = [
-            "ffmpeg",
-            "-y",
-            "-hwaccel",
-            cls.GPU_HWACCEL,
-            "-hwaccel_output_format",
-            cls.GPU_HWACCEL,
+        return [
+            *cls._GPU_H264_INPUT_ARGS.get(codec, cls._GPU_H264_HWACCEL_ARGS),
+            "-i",
+            str(source_path),
+            *cls._GPU_H264_OUTPUT_ARGS,
         ]
-        # Force hardware decoder when known so conversion stays GPU-only.
-        if codec == "av1":
-            cmd.extend(["-c:v", "av1_cuvid"])
-        elif codec == "h264":
-            cmd.extend(["-c:v", "h264_cuvid"])
-        elif codec == "hevc":
-            cmd.extend(["-c:v", "hevc_cuvid"])
-
-        cmd.extend(
-            [
-                "-i",
-                str(source_path),
-                "-map",
-                "0:v:0",
-                "-vf",
-                "scale_cuda=format=nv12",
-                "-c:v",
-                cls.GPU_H264_ENCODER,
-                "-preset",
-                "p5",
-                "-rc",
-                "constqp",
-                "-qp",
-                "23",
-                "-b:v",
-                "0",
-                "-profile:v",
-                "high",
-                "-movflags",
-                "+faststart",
-            ]
-        )
-        return cmd
 
     @classmethod
     def _build_cpu_h264_base_cmd(cls, source_path: Path) -> list[str]:
@@ -3032,13 +3471,10 @@ class AnimeLibraryService:
         if source_path.suffix.lower() != ".mp4":
             return False
 
-        codec = cls.get_primary_video_codec_sync(source_path)
-        if codec is None:
-            return False
-
         stream = cls._probe_video_stream_sync(source_path)
         if stream is None:
             return False
+        codec = str(stream.get("codec_name", "")).strip().lower()
         pix_fmt = str(stream.get("pix_fmt", "")).lower()
         return codec == "h264" and pix_fmt in {"yuv420p", "yuvj420p"}
 
@@ -3200,8 +3636,18 @@ class AnimeLibraryService:
                 with suppress(OSError):
                     proxy_path.unlink()
                 return None
+            cls._notify_preview_proxy_ready(proxy_path)
             return proxy_path
 
+    @classmethod
+    def _notify_preview_proxy_ready(cls, proxy_path: Path) -> None:
+        """Wake ``wait_for_preview_proxy`` callers; safe to call from any thread."""
+        with cls._preview_proxy_waiters_guard:
+            waiters = cls._preview_proxy_waiters.pop(str(proxy_path), [])
+        for waiter in waiters:
+            with suppress(RuntimeError):  # waiter's loop already closed
+                waiter.get_loop().call_soon_threadsafe(_set_future_result, waiter, proxy_path)
+
     @classmethod
     async def resolve_source_preview_path(
         cls,
@@ -3215,7 +3661,8 @@ class AnimeLibraryService:
         Falls back to original source when proxy generation fails.
         """
         if allow_generate:
-            resolved = await asyncio.to_thread(cls.ensure_preview_proxy_sync, source_path)
+            generation = await cls.trigger_preview_proxy_generation(source_path)
+            resolved = await asyncio.shield(generation)
             return resolved if resolved is not None else source_path
 
         compatible = await asyncio.to_thread(cls.is_browser_preview_compatible, source_path)
@@ -3236,23 +3683,38 @@ class AnimeLibraryService:
         return source_path
 
     @classmethod
-    async def trigger_preview_proxy_generation(cls, source_path: Path) -> None:
-        """Kick off proxy generation once per source path (non-blocking)."""
+    async def trigger_preview_proxy_generation(
+        cls,
+        source_path: Path,
+    ) -> asyncio.Future:
+        """Kick off proxy generation once per source path (non-blocking).
+
+        Returns the shared future for the generation, resolving to the same
+        value as ``ensure_preview_proxy_sync``. Later callers for the same
+        source get the in-flight future instead of starting another run; await
+        it through ``asyncio.shield`` so one caller's cancellation does not
+        cancel it for everyone.
+        """
         key = str(source_path.resolve())
-        lock = cls._get_preview_generation_lock()
-        async with lock:
-            if key in cls._preview_generation_inflight:
-                return
-            cls._preview_generation_inflight.add(key)
+        future = cls._preview_generation_futures.get(key)
+        if future is not None:
+            return future
+
+        future = asyncio.get_running_loop().create_future()
+        cls._preview_generation_futures[key] = future
 
         async def _run() -> None:
+            result: Path | None = None
             try:
-                await asyncio.to_thread(cls.ensure_preview_proxy_sync, source_path)
+                result = await asyncio.to_thread(cls.ensure_preview_proxy_sync, source_path)
+            except Exception as exc:
+                logger.warning("Preview proxy generation failed for %s: %s", source_path, exc)
             finally:
-                async with lock:
-                    cls._preview_generation_inflight.discard(key)
+                cls._preview_generation_futures.pop(key, None)
+                _set_future_result(future, result)
 
         asyncio.create_task(_run())
+        return future
 
     @classmethod
     async def wait_for_preview_proxy(
@@ -3260,22 +3722,70 @@ class AnimeLibraryService:
         source_path: Path,
         *,
         timeout_seconds: float = 1.5,
-        poll_interval_seconds: float = 0.15,
+        poll_interval_seconds: float = 0.5,
     ) -> Path | None:
-        """Wait briefly for a generated preview proxy to appear on disk."""
+        """Wait briefly for a generated preview proxy to appear on disk.
+
+        A generation started by ``trigger_preview_proxy_generation`` is awaited
+        directly. Other proxies generated in this process wake the waiter as soon as they are
+        committed. Otherwise the file is checked again every
+        ``poll_interval_seconds`` so proxies written by another process are
+        still seen.
+        """
+        inflight = cls._preview_generation_futures.get(str(source_path.resolve()))
+        if inflight is not None:
+            done, _ = await asyncio.wait({inflight}, timeout=max(timeout_seconds, 0.0))
+            if not done:
+                return None
+            result = inflight.result()
+            return result if result is not None and result != source_path else None
+
         proxy_path = await asyncio.to_thread(cls.get_preview_proxy_path, source_path)
         loop = asyncio.get_running_loop()
         deadline = loop.time() + max(timeout_seconds, 0.0)
+        key = str(proxy_path)
+        waiter: asyncio.Future = loop.create_future()
+        with cls._preview_proxy_waiters_guard:
+            cls._preview_proxy_waiters.setdefault(key, []).append(waiter)
 
-        while True:
-            exists = await asyncio.to_thread(
-                lambda: proxy_path.exists() and proxy_path.stat().st_size > 0
-            )
-            if exists:
-                return proxy_path
-            if loop.time() >= deadline:
-                return None
-            await asyncio.sleep(max(poll_interval_seconds, 0.05))
+        try:
+            while True:
+                exists = await asyncio.to_thread(
+                    lambda: proxy_path.exists() and proxy_path.stat().st_size > 0
+                )
+                if exists:
+                    return proxy_path
+                remaining = deadline - loop.time()
+                if remaining <= 0:
+                    return None
+                done, _ = await asyncio.wait(
+                    {waiter},
+                    timeout=min(remaining, max(poll_interval_seconds, 0.05)),
+                )
+                if done:
+                    return waiter.result()
+        finally:
+            with cls._preview_proxy_waiters_guard:
+                waiters = cls._preview_proxy_waiters.get(key)
+                if waiters is not None and waiter in waiters:
+                    waiters.remove(waiter)
+                    if not waiters:
+                        del cls._preview_proxy_waiters[key]
+
+    @classmethod
+    def _indexed_anime_version_sync(cls, library_path: Path) -> tuple[int, int] | None:
+        """Return the (library dir, index manifest) mtimes the series list depends on."""
+        try:
+            library_mtime = library_path.stat().st_mtime_ns
+        except OSError:
+            return None
+        try:
+            manifest_mtime = (
+                library_path / cls.INDEX_DIR_NAME / cls.MANIFEST_FILE
+            ).stat().st_mtime_ns
+        except OSError:
+            manifest_mtime = -1
+        return library_mtime, manifest_mtime
 
     @classmethod
     async def list_indexed_anime(
@@ -3286,11 +3796,93 @@ class AnimeLibraryService:
         """
         List all indexed anime in the library.
 
+        The CLI result is memoized per library type until the library folder or
+        its index manifest changes; concurrent callers share one CLI run.
+
         Returns:
             Sorted list of anime series names.
         """
         scoped_type = coerce_library_type(library_type)
         library_path = cls.get_library_path(scoped_type)
+        key = scoped_type.value
+
+        lock = cls._indexed_anime_locks.get(key)
+        if lock is None:
+            lock = asyncio.Lock()
+            cls._indexed_anime_locks[key] = lock
+        async with lock:
+            version = await asyncio.to_thread(cls._indexed_anime_version_sync, library_path)
+            cached = cls._indexed_anime_cache.get(key)
+            if version is not None and cached is not None and cached[0] == version:
+                return list(cached[1])
+
+            names = await cls._list_indexed_anime_uncached(scoped_type)
+            if version is None:
+                cls._indexed_anime_cache.pop(key, None)
+            else:
+                cls._indexed_anime_cache[key] = (version, names)
+            return list(names)
+
+    @classmethod
+    def _list_indexed_anime_inprocess_sync(cls, library_path: Path) -> list[str] | None:
+        """List series through anime_searcher's IndexManager, or None if unavailable."""
+        if cls._searcher_inprocess_unavailable:
+            return None
+        searcher_root = str(cls.get_anime_searcher_path())
+        if searcher_root not in sys.path:
+            sys.path.insert(0, searcher_root)
+        try:
+            from anime_searcher.indexer.index_manager import IndexManager
+        except Exception as exc:
+            logger.debug("anime_searcher is not importable in-process: %s", exc)
+            cls._searcher_inprocess_unavailable = True
+            return None
+
+        # Mirror the CLI, which reports a missing index as empty; loading here
+        # would create one.
+        if not (library_path / cls.INDEX_DIR_NAME / cls.MANIFEST_FILE).exists():
+            return []
+        try:
+            index_manager = IndexManager(library_path)
+            index_manager.load_or_create()
+            return sorted(index_manager.get_series_list())
+        except Exception as exc:
+            logger.debug("In-process series listing failed for %s: %s", library_path, exc)
+            return None
+
+    @classmethod
+    def _list_indexed_anime_from_manifest_sync(cls, library_path: Path) -> list[str] | None:
+        """Read series names from the index manifest, or None if it is not usable."""
+        try:
+            payload = cls._load_json_cached(library_path / cls.INDEX_DIR_NAME / cls.MANIFEST_FILE)
+        except (OSError, json.JSONDecodeError):
+            return None
+        if not isinstance(payload, dict):
+            return None
+        if payload.get("version") != cls.SEARCHER_INDEX_FORMAT_VERSION:
+            return None
+        series_map = payload.get("series")
+        if not isinstance(series_map, dict):
+            return None
+        return sorted(series_map)
+
+    @classmethod
+    async def _list_indexed_anime_uncached(cls, scoped_type: LibraryType) -> list[str]:
+        names = await asyncio.to_thread(
+            cls._list_indexed_anime_from_manifest_sync,
+            cls.get_library_path(scoped_type),
+        )
+        if names is not None:
+            return names
+
+        if settings.anime_searcher_inprocess:
+            names = await asyncio.to_thread(
+                cls._list_indexed_anime_inprocess_sync,
+                cls.get_library_path(scoped_type),
+            )
+            if names is not None:
+                return names
+
         searcher_path = cls.get_anime_searcher_path()
 
         # Call anime_searcher directly via pixi to avoid task-shell quoting issues.
@@ -3316,7 +3908,7 @@ class AnimeLibraryService:
             raise RuntimeError(f"Failed to list anime: {result.stderr.decode()}")
 
         try:
-            payload = json.loads(result.stdout.decode())
+            payload = orjson.loads(result.stdout)
             series = payload.get("series", [])
             # CLI returns objects with {name, frames}, extract just names
             if series and isinstance(series[0], dict):
@@ -3336,15 +3928,16 @@ class AnimeLibraryService:
         Returns:
             List of folder names.
         """
-        if not source_path.exists() or not source_path.is_dir():
-            return []
-
         def _scan_folders() -> list[str]:
-            folders = []
-            for item in source_path.iterdir():
-                if item.is_dir() and not item.name.startswith("."):
-                    folders.append(item.name)
-            return sorted(folders)
+            try:
+                with os.scandir(source_path) as entries:
+                    return sorted(
+                        entry.name
+                        for entry in entries
+                        if not entry.name.startswith(".") and entry.is_dir()
+                    )
+            except OSError:
+                return []
 
         return await asyncio.to_thread(_scan_folders)
 
@@ -3403,40 +3996,48 @@ class AnimeLibraryService:
             manifest_path.unlink()
 
     @classmethod
-    def _source_matches_prepared_sync(cls, source_path: Path, prepared_path: Path) -> bool:
+    def _source_matches_prepared_sync(
+        cls,
+        source_path: Path,
+        prepared_path: Path,
+        source_probe: SourceMediaProbe | None = None,
+    ) -> bool:
         if not prepared_path.exists():
             return False
 
-        prepared_probe = cls._probe_media_sync(prepared_path)
-        if not cls._is_valid_prepared_library_probe(prepared_probe):
-            return False
-
         try:
-            if source_path.resolve() == prepared_path.resolve():
-                return True
+            same_file = source_path.resolve() == prepared_path.resolve()
         except OSError:
             return False
 
-        payload = cls._load_source_import_manifest_sync(prepared_path)
-        if payload is None:
-            return False
+        # Check the import manifest against the source's stat before paying
+        # for an ffprobe of the prepared file.
+        if not same_file:
+            payload = cls._load_source_import_manifest_sync(prepared_path)
+            if payload is None:
+                return False
+            try:
+                source_stat = source_path.stat()
+            except OSError:
+                return False
+            if not (
+                payload.get("source_path") == str(source_path.resolve())
+                and int(payload.get("source_size", -1)) == source_stat.st_size
+                and int(payload.get("source_mtime_ns", -1)) == source_stat.st_mtime_ns
+            ):
+                return False
 
-        try:
-            source_stat = source_path.stat()
-        except OSError:
+        prepared_probe = cls._probe_media_sync(prepared_path)
+        if not cls._is_valid_prepared_library_probe(prepared_probe):
             return False
+        if same_file:
+            return True
 
-        source_probe = cls._probe_media_sync(source_path)
+        if source_probe is None:
+            source_probe = cls._probe_media_sync(source_path)
         if source_probe is None:
             return False
-        if not cls._is_valid_prepared_library_probe(prepared_probe, reference_probe=source_probe):
-            return False
-
-        return (
-            payload.get("source_path") == str(source_path.resolve())
-            and int(payload.get("source_size", -1)) == source_stat.st_size
-            and int(payload.get("source_mtime_ns", -1)) == source_stat.st_mtime_ns
-        )
+        return cls._is_valid_prepared_library_probe(prepared_probe, reference_probe=source_probe)
 
     @classmethod
     async def _prepare_single_source_for_library(
@@ -3444,8 +4045,19 @@ class AnimeLibraryService:
         *,
         source_path: Path,
         dest_dir: Path,
+        source_probe: SourceMediaProbe | None = None,
+        slots: dict[str, asyncio.Semaphore] | None = None,
     ) -> tuple[Path, str, bool]:
-        source_codec = await asyncio.to_thread(cls.get_primary_video_codec_sync, source_path)
+        def _slot(kind: str) -> AbstractAsyncContextManager:
+            return slots[kind] if slots is not None else nullcontext()
+
+        if source_probe is not None:
+            source_codec = source_probe.video_codec
+        else:
+            source_codec = await asyncio.to_thread(
+                cls.get_primary_video_codec_sync,
+                source_path,
+            )
         codec_lower = (source_codec or "").strip().lower()
         is_premiere_native = cls._is_premiere_native_codec(codec_lower)
         source_suffix = source_path.suffix.lower()
@@ -3472,18 +4084,19 @@ class AnimeLibraryService:
             cls._source_matches_prepared_sync,
             source_path,
             preferred_dest,
+            source_probe,
         )
         if existing_ready:
             return preferred_dest, "Using existing", False
 
         # Probe source once up front so unreadable inputs never get copied into
         # the library via fallback paths.
-        source_probe: SourceMediaProbe | None = None
-        try:
-            source_probe = await asyncio.to_thread(cls._probe_media_sync, source_path)
-        except Exception as exc:
-            logger.debug("Could not probe %s for subtitles: %s", source_path.name, exc)
-            source_probe = None
+        if source_probe is None:
+            try:
+                source_probe = await asyncio.to_thread(cls._probe_media_sync, source_path)
+            except Exception as exc:
+                logger.debug("Could not probe %s for subtitles: %s", source_path.name, exc)
+                source_probe = None
         if source_probe is None or source_probe.duration is None:
             raise RuntimeError(f"Source file is unreadable: {source_path.name}")
 
@@ -3510,12 +4123,13 @@ class AnimeLibraryService:
 
         async def _commit_transcoded_tmp_dest() -> None:
             try:
-                await cls._run_library_import_h264_transcode(
-                    source_path,
-                    tmp_dest,
-                    source_codec=source_codec,
-                    probe=source_probe,
-                )
+                async with _slot("transcode"):
+                    await cls._run_library_import_h264_transcode(
+                        source_path,
+                        tmp_dest,
+                        source_codec=source_codec,
+                        probe=source_probe,
+                    )
             except Exception:
                 await _cleanup_tmp_dest()
                 raise
@@ -3531,100 +4145,126 @@ class AnimeLibraryService:
                 )
             await asyncio.to_thread(tmp_dest.replace, preferred_dest)
 
-        if needs_direct_h264_transcode:
-            if tmp_dest.exists():
-                await _cleanup_tmp_dest()
-            await _commit_transcoded_tmp_dest()
-        elif not is_mp4:
-            # --- Remux native video to MP4, then fall back to full H.264 MP4 transcode ---
-            if tmp_dest.exists():
-                await _cleanup_tmp_dest()
-            remux_error: str | None = None
-            try:
-                remux_cmd = (
-                    cls._build_library_import_audio_normalize_cmd(
-                        source_path,
-                        tmp_dest,
-                        probe=source_probe,
-                    )
-                    if needs_audio_normalize
-                    else cls._build_library_import_remux_cmd(
-                        source_path,
-                        tmp_dest,
-                        probe=source_probe,
-                    )
-                )
-                remux_result = await run_command(
-                    remux_cmd,
-                    timeout_seconds=cls.REMUX_TIMEOUT_SECONDS,
-                )
-            except FileNotFoundError as exc:
-                if is_media_binary_override_error(exc):
-                    raise
-                remux_error = cls._format_media_failure(exc)
-            except CommandTimeoutError as exc:
-                remux_error = cls._format_media_failure(exc)
-            else:
-                remux_probe = None
-                if remux_result.returncode == 0:
-                    remux_probe = await asyncio.to_thread(cls._probe_media_sync, tmp_dest)
-                if cls._is_valid_prepared_library_probe(remux_probe, reference_probe=source_probe):
-                    await asyncio.to_thread(tmp_dest.replace, preferred_dest)
-                else:
-                    remux_error = cls._format_media_failure(remux_result)
-                    if remux_result.returncode == 0:
-                        remux_error = f"Prepared MP4 output failed validation for {source_path.name}"
-
-            if remux_error is not None:
-                await _cleanup_tmp_dest()
-                action = transcode_action
-                try:
-                    await _commit_transcoded_tmp_dest()
-                except RuntimeError as exc:
-                    raise RuntimeError(
-                        f"Failed to prepare source as MP4 (remux: {remux_error}; {exc})"
-                    ) from exc
-        elif preferred_dest != source_path:
-            if needs_audio_normalize:
+        try:
+            if needs_direct_h264_transcode:
+                if tmp_dest.exists():
+                    await _cleanup_tmp_dest()
+                await _commit_transcoded_tmp_dest()
+            elif not is_mp4:
+                # --- Remux native video to MP4, then fall back to full H.264 MP4 transcode ---
                 if tmp_dest.exists():
                     await _cleanup_tmp_dest()
-                normalize_error: str | None = None
+                remux_error: str | None = None
                 try:
-                    normalize_result = await run_command(
+                    remux_cmd = (
                         cls._build_library_import_audio_normalize_cmd(
                             source_path,
                             tmp_dest,
                             probe=source_probe,
-                        ),
-                        timeout_seconds=cls.REMUX_TIMEOUT_SECONDS,
+                        )
+                        if needs_audio_normalize
+                        else cls._build_library_import_remux_cmd(
+                            source_path,
+                            tmp_dest,
+                            probe=source_probe,
+                        )
                     )
+                    async with _slot("remux"):
+                        remux_result = await run_command(
+                            remux_cmd,
+                            timeout_seconds=cls.REMUX_TIMEOUT_SECONDS,
+                        )
                 except FileNotFoundError as exc:
                     if is_media_binary_override_error(exc):
                         raise
-                    normalize_error = cls._format_media_failure(exc)
+                    remux_error = cls._format_media_failure(exc)
                 except CommandTimeoutError as exc:
-                    normalize_error = cls._format_media_failure(exc)
+                    remux_error = cls._format_media_failure(exc)
                 else:
-                    if normalize_result.returncode != 0:
-                        normalize_error = cls._format_media_failure(normalize_result)
+                    remux_probe = None
+                    if remux_result.returncode == 0:
+                        remux_probe = await asyncio.to_thread(cls._probe_media_sync, tmp_dest)
+                    if cls._is_valid_prepared_library_probe(remux_probe, reference_probe=source_probe):
+                        await asyncio.to_thread(tmp_dest.replace, preferred_dest)
                     else:
-                        norm_probe = await asyncio.to_thread(cls._probe_media_sync, tmp_dest)
-                        if cls._is_valid_prepared_library_probe(
-                            norm_probe, reference_probe=source_probe
-                        ):
-                            await asyncio.to_thread(tmp_dest.replace, preferred_dest)
-                        else:
-                            normalize_error = (
-                                f"Audio-normalized output failed validation: {source_path.name}"
-                            )
+                        remux_error = cls._format_media_failure(remux_result)
+                        if remux_result.returncode == 0:
+                            remux_error = f"Prepared MP4 output failed validation for {source_path.name}"
 
-                if normalize_error is not None:
+                if remux_error is not None:
                     await _cleanup_tmp_dest()
-                    raise RuntimeError(
-                        f"Failed to normalize audio for {source_path.name}: {normalize_error}"
-                    )
-            else:
-                await asyncio.to_thread(shutil.copy2, source_path, preferred_dest)
+                    action = transcode_action
+                    try:
+                        await _commit_transcoded_tmp_dest()
+                    except RuntimeError as exc:
+                        raise RuntimeError(
+                            f"Failed to prepare source as MP4 (remux: {remux_error}; {exc})"
+                        ) from exc
+            elif preferred_dest != source_path:
+                if needs_audio_normalize:
+                    if tmp_dest.exists():
+                        await _cleanup_tmp_dest()
+                    normalize_error: str | None = None
+                    try:
+                        async with _slot("remux"):
+                            normalize_result = await run_command(
+                                cls._build_library_import_audio_normalize_cmd(
+                                    source_path,
+                                    tmp_dest,
+                                    probe=source_probe,
+                                ),
+                                timeout_seconds=cls.REMUX_TIMEOUT_SECONDS,
+                            )
+                    except FileNotFoundError as exc:
+                        if is_media_binary_override_error(exc):
+                            raise
+                        normalize_error = cls._format_media_failure(exc)
+                    except CommandTimeoutError as exc:
+                        normalize_error = cls._format_media_failure(exc)
+                    else:
+                        if normalize_result.returncode != 0:
+                            normalize_error = cls._format_media_failure(normalize_result)
+                        else:
+                            norm_probe = await asyncio.to_thread(cls._probe_media_sync, tmp_dest)
+                            if cls._is_valid_prepared_library_probe(
+                                norm_probe, reference_probe=source_probe
+                            ):
+                                await asyncio.to_thread(tmp_dest.replace, preferred_dest)
+                            else:
+                                normalize_error = (
+                                    f"Audio-normalized output failed validation: {source_path.name}"
+                                )
+
+                    if normalize_error is not None:
+                        await _cleanup_tmp_dest()
+                        raise RuntimeError(
+                            f"Failed to normalize audio for {source_path.name}: {normalize_error}"
+                        )
+                else:
+                    # Copy next to the destination and rename into place so an
+                    # interrupted import never leaves a truncated episode behind.
+                    if tmp_dest.exists():
+                        await _cleanup_tmp_dest()
+                    async with _slot("copy"):
+                        copy_job = asyncio.ensure_future(
+                            asyncio.to_thread(cls._link_or_copy_sync, source_path, tmp_dest)
+                        )
+                        try:
+                            linked = await asyncio.shield(copy_job)
+                        except asyncio.CancelledError:
+                            # The copy thread cannot be interrupted; let it finish
+                            # before the partial file is removed below.
+                            await asyncio.wait([copy_job])
+                            raise
+                    await asyncio.to_thread(tmp_dest.replace, preferred_dest)
+                    if linked:
+                        action = "Linking"
+        except BaseException:
+            # Also covers cancellation, which skips the ``except Exception``
+            # cleanups above; unlink synchronously so it cannot be cancelled.
+            with suppress(OSError):
+                tmp_dest.unlink(missing_ok=True)
+            raise
 
         # Extract subtitles to sidecar.  Always attempt extraction regardless
         # of transform type — remux/transcode strip subtitle streams and even
@@ -3661,6 +4301,241 @@ class AnimeLibraryService:
 
         return actual_dest, action, True
 
+    @classmethod
+    def _link_or_copy_sync(cls, source_path: Path, dest_path: Path) -> bool:
+        """Hard-link or reflink ``source_path`` into the library, else copy it.
+
+        A hard link is only attempted on the same device and when
+        ``anime_library_hardlink`` is enabled; a reflink clone is tried next.
+        Any failure (cross-device, existing destination, filesystem without
+        link support) falls back to ``_fast_copy``. Returns True when the
+        bytes were linked rather than copied.
+        """
+        if settings.anime_library_hardlink:
+            try:
+                same_device = source_path.stat().st_dev == dest_path.parent.stat().st_dev
+            except OSError:
+                same_device = False
+            if same_device:
+                try:
+                    os.link(source_path, dest_path)
+                    return True
+                except OSError as exc:
+                    logger.debug("Hard link failed for %s, copying instead: %s", source_path, exc)
+        if cls._reflink_sync(source_path, dest_path):
+            return True
+        cls._fast_copy(source_path, dest_path)
+        return False
+
+    @staticmethod
+    def _reflink_sync(src: Path, dst: Path) -> bool:
+        """Clone ``src`` into ``dst`` with FICLONE; False if unsupported."""
+        if fcntl is None:
+            return False
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                fcntl.ioctl(dst_fd, _FICLONE, src_fd)
+            except OSError:
+                return False
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        shutil.copystat(src, dst)
+        return True
+
+    @classmethod
+    def _fast_copy_buffer(cls) -> memoryview:
+        """Return this thread's reusable copy buffer.
+
+        Imports copy several files at once from worker threads, so each thread
+        keeps its own buffer rather than sharing one.
+        """
+        view = getattr(cls._fast_copy_buffers, "view", None)
+        if view is None or len(view) != cls.FAST_COPY_BUFSIZE:
+            view = memoryview(bytearray(cls.FAST_COPY_BUFSIZE))
+            cls._fast_copy_buffers.view = view
+        return view
+
+    @staticmethod
+    def _fadvise(fd: int, advice_name: str) -> None:
+        """Apply a whole-file ``posix_fadvise`` hint where the platform has it."""
+        advice = getattr(os, advice_name, None)
+        if advice is None or not hasattr(os, "posix_fadvise"):
+            return
+        with suppress(OSError):
+            os.posix_fadvise(fd, 0, 0, advice)
+
+    @classmethod
+    def _fast_copy(cls, src: Path, dst: Path) -> None:
+        """Copy ``src`` to ``dst`` with in-kernel copies and keep its metadata.
+
+        ``copy_file_range`` lets the kernel share extents (btrfs/XFS) or do a
+        server-side copy (NFS). Where it is refused (e.g. across filesystems
+        on older kernels) ``sendfile`` still avoids userspace copies; the last
+        resort is a userspace loop with a 1 MiB buffer. Every stage advances
+        the file offsets, so each one resumes where the previous stopped.
+        """
+        src_fd = os.open(src, os.O_RDONLY)
+        try:
+            dst_fd = os.open(dst, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+            try:
+                cls._fadvise(src_fd, "POSIX_FADV_SEQUENTIAL")
+                remaining = os.fstat(src_fd).st_size
+                if remaining and hasattr(os, "copy_file_range"):
+                    remaining = cls._run_kernel_copy(
+                        lambda count: os.copy_file_range(src_fd, dst_fd, count),
+                        remaining,
+                        remaining,
+                    )
+                if remaining and hasattr(os, "sendfile"):
+                    remaining = cls._run_kernel_copy(
+                        lambda count: os.sendfile(dst_fd, src_fd, None, count),
+                        remaining,
+                        cls.FAST_COPY_SENDFILE_CHUNK,
+                    )
+                if remaining:
+                    view = cls._fast_copy_buffer()
+                    with open(src_fd, "rb", buffering=0, closefd=False) as reader:
+                        while True:
+                            read = reader.readinto(view)
+                            if not read:
+                                break
+                            written = 0
+                            while written < read:
+                                written += os.write(dst_fd, view[written:read])
+                # The source is read once; keep it (and the clean part of the
+                # copy) from pushing hotter pages out of the cache.
+                cls._fadvise(src_fd, "POSIX_FADV_DONTNEED")
+                cls._fadvise(dst_fd, "POSIX_FADV_DONTNEED")
+            finally:
+                os.close(dst_fd)
+        finally:
+            os.close(src_fd)
+        shutil.copystat(src, dst)
+
+    @staticmethod
+    def _run_kernel_copy(
+        copy_chunk: Callable[[int], int],
+        remaining: int,
+        chunk_size: int,
+    ) -> int:
+        """Call ``copy_chunk`` until ``remaining`` bytes are copied.
+
+        Returns the bytes still left when the primitive is refused or stops
+        early, so the caller can continue with a slower method.
+        """
+        while remaining > 0:
+            try:
+                sent = copy_chunk(min(remaining, chunk_size))
+            except OSError as exc:
+                if exc.errno not in _KERNEL_COPY_FALLBACK_ERRNOS:
+                    raise
+                return remaining
+            if sent == 0:
+                return remaining
+            remaining -= sent
+        return 0
+
+    @classmethod
+    async def _prepare_sources_for_library(
+        cls,
+        *,
+        video_files: list[Path],
+        dest_dir: Path,
+        probes: dict[Path, SourceMediaProbe],
+        anime_name: str,
+        prepared_files: list[Path],
+    ) -> AsyncIterator[IndexProgress]:
+        """Prepare import sources concurrently, yielding per-file progress.
+
+        Copies, remuxes and transcodes each get their own concurrency limit.
+        Sources whose names normalize to the same library stem go through one
+        worker in order so destination names are still allocated one at a
+        time. ``prepared_files`` is filled in source order.
+        """
+        total_files = len(video_files)
+        slots = {
+            "copy": asyncio.Semaphore(cls.LIBRARY_IMPORT_COPY_PARALLEL),
+            "remux": asyncio.Semaphore(cls.LIBRARY_IMPORT_REMUX_PARALLEL),
+            "transcode": asyncio.Semaphore(cls.LIBRARY_IMPORT_TRANSCODE_PARALLEL),
+        }
+        groups: dict[str, list[tuple[int, Path]]] = {}
+        for index, video_file in enumerate(video_files):
+            stem_key = cls.normalize_indexed_episode_stem(video_file.stem).lower()
+            groups.setdefault(stem_key, []).append((index, video_file))
+        pending_groups = deque(groups.values())
+        results: list[Path | None] = [None] * total_files
+        events: asyncio.Queue[tuple[str, Any, Any]] = asyncio.Queue()
+
+        async def _worker() -> None:
+            try:
+                while pending_groups:
+                    for index, video_file in pending_groups.popleft():
+                        events.put_nowait(("start", video_file, None))
+                        actual_dest, action, _changed = (
+                            await cls._prepare_single_source_for_library(
+                                source_path=video_file,
+                                dest_dir=dest_dir,
+                                source_probe=probes.get(video_file),
+                                slots=slots,
+                            )
+                        )
+                        results[index] = actual_dest
+                        events.put_nowait(("done", video_file, action))
+            except Exception as exc:
+                events.put_nowait(("error", None, exc))
+            finally:
+                events.put_nowait(("exit", None, None))
+
+        worker_count = min(
+            len(groups),
+            cls.LIBRARY_IMPORT_COPY_PARALLEL
+            + cls.LIBRARY_IMPORT_REMUX_PARALLEL
+            + cls.LIBRARY_IMPORT_TRANSCODE_PARALLEL,
+        )
+        workers = [asyncio.create_task(_worker()) for _ in range(worker_count)]
+        completed = 0
+        running = worker_count
+        try:
+            while running:
+                kind, video_file, detail = await events.get()
+                if kind == "exit":
+                    running -= 1
+                elif kind == "error":
+                    raise detail
+                elif kind == "start":
+                    yield IndexProgress(
+                        status="copying",
+                        message=f"Preparing {video_file.name}",
+                        progress=(completed + 0.5) / total_files * 0.3,
+                        current_file=video_file.name,
+                        total_files=total_files,
+                        completed_files=completed,
+                        anime_name=anime_name,
+                    )
+                else:
+                    completed += 1
+                    yield IndexProgress(
+                        status="copying",
+                        message=f"{detail} {video_file.name}",
+                        progress=completed / total_files * 0.3,
+                        current_file=video_file.name,
+                        total_files=total_files,
+                        completed_files=completed,
+                        anime_name=anime_name,
+                    )
+        finally:
+            for worker in workers:
+                worker.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+
+        for actual_dest in results:
+            if actual_dest is not None and actual_dest not in prepared_files:
+                prepared_files.append(actual_dest)
+
     @classmethod
     async def _verify_prepared_library_files(cls, prepared_files: list[Path]) -> str | None:
         await asyncio.sleep(1.0)
@@ -3725,7 +4600,7 @@ class AnimeLibraryService:
             start_new_session=True,
         )
 
-        stdout_tail: deque[str] = deque(maxlen=5)
+        stdout_tail: deque[bytes] = deque(maxlen=5)
         stdout_line_count = 0
         stderr_chunks: deque[str] = deque()
         stderr_bytes = 0
@@ -3752,6 +4627,12 @@ class AnimeLibraryService:
         deadline = loop.time() + cls.INDEX_TIMEOUT_SECONDS
         aborted = False
         saw_explicit_error = False
+        # Fast indexers print far more lines than a UI can show. Within one
+        # step (same file and completed count) keep only the latest update per
+        # interval and flush it before the stream ends.
+        pending_progress: IndexProgress | None = None
+        last_emit_at = float("-inf")
+        last_emit_key: tuple | None = None
 
         try:
             assert process.stdout is not None
@@ -3763,11 +4644,10 @@ class AnimeLibraryService:
                 line = await asyncio.wait_for(process.stdout.readline(), timeout=remaining)
                 if not line:
                     break
-                decoded = line.decode()
                 stdout_line_count += 1
-                stdout_tail.append(decoded)
+                stdout_tail.append(line)
                 progress = cls._parse_searcher_progress_line(
-                    line=decoded,
+                    line=line,
                     status=status,
                     total_files=total_files,
                     progress_start=progress_start,
@@ -3782,8 +4662,28 @@ class AnimeLibraryService:
                     await terminate_process(process, kill_group=True)
                     yield progress
                     return
+                now = loop.time()
+                emit_key = (
+                    progress.status,
+                    progress.completed_files,
+                    progress.current_file,
+                    progress.effective_decode_backend,
+                )
+                if (
+                    emit_key == last_emit_key
+                    and now - last_emit_at < cls.SEARCHER_PROGRESS_MIN_INTERVAL_SECONDS
+                ):
+                    pending_progress = progress
+                    continue
+                pending_progress = None
+                last_emit_at = now
+                last_emit_key = emit_key
                 yield progress
 
+            if pending_progress is not None:
+                yield pending_progress
+                pending_progress = None
+
             remaining = deadline - loop.time()
             if remaining <= 0:
                 raise asyncio.TimeoutError
@@ -3809,7 +4709,7 @@ class AnimeLibraryService:
 
         stderr = await stderr_task
         if process.returncode != 0 and not saw_explicit_error:
-            stdout_text = "".join(stdout_tail).strip()
+            stdout_text = b"".join(stdout_tail).decode("utf-8", errors="replace").strip()
             detail = stderr or stdout_text or "unknown error"
             yield IndexProgress(
                 status="error",
@@ -3865,7 +4765,7 @@ class AnimeLibraryService:
         library_path = cls.get_library_path(scoped_type)
         searcher_path = cls.get_anime_searcher_path()
 
-        library_path.mkdir(parents=True, exist_ok=True)
+        await asyncio.to_thread(library_path.mkdir, parents=True, exist_ok=True)
 
         if anime_name is None:
             anime_name = source_folder.name
@@ -3889,7 +4789,7 @@ class AnimeLibraryService:
             anime_name=anime_name,
         )
 
-        if not source_folder.exists():
+        if not await asyncio.to_thread(source_folder.exists):
             yield IndexProgress(
                 status="error",
                 error=f"Source folder not found: {source_folder}",
@@ -3947,7 +4847,7 @@ class AnimeLibraryService:
                 total_files=total_files,
                 anime_name=anime_name,
             )
-            dest_path.mkdir(parents=True, exist_ok=True)
+            await asyncio.to_thread(dest_path.mkdir, parents=True, exist_ok=True)
         else:
             yield IndexProgress(
                 status="copying",
@@ -3956,33 +4856,14 @@ class AnimeLibraryService:
                 anime_name=anime_name,
             )
 
-        for i, video_file in enumerate(video_files):
-            yield IndexProgress(
-                status="copying",
-                message=f"Preparing {video_file.name}",
-                progress=(i + 0.5) / total_files * 0.3,
-                current_file=video_file.name,
-                total_files=total_files,
-                completed_files=i,
-                anime_name=anime_name,
-            )
-
-            actual_dest, action, _changed = await cls._prepare_single_source_for_library(
-                source_path=video_file,
-                dest_dir=dest_path,
-            )
-            if actual_dest not in prepared_files:
-                prepared_files.append(actual_dest)
-
-            yield IndexProgress(
-                status="copying",
-                message=f"{action} {video_file.name}",
-                progress=(i + 1) / total_files * 0.3,
-                current_file=video_file.name,
-                total_files=total_files,
-                completed_files=i + 1,
-                anime_name=anime_name,
-            )
+        async for progress in cls._prepare_sources_for_library(
+            video_files=video_files,
+            dest_dir=dest_path,
+            probes=source_scan.probes,
+            anime_name=anime_name,
+            prepared_files=prepared_files,
+        ):
+            yield progress
 
         yield IndexProgress(
             status="copying",
@@ -4060,7 +4941,7 @@ class AnimeLibraryService:
             if progress.status == "error":
                 return
 
-        await cls.ensure_episode_manifest(force_refresh=True, library_type=scoped_type)
+        await cls.refresh_series(anime_name, scoped_type)
         completion_warnings = list(skipped_warnings)
         if searcher_metadata.retry_warning and searcher_metadata.retry_warning not in completion_warnings:
             completion_warnings.append(searcher_metadata.retry_warning)
@@ -4204,33 +5085,14 @@ class AnimeLibraryService:
             anime_name=anime_name,
         )
 
-        for i, video_file in enumerate(video_files):
-            yield IndexProgress(
-                status="copying",
-                message=f"Preparing {video_file.name}",
-                progress=(i + 0.5) / total_files * 0.3,
-                current_file=video_file.name,
-                total_files=total_files,
-                completed_files=i,
-                anime_name=anime_name,
-            )
-
-            actual_dest, action, _changed = await cls._prepare_single_source_for_library(
-                source_path=video_file,
-                dest_dir=dest_dir,
-            )
-            if actual_dest not in prepared_files:
-                prepared_files.append(actual_dest)
-
-            yield IndexProgress(
-                status="copying",
-                message=f"{action} {video_file.name}",
-                progress=(i + 1) / total_files * 0.3,
-                current_file=video_file.name,
-                total_files=total_files,
-                completed_files=i + 1,
-                anime_name=anime_name,
-            )
+        async for progress in cls._prepare_sources_for_library(
+            video_files=video_files,
+            dest_dir=dest_dir,
+            probes=source_scan.probes,
+            anime_name=anime_name,
+            prepared_files=prepared_files,
+        ):
+            yield progress
 
         yield IndexProgress(
             status="copying",
@@ -4301,7 +5163,7 @@ class AnimeLibraryService:
             with suppress(OSError):
                 manifest_path.unlink()
 
-        await cls.ensure_episode_manifest(force_refresh=True, library_type=scoped_type)
+        await cls.refresh_series(anime_name, scoped_type)
         completion_warnings = list(skipped_warnings)
         if searcher_metadata.retry_warning and searcher_metadata.retry_warning not in completion_warnings:
             completion_warnings.append(searcher_metadata.retry_warning)
@@ -4427,7 +5289,7 @@ class AnimeLibraryService:
                 anime_name=anime_name,
             )
 
-        await cls.ensure_episode_manifest(force_refresh=True, library_type=scoped_type)
+        await cls.refresh_series(anime_name, scoped_type)
         yield IndexProgress(
             status="complete",
             message=f"Successfully removed {len(removed_paths)} file(s) from {anime_name}",
@@ -4492,7 +5354,7 @@ class AnimeLibraryService:
             raise RuntimeError(f"Search failed: {result.stderr.decode()}")
 
         try:
-            payload = json.loads(result.stdout.decode())
+            payload = orjson.loads(result.stdout)
             return payload.get("results", [])
         except json.JSONDecodeError:
             return []
@@ -4515,7 +5377,7 @@ class AnimeLibraryService:
         manifest_series: dict = {}
         manifest_default_fps: float | None = None
         try:
-            manifest_payload = json.loads(manifest_path.read_text(encoding="utf-8"))
+            manifest_payload = cls._load_json_cached(manifest_path)
             if isinstance(manifest_payload, dict):
                 raw_series = manifest_payload.get("series", {})
                 if isinstance(raw_series, dict):
@@ -4530,7 +5392,7 @@ class AnimeLibraryService:
         state_path = index_dir / cls.STATE_FILE
         state_files: dict = {}
         try:
-            state_payload = json.loads(state_path.read_text(encoding="utf-8"))
+            state_payload = cls._load_json_cached(state_path)
             if isinstance(state_payload, dict):
                 files = state_payload.get("files", {})
                 if isinstance(files, dict):
@@ -4557,11 +5419,7 @@ class AnimeLibraryService:
                 video_files_on_disk = [
                     f
                     for f in series_dir.iterdir()
-                    if (
-                        f.is_file()
-                        and f.suffix.lower() in cls.VIDEO_EXTENSIONS
-                        and not cls.is_transient_library_video_path(f)
-                    )
+                    if cls._is_library_video_name(f.name) and f.is_file()
                 ]
             except OSError:
                 pass
@@ -4672,10 +5530,15 @@ class AnimeLibraryService:
                 if metadata and metadata.purge_protection:
                     skipped_protected.append(source_dir.name)
                     continue
-                for f in source_dir.iterdir():
-                    if f.is_file() and f.suffix.lower() in cls.VIDEO_EXTENSIONS:
-                        freed_bytes += f.stat().st_size
-                        f.unlink()
+                with os.scandir(source_dir) as entries:
+                    for entry in entries:
+                        if entry.name.lower().endswith(cls.VIDEO_SUFFIXES) and entry.is_file():
+                            stat = entry.stat()
+                            # Hard-linked imports share blocks with the user's
+                            # source file, so unlinking them frees nothing.
+                            if stat.st_nlink <= 1:
+                                freed_bytes += stat.st_size
+                            os.unlink(entry.path)
                 purged_sources.append(source_dir.name)
 
         # Clear caches
@@ -4728,10 +5591,13 @@ class AnimeLibraryService:
                 if metadata and metadata.purge_protection:
                     continue
                 has_videos = False
-                for f in source_dir.iterdir():
-                    if f.is_file() and f.suffix.lower() in cls.VIDEO_EXTENSIONS:
-                        total_bytes += f.stat().st_size
-                        has_videos = True
+                with os.scandir(source_dir) as entries:
+                    for entry in entries:
+                        if entry.name.lower().endswith(cls.VIDEO_SUFFIXES) and entry.is_file():
+                            stat = entry.stat()
+                            if stat.st_nlink <= 1:
+                                total_bytes += stat.st_size
+                            has_videos = True
                 if has_videos:
                     source_count += 1
 
@@ -113,6 +113,13 @@ class AnimeMatcherService:
     DENSE_VISUAL_RERANK_MAX_SCENES = 10
     DENSE_VISUAL_RERANK_MAX_CANDIDATES = 6
     DENSE_VISUAL_RERANK_MARGIN = 0.012
+    # (start, end) offsets, in scene durations, of the source interval implied
+    # by a single probe hit at each probe position.
+    PROBE_POSITION_OFFSETS = {
+        "start": (0.0, 1.0),
+        "middle": (-0.5, 0.5),
+        "end": (-1.0, 0.0),
+    }
 
     @classmethod
     def _clear_dependent_index_caches(cls) -> None:
@@ -277,6 +284,26 @@ class AnimeMatcherService:
         AnimeMatcherService._cv2 = cv2
         return cv2
 
+    @staticmethod
+    def _bgr_frame_to_image(frame: np.ndarray) -> Image.Image:
+        """Build an RGB PIL image from an OpenCV BGR frame.
+
+        PIL's raw ``BGR`` unpacker swaps channels while copying the pixels in,
+        so no intermediate RGB array is allocated as with ``cv2.cvtColor``.
+        """
+        frame = np.ascontiguousarray(frame)
+        height, width = frame.shape[:2]
+        return Image.frombuffer("RGB", (width, height), frame, "raw", "BGR", 0, 1)
+
+    @staticmethod
+    def _as_rgb(image: Image.Image) -> Image.Image:
+        """Return ``image`` in RGB mode without copying frames that already are.
+
+        ``Image.convert`` always allocates a new full-resolution image, even
+        for a same-mode conversion.
+        """
+        return image if image.mode == "RGB" else image.convert("RGB")
+
     @classmethod
     def _init_searcher(
         cls,
@@ -438,9 +465,7 @@ class AnimeMatcherService:
             if not ret:
                 return None
 
-            # Convert BGR to RGB
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            return Image.fromarray(frame_rgb)
+            return cls._bgr_frame_to_image(frame)
         finally:
             cap.release()
             cls._record_runtime_stat(
@@ -520,8 +545,7 @@ class AnimeMatcherService:
                 ret, frame = cap.read()
                 if not ret:
                     continue
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frames[index] = Image.fromarray(frame_rgb)
+                frames[index] = cls._bgr_frame_to_image(frame)
                 frame_indices[index] = target_frame_index
             return frames, frame_indices
 
@@ -533,15 +557,22 @@ class AnimeMatcherService:
         max_sequential_seconds = cls.MAX_SEQUENTIAL_GRAB_FRAMES / fps_fallback
         seek_preroll_seconds = min(2.0, max_sequential_seconds)
 
-        # (presentation timestamp, frame index, BGR frame)
-        previous: tuple[float, int | None, np.ndarray] | None = None
-        current: tuple[float, int | None, np.ndarray] | None = None
+        # Frames more than a few average frame periods before the target are
+        # rarely its nearest neighbour, so they are only grabbed (decoded) and
+        # not retrieved (converted to BGR). When one of them does win — the
+        # target lies past the last frame or inside a VFR gap — it is decoded
+        # again by an exact re-seek below.
+        retrieve_window_seconds = 3.0 / fps_fallback
+
+        # (presentation timestamp, frame index, BGR frame or None if skipped)
+        previous: tuple[float, int | None, np.ndarray | None] | None = None
+        current: tuple[float, int | None, np.ndarray | None] | None = None
 
         def read_decoded(
+            target: float,
             last_pts: float | None = None,
-        ) -> tuple[float, int | None, np.ndarray] | None:
-            ret, frame = cap.read()
-            if not ret:
+        ) -> tuple[float, int | None, np.ndarray | None] | None:
+            if not cap.grab():
                 return None
             raw_index = cap.get(cv2.CAP_PROP_POS_FRAMES)
             frame_index = (
@@ -558,8 +589,25 @@ class AnimeMatcherService:
                     pts = last_pts + 1.0 / fps_fallback
                 else:
                     pts = 0.0
+            frame = None
+            if pts >= target - retrieve_window_seconds:
+                ret, frame = cap.retrieve()
+                if not ret:
+                    frame = None
             return pts, frame_index, frame
 
+        def refetch(
+            item: tuple[float, int | None, np.ndarray | None],
+        ) -> np.ndarray | None:
+            """Decode a grabbed-but-not-retrieved frame again by seeking to it."""
+            pts, frame_index, _ = item
+            if frame_index is not None:
+                cap.set(cv2.CAP_PROP_POS_FRAMES, frame_index)
+            else:
+                cap.set(cv2.CAP_PROP_POS_MSEC, pts * 1000.0)
+            ret, frame = cap.read()
+            return frame if ret else None
+
         for original_index, raw_timestamp in ordered_targets:
             timestamp = max(0.0, float(raw_timestamp))
             if (
@@ -574,10 +622,10 @@ class AnimeMatcherService:
                 seek_time = max(0.0, timestamp - seek_preroll_seconds)
                 cap.set(cv2.CAP_PROP_POS_MSEC, seek_time * 1000.0)
                 previous = None
-                current = read_decoded()
+                current = read_decoded(timestamp)
 
             while current is not None and current[0] < timestamp:
-                decoded = read_decoded(current[0])
+                decoded = read_decoded(timestamp, current[0])
                 if decoded is None:
                     break
                 previous, current = current, decoded
@@ -586,8 +634,14 @@ class AnimeMatcherService:
             if not candidates:
                 continue
             chosen = min(candidates, key=lambda item: abs(item[0] - timestamp))
-            frame_rgb = cv2.cvtColor(chosen[2], cv2.COLOR_BGR2RGB)
-            frames[original_index] = Image.fromarray(frame_rgb)
+            frame = chosen[2]
+            if frame is None:
+                frame = refetch(chosen)
+                # The capture moved; the next target starts from a fresh seek.
+                previous = current = None
+                if frame is None:
+                    continue
+            frames[original_index] = cls._bgr_frame_to_image(frame)
             frame_indices[original_index] = chosen[1]
 
         return frames, frame_indices
@@ -619,6 +673,8 @@ class AnimeMatcherService:
         cls,
         video_path: Path,
         scene_items: list[tuple[int, Scene]],
+        *,
+        cap=None,
     ) -> tuple[
         dict[int, tuple[Image.Image | None, Image.Image | None, Image.Image | None]],
         dict[int, tuple[int | None, int | None, int | None]],
@@ -629,10 +685,14 @@ class AnimeMatcherService:
         The frame indices are used as keys for the cross-pass probe-embedding
         cache so that re-matching a scene whose probes land on the same source
         frame skips both decode and embedding.
+
+        When ``cap`` is given it is used instead of opening ``video_path`` and
+        is left open for the caller.
         """
         started_at = time.perf_counter()
-        cv2 = cls._require_cv2()
-        cap = cv2.VideoCapture(str(video_path))
+        owns_capture = cap is None
+        if owns_capture:
+            cap = cls._require_cv2().VideoCapture(str(video_path))
         frames_by_scene: dict[
             int,
             tuple[Image.Image | None, Image.Image | None, Image.Image | None],
@@ -678,7 +738,8 @@ class AnimeMatcherService:
             ):
                 assign(scene_index, position, image, frame_index)
         finally:
-            cap.release()
+            if owns_capture:
+                cap.release()
             cls._record_runtime_stat(
                 "frame_decode_probe_seconds",
                 time.perf_counter() - started_at,
@@ -687,6 +748,94 @@ class AnimeMatcherService:
             cls._record_runtime_stat("frame_decode_probe_targets", len(scene_items) * 3)
         return frames_by_scene, indices_by_scene
 
+    @classmethod
+    def _extract_and_search_scene_probes(
+        cls,
+        video_path: Path,
+        scene_items: list[tuple[int, Scene]],
+        *,
+        series: str | None,
+        top_n: int = 25,
+        chunk_scenes: int = 32,
+    ) -> tuple[
+        dict[int, tuple[Image.Image | None, Image.Image | None, Image.Image | None]],
+        dict[int, tuple[list[MatchCandidate], list[MatchCandidate], list[MatchCandidate]]],
+    ]:
+        """Decode and search scene probes as an overlapped two-stage pipeline.
+
+        A worker thread walks one capture forward through the scenes in
+        chunks while the calling thread embeds and searches the previous
+        chunk, so SSCD/FAISS work no longer waits for the whole decode pass.
+        All GPU work stays on the calling thread.
+        """
+        import queue as _queue
+        import threading as _threading
+
+        chunk_q: _queue.Queue = _queue.Queue(maxsize=2)
+        producer_error: list[BaseException] = []
+        stop = _threading.Event()
+
+        def _produce() -> None:
+            cap = cls._require_cv2().VideoCapture(str(video_path))
+            try:
+                for start in range(0, len(scene_items), chunk_scenes):
+                    if stop.is_set():
+                        break
+                    chunk_q.put(
+                        cls._extract_scene_probe_frames_with_indices(
+                            video_path,
+                            scene_items[start : start + chunk_scenes],
+                            cap=cap,
+                        )
+                    )
+            except BaseException as exc:  # surfaced on the calling thread
+                producer_error.append(exc)
+            finally:
+                cap.release()
+                chunk_q.put(None)
+
+        probe_frames: dict[
+            int,
+            tuple[Image.Image | None, Image.Image | None, Image.Image | None],
+        ] = {}
+        candidates: dict[
+            int,
+            tuple[list[MatchCandidate], list[MatchCandidate], list[MatchCandidate]],
+        ] = {}
+        worker = _threading.Thread(target=_produce, daemon=True)
+        worker.start()
+        try:
+            while True:
+                item = chunk_q.get()
+                if item is None:
+                    break
+                chunk_frames, chunk_indices = item
+                probe_frames.update(chunk_frames)
+                candidates.update(
+                    cls._search_scene_probe_candidates_batch(
+                        chunk_frames,
+                        top_n=top_n,
+                        threshold=None,
+                        flip=False,
+                        series=series,
+                        video_path=video_path,
+                        probe_frame_indices=chunk_indices,
+                    )
+                )
+        finally:
+            # If searching failed mid-way, stop decoding further chunks and
+            # unblock a producer waiting on the full queue.
+            stop.set()
+            while worker.is_alive():
+                try:
+                    chunk_q.get(timeout=0.1)
+                except _queue.Empty:
+                    pass
+            worker.join()
+        if producer_error:
+            raise producer_error[0]
+        return probe_frames, candidates
+
     @staticmethod
     def _search_result_to_candidates(results) -> list[MatchCandidate]:
         return [
@@ -699,6 +848,46 @@ class AnimeMatcherService:
             for r in results
         ]
 
+    @staticmethod
+    def _dedupe_identical_images(
+        images: list[Image.Image],
+    ) -> tuple[list[Image.Image], list[int]]:
+        """Collapse pixel-identical images before embedding.
+
+        Returns the unique images and, for every input, the position of its
+        representative among them. A 64-bit dHash buckets candidates cheaply
+        and pixels are only compared on a hash collision, so merely similar
+        frames are never merged and search results stay exact.
+        """
+        unique: list[Image.Image] = []
+        unique_bytes: dict[int, bytes] = {}
+        positions: list[int] = []
+        buckets: dict[tuple[bytes, tuple[int, int], str], list[int]] = {}
+        for image in images:
+            small = np.asarray(
+                image.resize((9, 8), Image.Resampling.BILINEAR).convert("L"),
+                dtype=np.int16,
+            )
+            dhash = np.packbits(small[:, 1:] > small[:, :-1]).tobytes()
+            bucket = buckets.setdefault((dhash, image.size, image.mode), [])
+            image_bytes: bytes | None = None
+            for candidate in bucket:
+                if image_bytes is None:
+                    image_bytes = image.tobytes()
+                candidate_bytes = unique_bytes.get(candidate)
+                if candidate_bytes is None:
+                    candidate_bytes = unique_bytes[candidate] = unique[candidate].tobytes()
+                if candidate_bytes == image_bytes:
+                    positions.append(candidate)
+                    break
+            else:
+                if image_bytes is not None:
+                    unique_bytes[len(unique)] = image_bytes
+                bucket.append(len(unique))
+                positions.append(len(unique))
+                unique.append(image)
+        return unique, positions
+
     @classmethod
     def _search_scene_probe_candidates_batch(
         cls,
@@ -789,23 +978,30 @@ class AnimeMatcherService:
                     cls._record_runtime_stat("probe_embedding_cache_misses")
 
             embedded_lookup: dict[tuple[int, int], np.ndarray] = dict(cached_embeddings)
-            for start in range(0, len(missing_images), batch_size):
+            unique_images, unique_positions = cls._dedupe_identical_images(
+                missing_images
+            )
+            cls._record_runtime_stat(
+                "probe_duplicate_frames",
+                len(missing_images) - len(unique_images),
+            )
+            unique_embeddings: list[np.ndarray] = []
+            for start in range(0, len(unique_images), batch_size):
                 batch_images = [
-                    image.convert("RGB")
-                    for image in missing_images[start : start + batch_size]
+                    cls._as_rgb(image)
+                    for image in unique_images[start : start + batch_size]
                 ]
-                batch_keys = missing_keys[start : start + batch_size]
-                batch_cache_keys = missing_cache_keys[start : start + batch_size]
-                batch_embeddings = cls._embed_pil_batch(batch_images)
-                for key, cache_key, embedding in zip(
-                    batch_keys,
-                    batch_cache_keys,
-                    batch_embeddings,
-                    strict=False,
-                ):
-                    embedded_lookup[key] = embedding
-                    if cache_key is not None:
-                        cls._store_video_frame_embedding(cache_key, embedding)
+                unique_embeddings.extend(cls._embed_pil_batch(batch_images))
+            for key, cache_key, position in zip(
+                missing_keys,
+                missing_cache_keys,
+                unique_positions,
+                strict=False,
+            ):
+                embedding = unique_embeddings[position]
+                embedded_lookup[key] = embedding
+                if cache_key is not None:
+                    cls._store_video_frame_embedding(cache_key, embedding)
 
             if embedded_lookup:
                 stacked = np.stack(
@@ -835,18 +1031,26 @@ class AnimeMatcherService:
                         for sim, meta in results
                     ]
         else:
-            for start in range(0, len(flat_images), batch_size):
-                batch_images = flat_images[start : start + batch_size]
-                batch_keys = flat_keys[start : start + batch_size]
-                batch_results = cls._search_image_batch(
-                    batch_images,
-                    top_n=top_n,
-                    threshold=threshold,
-                    flip=flip,
-                    series=series,
+            unique_images, unique_positions = cls._dedupe_identical_images(flat_images)
+            cls._record_runtime_stat(
+                "probe_duplicate_frames",
+                len(flat_images) - len(unique_images),
+            )
+            unique_results: list[list] = []
+            for start in range(0, len(unique_images), batch_size):
+                unique_results.extend(
+                    cls._search_image_batch(
+                        unique_images[start : start + batch_size],
+                        top_n=top_n,
+                        threshold=threshold,
+                        flip=flip,
+                        series=series,
+                    )
+                )
+            for key, position in zip(flat_keys, unique_positions, strict=False):
+                candidate_lists[key] = cls._search_result_to_candidates(
+                    unique_results[position]
                 )
-                for key, results in zip(batch_keys, batch_results, strict=False):
-                    candidate_lists[key] = cls._search_result_to_candidates(results)
 
         for scene_index, frames in probe_frames.items():
             if not all(frames):
@@ -1097,14 +1301,16 @@ class AnimeMatcherService:
                 pos_ts = cap.get(cv2.CAP_PROP_POS_MSEC) / 1000.0
                 if pos_ts > end_ts:
                     break
+                if pos_ts < start_ts:
+                    # Seek landed on an earlier keyframe; decode without
+                    # converting until we enter the window.
+                    if not cap.grab():
+                        break
+                    continue
                 ret, frame = cap.read()
                 if not ret:
                     break
-                if pos_ts < start_ts:
-                    # Seek landed on an earlier keyframe; skip until we enter the window.
-                    continue
-                frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                frames.append((pos_ts, Image.fromarray(frame_rgb)))
+                frames.append((pos_ts, cls._bgr_frame_to_image(frame)))
             if sample_frames is not None and len(frames) > sample_frames:
                 indices = np.linspace(0, len(frames) - 1, sample_frames, dtype=np.int32)
                 return [frames[int(index)] for index in indices]
@@ -1275,13 +1481,19 @@ class AnimeMatcherService:
         Returns one search result list per input image.
         """
         processor = cls._query_processor
-        prepared = [img.convert("RGB") for img in images]
+        prepared = [cls._as_rgb(img) for img in images]
         if not prepared:
             return []
 
+        count = len(prepared)
+        if flip:
+            # Embed and search the mirrored queries in the same forward pass
+            # and FAISS call as the originals.
+            prepared = prepared + [ImageOps.mirror(img) for img in prepared]
+
         embeddings = cls._embed_pil_batch(prepared)
         search_started_at = time.perf_counter()
-        per_image_results = processor.index_manager.search_batch(
+        all_results = processor.index_manager.search_batch(
             embeddings,
             top_n,
             threshold,
@@ -1294,26 +1506,12 @@ class AnimeMatcherService:
         cls._record_runtime_stat("faiss_search_queries", len(prepared))
 
         if flip:
-            flipped = [ImageOps.mirror(img) for img in prepared]
-            flip_embeddings = cls._embed_pil_batch(flipped)
-            search_started_at = time.perf_counter()
-            per_image_flip_results = processor.index_manager.search_batch(
-                flip_embeddings,
-                top_n,
-                threshold,
-                series=series,
-            )
-            cls._record_runtime_stat(
-                "faiss_search_seconds",
-                time.perf_counter() - search_started_at,
-            )
-            cls._record_runtime_stat("faiss_search_queries", len(prepared))
             merged_results = [
-                processor._merge_results(per_image_results[i], per_image_flip_results[i], top_n)
-                for i in range(len(prepared))
+                processor._merge_results(all_results[i], all_results[count + i], top_n)
+                for i in range(count)
             ]
         else:
-            merged_results = per_image_results
+            merged_results = all_results
 
         return [
             [
@@ -2632,21 +2830,13 @@ class AnimeMatcherService:
             ("middle", match.middle_candidates[:80]),
             ("end", match.end_candidates[:80]),
         ):
+            start_offset, end_offset = cls.PROBE_POSITION_OFFSETS[position]
             for rank, candidate in enumerate(candidates):
-                if position == "start":
-                    start_time = candidate.timestamp
-                    end_time = candidate.timestamp + scene_duration
-                elif position == "middle":
-                    start_time = candidate.timestamp - scene_duration / 2.0
-                    end_time = candidate.timestamp + scene_duration / 2.0
-                else:
-                    start_time = candidate.timestamp - scene_duration
-                    end_time = candidate.timestamp
                 base_intervals.append(
                     (
                         candidate.episode,
-                        start_time,
-                        end_time,
+                        candidate.timestamp + start_offset * scene_duration,
+                        candidate.timestamp + end_offset * scene_duration,
                         candidate.similarity,
                         1,
                         f"{position}_probe",
@@ -2952,76 +3142,84 @@ class AnimeMatcherService:
         MIN_SPEED = settings.matcher_min_speed_factor
         MAX_SPEED = 1.60  # 160% - sped up
 
-        best_match: MatchProposal | None = None
-        best_confidence = 0.0
-
-        for start in start_candidates:
-            for middle in middle_candidates:
-                for end in end_candidates:
-                    # Must be same episode
-                    if not (start.episode == middle.episode == end.episode):
-                        continue
-
-                    # Timestamps must be in order
-                    if not (start.timestamp < middle.timestamp < end.timestamp):
-                        continue
-
-                    # Calculate source duration and speed ratio
-                    source_duration = end.timestamp - start.timestamp
-                    if source_duration <= 0:
-                        continue
+        if not (start_candidates and middle_candidates and end_candidates):
+            return None
 
-                    speed_ratio = scene_duration / source_duration
+        # Score every (start, middle, end) triple at once: axis 0 indexes
+        # start candidates, axis 1 middle and axis 2 end.
+        episode_codes: dict[str, int] = {}
 
-                    # Check if within acceptable speed range
-                    if not (MIN_SPEED <= speed_ratio <= MAX_SPEED):
-                        continue
-
-                    # Confidence combines three signals (all on [0, 1]):
-                    #   avg_similarity: raw retrieval quality across probes.
-                    #   min_similarity: the weakest probe — penalizes triples where
-                    #                   one frame is a bad match, even if the other
-                    #                   two are strong (classic sequence-match fix).
-                    #   temporal_score: how close middle is to the geometric center;
-                    #                   rewards clean temporal geometry.
-                    avg_similarity = (
-                        start.similarity + middle.similarity + end.similarity
-                    ) / 3
-                    min_similarity = min(
-                        start.similarity, middle.similarity, end.similarity
-                    )
+        def columns(
+            candidates: list[MatchCandidate],
+        ) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+            return (
+                np.array(
+                    [episode_codes.setdefault(c.episode, len(episode_codes)) for c in candidates],
+                    dtype=np.int64,
+                ),
+                np.array([c.timestamp for c in candidates], dtype=np.float64),
+                np.array([c.similarity for c in candidates], dtype=np.float64),
+            )
 
-                    expected_middle = start.timestamp + source_duration / 2
-                    middle_deviation = (
-                        abs(middle.timestamp - expected_middle) / source_duration
-                    )
-                    temporal_score = max(0.0, 1.0 - middle_deviation * 2)
+        s_ep, s_ts, s_sim = (a[:, None, None] for a in columns(start_candidates))
+        m_ep, m_ts, m_sim = (a[None, :, None] for a in columns(middle_candidates))
+        e_ep, e_ts, e_sim = (a[None, None, :] for a in columns(end_candidates))
+
+        # Must be same episode, with timestamps in order
+        valid = (s_ep == m_ep) & (m_ep == e_ep) & (s_ts < m_ts) & (m_ts < e_ts)
+        source_duration = e_ts - s_ts
+        valid &= source_duration > 0
+        with np.errstate(divide="ignore", invalid="ignore"):
+            speed_ratio = scene_duration / source_duration
+            # Check if within acceptable speed range
+            valid &= (speed_ratio >= MIN_SPEED) & (speed_ratio <= MAX_SPEED)
+            if not valid.any():
+                return None
 
-                    confidence = (
-                        0.70 * avg_similarity
-                        + 0.20 * min_similarity
-                        + 0.10 * temporal_score
-                    )
+            # Confidence combines three signals (all on [0, 1]):
+            #   avg_similarity: raw retrieval quality across probes.
+            #   min_similarity: the weakest probe — penalizes triples where
+            #                   one frame is a bad match, even if the other
+            #                   two are strong (classic sequence-match fix).
+            #   temporal_score: how close middle is to the geometric center;
+            #                   rewards clean temporal geometry.
+            avg_similarity = (s_sim + m_sim + e_sim) / 3
+            min_similarity = np.minimum(np.minimum(s_sim, m_sim), e_sim)
+            expected_middle = s_ts + source_duration / 2
+            middle_deviation = np.abs(m_ts - expected_middle) / source_duration
+            temporal_score = np.maximum(0.0, 1.0 - middle_deviation * 2)
+            confidence = (
+                0.70 * avg_similarity
+                + 0.20 * min_similarity
+                + 0.10 * temporal_score
+            )
 
-                    if confidence > best_confidence:
-                        best_confidence = confidence
-                        best_match = MatchProposal(
-                            episode=start.episode,
-                            start_time=start.timestamp,
-                            end_time=end.timestamp,
-                            confidence=confidence,
-                            selection_score=confidence + selection_bonus,
-                            source=source,
-                            vote_count=3,
-                            debug={
-                                "speed_ratio": speed_ratio,
-                                "start_similarity": start.similarity,
-                                "middle_similarity": middle.similarity,
-                                "end_similarity": end.similarity,
-                            },
-                        )
+        # argmax returns the first maximum in (start, middle, end) order, the
+        # same triple a nested loop keeping strict improvements would pick.
+        confidence = np.where(valid, confidence, -np.inf)
+        i, j, k = np.unravel_index(int(np.argmax(confidence)), confidence.shape)
+        best_confidence = float(confidence[i, j, k])
+        if not best_confidence > 0.0:
+            return None
 
-        return best_match
+        start = start_candidates[i]
+        middle = middle_candidates[j]
+        end = end_candidates[k]
+        return MatchProposal(
+            episode=start.episode,
+            start_time=start.timestamp,
+            end_time=end.timestamp,
+            confidence=best_confidence,
+            selection_score=best_confidence + selection_bonus,
+            source=source,
+            vote_count=3,
+            debug={
+                "speed_ratio": float(speed_ratio[i, 0, k]),
+                "start_similarity": start.similarity,
+                "middle_similarity": middle.similarity,
+                "end_similarity": end.similarity,
+            },
+        )
 
     @classmethod
     def _find_temporal_match(
@@ -3092,6 +3290,49 @@ class AnimeMatcherService:
                 )
         return proposals
 
+    @staticmethod
+    def _best_ordered_interval(
+        start: np.ndarray,
+        middle: np.ndarray | None,
+        end: np.ndarray,
+        scene_duration: float,
+        min_speed: float,
+        max_speed: float,
+    ) -> tuple[float, float, float] | None:
+        """Return ``(start_ts, end_ts, speed_ratio)`` of the best-scoring
+        ordered (start, middle, end) triple, or (start, end) pair when
+        ``middle`` is None, among ``(timestamp, similarity)`` probe hit rows.
+
+        Ties go to the first combination in start/middle/end order.
+        """
+        s = np.asarray(start, dtype=np.float64).reshape(-1, 1, 2)
+        e = np.asarray(end, dtype=np.float64).reshape(1, -1, 2)
+        s_ts, s_sim = s[..., 0], s[..., 1]
+        e_ts, e_sim = e[..., 0], e[..., 1]
+        source_duration = e_ts - s_ts
+        valid = s_ts < e_ts
+        with np.errstate(divide="ignore", invalid="ignore"):
+            speed_ratio = scene_duration / source_duration
+        valid &= (speed_ratio >= min_speed) & (speed_ratio <= max_speed)
+        if middle is None:
+            score = s_sim + e_sim
+        else:
+            m = np.asarray(middle, dtype=np.float64).reshape(1, -1, 1, 2)
+            m_ts, m_sim = m[..., 0], m[..., 1]
+            s_ts, s_sim = s_ts[:, :, None], s_sim[:, :, None]
+            e_ts, e_sim = e_ts[:, None, :], e_sim[:, None, :]
+            valid = valid[:, None, :] & (s_ts < m_ts) & (m_ts < e_ts)
+            speed_ratio = speed_ratio[:, None, :]
+            score = s_sim + m_sim + e_sim
+        score = np.where(valid & (score > -1.0), score, -np.inf)
+        best = np.unravel_index(int(np.argmax(score)), score.shape)
+        if not np.isfinite(score[best]):
+            return None
+        i, k = best[0], best[-1]
+        return float(start[i][0]), float(end[k][0]), float(
+            speed_ratio[(i, 0, k) if middle is not None else (i, k)]
+        )
+
     @classmethod
     def _compute_alternatives(
         cls,
@@ -3137,68 +3378,65 @@ class AnimeMatcherService:
         # hit landed in entirely different scenes (same character, different
         # moment) produced intervals spanning hundreds of seconds — the "long
         # clip" bug.
-        episode_pos: dict[str, dict[str, list[tuple[float, float]]]] = defaultdict(
-            lambda: {'start': [], 'middle': [], 'end': []}
-        )
-        episode_total_sim: dict[str, float] = defaultdict(float)
-        episode_vote_count: dict[str, int] = defaultdict(int)
-
-        for position, candidates in all_candidates:
+        episode_codes: dict[str, int] = {}
+        flat_codes: list[int] = []
+        flat_positions: list[int] = []
+        flat_ts_sim: list[tuple[float, float]] = []
+        for position_code, (_, candidates) in enumerate(all_candidates):
             for candidate in candidates:
-                ep = candidate.episode
-                episode_pos[ep][position].append(
-                    (candidate.timestamp, candidate.similarity)
+                flat_codes.append(
+                    episode_codes.setdefault(candidate.episode, len(episode_codes))
                 )
-                episode_total_sim[ep] += candidate.similarity
-                episode_vote_count[ep] += 1
+                flat_positions.append(position_code)
+                flat_ts_sim.append((candidate.timestamp, candidate.similarity))
+
+        codes = np.asarray(flat_codes, dtype=np.int64)
+        positions = np.asarray(flat_positions, dtype=np.int64)
+        ts_sim = np.asarray(flat_ts_sim, dtype=np.float64).reshape(-1, 2)
+        episode_count = len(episode_codes)
+        episode_vote_count = np.bincount(codes, minlength=episode_count)
+        episode_total_sim = np.bincount(
+            codes,
+            weights=ts_sim[:, 1],
+            minlength=episode_count,
+        )
 
         seen_weighted_avg: set[str] = set()
         weighted_avg_alts: list[tuple[float, AlternativeMatch]] = []
 
-        for episode in episode_pos:
-            pos = episode_pos[episode]
-            vote_count = episode_vote_count[episode]
-            if vote_count == 0:
-                continue
-            avg_similarity = episode_total_sim[episode] / vote_count
+        for episode, code in episode_codes.items():
+            vote_count = int(episode_vote_count[code])
+            avg_similarity = float(episode_total_sim[code]) / vote_count
+            episode_mask = codes == code
+            episode_ts_sim = ts_sim[episode_mask]
+            episode_positions = positions[episode_mask]
+            start_hits = episode_ts_sim[episode_positions == 0]
+            middle_hits = episode_ts_sim[episode_positions == 1]
+            end_hits = episode_ts_sim[episode_positions == 2]
 
             # Search for the highest-scoring valid (s, m, e) triple, then a valid
             # (s, e) pair, then fall back to midpoint projection.
             best_interval: tuple[float, float, float] | None = None
-            best_interval_score = -1.0
 
-            if pos['start'] and pos['middle'] and pos['end']:
-                for s_ts, s_sim in pos['start']:
-                    for m_ts, m_sim in pos['middle']:
-                        if s_ts >= m_ts:
-                            continue
-                        for e_ts, e_sim in pos['end']:
-                            if m_ts >= e_ts:
-                                continue
-                            src_dur = e_ts - s_ts
-                            if src_dur <= 0:
-                                continue
-                            sr = scene_duration / src_dur
-                            if not (MIN_SPEED <= sr <= MAX_SPEED):
-                                continue
-                            score = s_sim + m_sim + e_sim
-                            if score > best_interval_score:
-                                best_interval_score = score
-                                best_interval = (s_ts, e_ts, sr)
-
-            if best_interval is None and pos['start'] and pos['end']:
-                for s_ts, s_sim in pos['start']:
-                    for e_ts, e_sim in pos['end']:
-                        if s_ts >= e_ts:
-                            continue
-                        src_dur = e_ts - s_ts
-                        sr = scene_duration / src_dur
-                        if not (MIN_SPEED <= sr <= MAX_SPEED):
-                            continue
-                        score = s_sim + e_sim
-                        if score > best_interval_score:
-                            best_interval_score = score
-                            best_interval = (s_ts, e_ts, sr)
+            if len(start_hits) and len(middle_hits) and len(end_hits):
+                best_interval = cls._best_ordered_interval(
+                    start_hits,
+                    middle_hits,
+                    end_hits,
+                    scene_duration,
+                    MIN_SPEED,
+                    MAX_SPEED,
+                )
+
+            if best_interval is None and len(start_hits) and len(end_hits):
+                best_interval = cls._best_ordered_interval(
+                    start_hits,
+                    None,
+                    end_hits,
+                    scene_duration,
+                    MIN_SPEED,
+                    MAX_SPEED,
+                )
 
             if best_interval is not None:
                 start_time, end_time, speed_ratio = best_interval
@@ -3206,12 +3444,7 @@ class AnimeMatcherService:
                 # No ordered pair/triple passes the speed bounds. Project from
                 # the single best-similarity candidate, centering a scene-length
                 # interval on it. Keeps speed_ratio honestly at 1.0.
-                all_ts_sim: list[tuple[float, float]] = []
-                for p in ('start', 'middle', 'end'):
-                    all_ts_sim.extend(pos[p])
-                if not all_ts_sim:
-                    continue
-                best_ts, _ = max(all_ts_sim, key=lambda x: x[1])
+                best_ts = float(episode_ts_sim[int(np.argmax(episode_ts_sim[:, 1])), 0])
                 start_time = max(0.0, best_ts - scene_duration / 2)
                 end_time = start_time + scene_duration
                 speed_ratio = 1.0
@@ -3236,86 +3469,60 @@ class AnimeMatcherService:
                 seen_weighted_avg.add(alt.episode)
 
         # ============ Algorithm 2: Best Frame Winner (up to 2) ============
-        # Take the single highest-confidence match from each frame position
-        seen_best_frame: set[str] = set()
-        best_frame_alts: list[tuple[float, AlternativeMatch]] = []
-
-        for position, candidates in all_candidates:
-            if not candidates:
-                continue
-            # Get the best candidate from this position
-            best = max(candidates, key=lambda c: c.similarity)
-
-            # Estimate timing based on position
-            if position == 'start':
-                start_time = best.timestamp
-                end_time = best.timestamp + scene_duration
-            elif position == 'middle':
-                start_time = best.timestamp - scene_duration / 2
-                end_time = best.timestamp + scene_duration / 2
-            else:  # end
-                start_time = best.timestamp - scene_duration
-                end_time = best.timestamp
-
+        # Take the single highest-confidence match from each frame position.
+        # ============ Algorithm 3: Union of Top-K (up to 2) ============
+        # Pool all candidates and take top K by raw similarity.
+        # Both walk one stable sort of the pooled candidates: a position's
+        # best frame is the first pooled entry seen for that position.
+        def single_frame_alternative(
+            position: str,
+            c: MatchCandidate,
+            algorithm: str,
+        ) -> AlternativeMatch:
+            start_offset, end_offset = cls.PROBE_POSITION_OFFSETS[position]
+            start_time = c.timestamp + start_offset * scene_duration
+            end_time = c.timestamp + end_offset * scene_duration
             clamped_start = max(0.0, start_time)
             source_duration = max(1e-3, end_time - clamped_start)
-            best_frame_alts.append((best.similarity, AlternativeMatch(
-                episode=best.episode,
+            return AlternativeMatch(
+                episode=c.episode,
                 start_time=clamped_start,
                 end_time=end_time,
-                confidence=best.similarity,
+                confidence=c.similarity,
                 speed_ratio=scene_duration / source_duration,
                 vote_count=1,
-                algorithm='best_frame',
-            )))
-
-        # Sort by similarity and take top 2 unique episodes
-        best_frame_alts.sort(key=lambda x: -x[0])
-        bf_added = 0
-        for sim, alt in best_frame_alts:
-            if alt.episode not in seen_best_frame and bf_added < 2:
-                alternatives.append(alt)
-                seen_best_frame.add(alt.episode)
-                bf_added += 1
-
-        # ============ Algorithm 3: Union of Top-K (up to 2) ============
-        # Pool all candidates and take top K by raw similarity
-        seen_union_topk: set[str] = set()
-        all_pooled = []
-        for position, candidates in all_candidates:
-            for c in candidates:
-                all_pooled.append((position, c))
+                algorithm=algorithm,
+            )
 
-        # Sort by similarity
+        all_pooled = [
+            (position, c)
+            for position, candidates in all_candidates
+            for c in candidates
+        ]
         all_pooled.sort(key=lambda x: -x[1].similarity)
 
-        utk_added = 0
+        best_frame_positions: set[str] = set()
+        seen_best_frame: set[str] = set()
+        seen_union_topk: set[str] = set()
+        best_frame_alts: list[AlternativeMatch] = []
+        union_topk_alts: list[AlternativeMatch] = []
         for position, c in all_pooled:
-            if c.episode not in seen_union_topk and utk_added < 2:
-                # Estimate timing
-                if position == 'start':
-                    start_time = c.timestamp
-                    end_time = c.timestamp + scene_duration
-                elif position == 'middle':
-                    start_time = c.timestamp - scene_duration / 2
-                    end_time = c.timestamp + scene_duration / 2
-                else:
-                    start_time = c.timestamp - scene_duration
-                    end_time = c.timestamp
-
-                clamped_start = max(0.0, start_time)
-                source_duration = max(1e-3, end_time - clamped_start)
-                alternatives.append(AlternativeMatch(
-                    episode=c.episode,
-                    start_time=clamped_start,
-                    end_time=end_time,
-                    confidence=c.similarity,
-                    speed_ratio=scene_duration / source_duration,
-                    vote_count=1,
-                    algorithm='union_topk',
-                ))
+            if position not in best_frame_positions:
+                best_frame_positions.add(position)
+                if c.episode not in seen_best_frame and len(best_frame_alts) < 2:
+                    best_frame_alts.append(
+                        single_frame_alternative(position, c, 'best_frame')
+                    )
+                    seen_best_frame.add(c.episode)
+            if c.episode not in seen_union_topk and len(union_topk_alts) < 2:
+                union_topk_alts.append(
+                    single_frame_alternative(position, c, 'union_topk')
+                )
                 seen_union_topk.add(c.episode)
-                utk_added += 1
+            if len(best_frame_positions) == len(all_candidates) and len(union_topk_alts) >= 2:
+                break
+        alternatives.extend(best_frame_alts)
+        alternatives.extend(union_topk_alts)
 
         # Deduplicate alternatives sharing identical (start_time, end_time):
         # the three algorithms independently propose intervals and routinely
@@ -3434,23 +3641,14 @@ class AnimeMatcherService:
             0,
             total_scenes,
         )
-        probe_frames, probe_frame_indices = await loop.run_in_executor(
-            None,
-            cls._extract_scene_probe_frames_with_indices,
-            video_path,
-            target_scene_items,
-        )
-        direct_candidates = await loop.run_in_executor(
+        probe_frames, direct_candidates = await loop.run_in_executor(
             None,
             partial(
-                cls._search_scene_probe_candidates_batch,
-                probe_frames,
-                top_n=25,
-                threshold=None,
-                flip=False,
+                cls._extract_and_search_scene_probes,
+                video_path,
+                target_scene_items,
                 series=anime_name,
-                video_path=video_path,
-                probe_frame_indices=probe_frame_indices,
+                top_n=25,
             ),
         )
 
@@ -247,7 +247,7 @@ class BrowserMediaService:
             return False
         codec = str(stream.get("codec_name", "")).strip().lower()
         pix_fmt = str(stream.get("pix_fmt", "")).strip().lower()
-        duration = AnimeLibraryService._probe_video_duration_sync(preview_path)
+        duration = AnimeLibraryService._video_stream_duration_sync(stream, preview_path)
         return codec == "h264" and pix_fmt in {"yuv420p", "yuvj420p"} and (duration or 0.0) > 0.05
 
     @classmethod
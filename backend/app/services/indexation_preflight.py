@@ -141,9 +141,9 @@ class IndexationPreflightService:
         display_name: str,
         remote_series_id: str | None,
     ) -> str | None:
-        local_series_dir = AnimeLibraryService.get_library_path(library_type) / display_name
-        if not local_series_dir.exists() or not local_series_dir.is_dir():
+        if not AnimeLibraryService.series_exists(display_name, library_type):
             return None
+        local_series_dir = AnimeLibraryService.get_library_path(library_type) / display_name
 
         metadata = StorageBoxRepository.read_local_series_metadata(local_series_dir)
         local_series_id = (
@@ -218,7 +218,8 @@ class IndexationPreflightService:
         result["series_id"] = remote_series_id
         result["storage_release_id"] = str(remote["release_id"]) if remote else None
 
-        orphan_reason = cls._local_collision_reason(
+        orphan_reason = await asyncio.to_thread(
+            cls._local_collision_reason,
             library_type=scoped_type,
             display_name=display_name,
             remote_series_id=remote_series_id,
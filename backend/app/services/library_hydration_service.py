@@ -9,7 +9,7 @@ import shutil
 import uuid
 from contextlib import nullcontext, suppress
 from pathlib import Path
-from typing import Any, Awaitable, Callable
+from typing import Any, AsyncIterator, Awaitable, Callable
 
 from ..config import settings
 from ..library_types import LibraryType, coerce_library_type
@@ -1102,6 +1102,18 @@ class LibraryHydrationService:
         *,
         library_type: LibraryType | str,
     ) -> list[dict[str, Any]]:
+        return [
+            detail
+            async for detail in cls.iter_source_details(library_type=library_type)
+        ]
+
+    @classmethod
+    async def iter_source_details(
+        cls,
+        *,
+        library_type: LibraryType | str,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield source details one series at a time, in catalog order."""
         scoped_type = coerce_library_type(library_type)
         catalog = await StorageBoxRepository.list_catalog(scoped_type)
         library_path = AnimeLibraryService.get_library_path(scoped_type)
@@ -1110,7 +1122,6 @@ class LibraryHydrationService:
             LibraryStateDb.get_project_pin_counts,
             [str(entry.get("series_id")) for entry in catalog],
         )
-        results: list[dict[str, Any]] = []
         for entry in catalog:
             series_id = str(entry.get("series_id"))
             state = state_by_series.get(series_id)
@@ -1136,28 +1147,25 @@ class LibraryHydrationService:
             local_episode_count = state.local_episode_count if state else 0
             expected_episode_count = state.expected_episode_count if state else int(entry.get("episode_count", 0) or 0)
             hydration_status = state.hydration_status if state else HYDRATION_STATUS_NOT_HYDRATED
-            results.append(
-                {
-                    "name": str(entry.get("name", "")),
-                    "series_id": series_id,
-                    "episode_count": int(entry.get("episode_count", 0) or 0),
-                    "local_episode_count": local_episode_count,
-                    "total_size_bytes": int(entry.get("total_size_bytes", 0) or 0),
-                    "fps": float(entry.get("fps", 0.0) or 0.0),
-                    "is_fully_local": expected_episode_count > 0 and local_episode_count >= expected_episode_count,
-                    "project_pin_count": pin_counts.get(series_id, 0),
-                    "permanent_pin": bool(state.permanent_pin) if state else False,
-                    "storage_release_id": storage_release_id,
-                    "torrent_count": int(entry.get("torrent_count", 0) or 0),
-                    "hydration_status": hydration_status,
-                    "updated_at": str(
-                        (state.updated_at if state else None)
-                        or entry.get("updated_at")
-                        or ""
-                    ),
-                }
-            )
-        return results
+            yield {
+                "name": str(entry.get("name", "")),
+                "series_id": series_id,
+                "episode_count": int(entry.get("episode_count", 0) or 0),
+                "local_episode_count": local_episode_count,
+                "total_size_bytes": int(entry.get("total_size_bytes", 0) or 0),
+                "fps": float(entry.get("fps", 0.0) or 0.0),
+                "is_fully_local": expected_episode_count > 0 and local_episode_count >= expected_episode_count,
+                "project_pin_count": pin_counts.get(series_id, 0),
+                "permanent_pin": bool(state.permanent_pin) if state else False,
+                "storage_release_id": storage_release_id,
+                "torrent_count": int(entry.get("torrent_count", 0) or 0),
+                "hydration_status": hydration_status,
+                "updated_at": str(
+                    (state.updated_at if state else None)
+                    or entry.get("updated_at")
+                    or ""
+                ),
+            }
 
     @classmethod
     async def sync_local_series_state(
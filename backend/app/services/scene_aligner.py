@@ -765,8 +765,9 @@ class SceneAlignerService:
 
                     def append_sample(frame: np.ndarray, sample_time: float) -> None:
                         nonlocal images, times
-                        frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-                        images.append(Image.fromarray(frame_rgb))
+                        images.append(
+                            AnimeMatcherService._bgr_frame_to_image(frame)
+                        )
                         times.append(sample_time)
                         if len(images) >= 96:
                             batch_q.put((images, times))
@@ -844,7 +845,7 @@ class SceneAlignerService:
                 b_images, b_times = item
                 embeddings = AnimeMatcherService._embed_pil_batch(
                     _presize_images(
-                        [image.convert("RGB") for image in b_images]
+                        [AnimeMatcherService._as_rgb(image) for image in b_images]
                     )
                 )
                 for sample_time, embedding in zip(
@@ -891,7 +892,9 @@ class SceneAlignerService:
     def _embed_variant_images(images: list[Image.Image]) -> np.ndarray:
         embeddings: list[np.ndarray | None] = [None] * len(images)
         by_size: dict[tuple[int, int], list[tuple[int, Image.Image]]] = {}
-        presized = _presize_images([image.convert("RGB") for image in images])
+        presized = _presize_images(
+            [AnimeMatcherService._as_rgb(image) for image in images]
+        )
         for index, rgb in enumerate(presized):
             by_size.setdefault(rgb.size, []).append((index, rgb))
         for values in by_size.values():
@@ -1793,7 +1796,9 @@ class SceneAlignerService:
         if not keep_rows:
             return scenes
         all_embs = AnimeMatcherService._embed_pil_batch(
-            _presize_images([decoded[k].convert("RGB") for k in keep_rows])
+            _presize_images(
+                [AnimeMatcherService._as_rgb(decoded[k]) for k in keep_rows]
+            )
         )
         emb_of: dict[int, np.ndarray] = {
             row: all_embs[n] for n, row in enumerate(keep_rows)
@@ -5895,7 +5900,7 @@ class SceneAlignerService:
                         if not dec_c or dec_c[0] is None:
                             continue
                         q0_emb = AnimeMatcherService._embed_pil_batch(
-                            _presize_images([dec_c[0].convert("RGB")])
+                            _presize_images([AnimeMatcherService._as_rgb(dec_c[0])])
                         )[0]
                     pre_m = ct < cut_t
                     post_m = (ct >= cut_t) & (ct <= min(cut_t + 0.8, s1))
@@ -0,0 +1,111 @@
+"""Server-Sent Events helpers shared by the streaming routes."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterable, AsyncIterator, Mapping
+from typing import Any
+
+import orjson
+from starlette.background import BackgroundTask
+from starlette.responses import StreamingResponse
+
+SSE_PING_INTERVAL_S = 15.0
+_PING_FRAME = b": ping\n\n"
+_STREAM_END = object()
+
+
+def sse_data(payload: Any) -> bytes:
+    """Encode *payload* as a single ``data:`` SSE frame.
+
+    orjson serializes straight to bytes, which Starlette streams as-is, so
+    high-frequency progress events skip the pure-Python encoder.
+    """
+    return b"data: " + orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS) + b"\n\n"
+
+
+async def _with_pings(
+    content: AsyncIterable[bytes | str],
+    interval: float,
+) -> AsyncIterator[bytes | str]:
+    """Relay *content*, emitting an SSE comment whenever it is idle too long.
+
+    The source is drained by a single pump task so generators that hold
+    locks or cancel scopes across ``yield`` always resume in the same task.
+    """
+    queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=1)
+
+    async def _pump() -> None:
+        try:
+            async for chunk in content:
+                await queue.put(chunk)
+        except asyncio.CancelledError:
+            raise
+        except Exception as exc:  # re-raised by the consumer
+            await queue.put(exc)
+            return
+        finally:
+            aclose = getattr(content, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        await queue.put(_STREAM_END)
+
+    pump = asyncio.create_task(_pump())
+    try:
+        while True:
+            try:
+                item = await asyncio.wait_for(queue.get(), timeout=interval)
+            except asyncio.TimeoutError:
+                yield _PING_FRAME
+                continue
+            if item is _STREAM_END:
+                return
+            if isinstance(item, Exception):
+                raise item
+            yield item
+    finally:
+        if not pump.done():
+            pump.cancel()
+            try:
+                await pump
+            except asyncio.CancelledError:
+                pass
+
+
+class EventSourceResponse(StreamingResponse):
+    """``text/event-stream`` response with keep-alive pings.
+
+    Sets the no-cache / keep-alive headers every SSE route used to spell out,
+    plus ``X-Accel-Buffering: no`` so nginx forwards frames immediately, and
+    interleaves ``: ping`` comments during long silences (e.g. a slow
+    indexing step) so idle proxies do not drop the connection. Comment frames
+    carry no ``data:`` line and are ignored by the frontend SSE reader.
+    """
+
+    media_type = "text/event-stream"
+
+    def __init__(
+        self,
+        content: AsyncIterable[bytes | str],
+        *,
+        ping: float | None = SSE_PING_INTERVAL_S,
+        status_code: int = 200,
+        headers: Mapping[str, str] | None = None,
+        background: BackgroundTask | None = None,
+    ) -> None:
+        merged_headers = {
+            "Cache-Control": "no-cache",
+            "Connection": "keep-alive",
+            "X-Accel-Buffering": "no",
+        }
+        if headers:
+            merged_headers.update(headers)
+        if ping:
+            content = _with_pings(content, ping)
+        super().__init__(
+            content,
+            status_code=status_code,
+            headers=merged_headers,
+            media_type=self.media_type,
+            background=background,
+        )
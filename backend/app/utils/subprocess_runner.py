@@ -98,12 +98,14 @@ async def run_command(
     )
 
     try:
-        communicate_task = process.communicate()
+        # Drain both pipes and wait in one gather; there is no stdin to feed,
+        # so communicate()'s extra plumbing buys nothing here.
+        collect = asyncio.gather(process.stdout.read(), process.stderr.read(), process.wait())
         if timeout_seconds is None:
-            stdout, stderr = await communicate_task
+            stdout, stderr, returncode = await collect
         else:
-            stdout, stderr = await asyncio.wait_for(communicate_task, timeout=timeout_seconds)
-        return CommandResult(returncode=process.returncode or 0, stdout=stdout, stderr=stderr)
+            stdout, stderr, returncode = await asyncio.wait_for(collect, timeout=timeout_seconds)
+        return CommandResult(returncode=returncode or 0, stdout=stdout, stderr=stderr)
     except asyncio.TimeoutError as exc:
         await terminate_process(process)
         raise CommandTimeoutError(
@@ -0,0 +1,1021 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from app.config import settings
+from app.library_types import LibraryType
+from app.services import anime_library
+from app.services.anime_library import AnimeLibraryService, SourceMediaProbe
+
+
+@pytest.fixture(autouse=True)
+def _isolated_library(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(settings, "anime_library_path", tmp_path / "library")
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "cache")
+    monkeypatch.setattr(AnimeLibraryService, "_probe_cache", {})
+    monkeypatch.setattr(AnimeLibraryService, "_probe_cache_loaded", False)
+    monkeypatch.setattr(AnimeLibraryService, "_probe_cache_dirty", False)
+    monkeypatch.setattr(AnimeLibraryService, "_episode_manifest_cache", {})
+    monkeypatch.setattr(AnimeLibraryService, "_episode_manifest_mtimes", {})
+    monkeypatch.setattr(AnimeLibraryService, "_index_metadata_cache", {})
+    monkeypatch.setattr(AnimeLibraryService, "_indexed_anime_cache", {})
+    monkeypatch.setattr(AnimeLibraryService, "_indexed_anime_locks", {})
+
+
+def _touch(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"")
+    return path
+
+
+def test_iter_video_files_filters_and_resolves(tmp_path: Path) -> None:
+    root = tmp_path / "root"
+    kept = _touch(root / "Show" / "Season 1" / "Ep 01.mp4")
+    upper = _touch(root / "Show" / "Ep 02.MP4")
+    _touch(root / "Show" / "Ep 03.mkv")
+    _touch(root / "Show" / "Ep 04.import.tmp.mp4")
+    _touch(root / "Show" / "Ep 05.Normalize.tmp.mp4")
+    _touch(root / "Show" / "noext")
+    outside = _touch(tmp_path / "elsewhere" / "Linked.mp4")
+    (root / "Show" / "Link.mp4").symlink_to(outside)
+    (root / "Show" / "Broken.mp4").symlink_to(tmp_path / "missing.mp4")
+    (root / "Loop").symlink_to(root, target_is_directory=True)
+
+    found = sorted(AnimeLibraryService._iter_video_files(str(root)))
+
+    assert found == sorted(
+        [
+            (str(kept.resolve()), "Ep 01"),
+            (str(upper.resolve()), "Ep 02"),
+            (str(outside.resolve()), "Link"),
+        ]
+    )
+
+
+def test_iter_video_files_missing_root(tmp_path: Path) -> None:
+    assert list(AnimeLibraryService._iter_video_files(str(tmp_path / "nope"))) == []
+
+
+def test_scan_library_episodes_builds_stem_index() -> None:
+    library_path = AnimeLibraryService.get_library_path(LibraryType.ANIME)
+    episode = _touch(library_path / "Show" / "Show - 01.mp4")
+
+    manifest = AnimeLibraryService._scan_library_episodes_sync(LibraryType.ANIME)
+
+    resolved = str(episode.resolve())
+    assert manifest["episodes"] == [resolved]
+    assert manifest["by_stem"] == {"show - 01": [resolved]}
+    assert AnimeLibraryService.get_episode_manifest_path(LibraryType.ANIME).exists()
+
+
+def test_concurrent_scan_matches_serial_walk(tmp_path: Path) -> None:
+    root = tmp_path / "root"
+    for season in range(3):
+        for episode in range(4):
+            _touch(root / "Show" / f"S{season}" / "extras" / f"E{episode}.mp4")
+            _touch(root / "Show" / f"S{season}" / f"E{episode}.mp4")
+    _touch(root / "Show" / "notes.txt")
+
+    serial = sorted(AnimeLibraryService._iter_video_files(str(root)))
+    concurrent = sorted(AnimeLibraryService._concurrent_scan(str(root), max_workers=4))
+
+    assert len(serial) == 24
+    assert concurrent == serial
+
+
+def test_scan_library_episodes_uses_concurrent_scan_when_configured(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "anime_library_scan_max_workers", 4)
+    library_path = AnimeLibraryService.get_library_path(LibraryType.ANIME)
+    _touch(library_path / "Show" / "A.mp4")
+    _touch(library_path / "Other" / "B.mp4")
+
+    manifest = AnimeLibraryService._scan_library_episodes_sync(LibraryType.ANIME)
+
+    assert [Path(p).name for p in manifest["episodes"]] == ["B.mp4", "A.mp4"]
+
+
+def test_probe_video_stream_is_cached_until_file_changes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    video = _touch(tmp_path / "episode.mp4")
+    os.utime(video, ns=(1_000_000_000, 1_000_000_000))
+    calls: list[Path] = []
+
+    def fake_probe(path: Path) -> dict:
+        calls.append(path)
+        return {"codec_name": "h264", "pix_fmt": "yuv420p"}
+
+    monkeypatch.setattr(
+        AnimeLibraryService, "_run_video_stream_probe_sync", staticmethod(fake_probe)
+    )
+
+    assert AnimeLibraryService.is_browser_preview_compatible(video)
+    assert AnimeLibraryService.get_primary_video_codec_sync(video) == "h264"
+    assert len(calls) == 1
+
+    os.utime(video, ns=(2_000_000_000, 2_000_000_000))
+    AnimeLibraryService.get_primary_video_codec_sync(video)
+    assert len(calls) == 2
+
+
+def test_probe_cache_round_trips_through_disk(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    video = _touch(tmp_path / "episode.mp4")
+    monkeypatch.setattr(
+        AnimeLibraryService,
+        "_run_video_stream_probe_sync",
+        staticmethod(lambda path: {"codec_name": "av1"}),
+    )
+    AnimeLibraryService.get_primary_video_codec_sync(video)
+    AnimeLibraryService._flush_probe_cache_sync()
+    assert AnimeLibraryService.get_probe_cache_path().exists()
+
+    monkeypatch.setattr(AnimeLibraryService, "_probe_cache", {})
+    monkeypatch.setattr(AnimeLibraryService, "_probe_cache_loaded", False)
+    monkeypatch.setattr(
+        AnimeLibraryService,
+        "_run_video_stream_probe_sync",
+        staticmethod(lambda path: pytest.fail("probe should come from disk cache")),
+    )
+    assert AnimeLibraryService.get_primary_video_codec_sync(video) == "av1"
+
+
+def test_scan_source_video_paths_probes_each_unique_file_once(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    readable = _touch(tmp_path / "src" / "a.mkv")
+    unreadable = _touch(tmp_path / "src" / "b.mkv")
+    probed: list[Path] = []
+
+    def fake_probe(path: Path) -> SourceMediaProbe | None:
+        probed.append(path)
+        if path == unreadable:
+            return None
+        return SourceMediaProbe(
+            source_path=path,
+            container_suffix=path.suffix,
+            format_name="matroska",
+            video_codec="h264",
+            audio_codec=None,
+            pix_fmt="yuv420p",
+            fps=24.0,
+            duration=10.0,
+            has_audio=False,
+        )
+
+    monkeypatch.setattr(AnimeLibraryService, "_probe_media_sync", staticmethod(fake_probe))
+
+    scan = AnimeLibraryService._scan_source_video_paths_sync(
+        [readable, unreadable, readable]
+    )
+
+    assert sorted(probed) == [readable, unreadable]
+    assert scan.readable_files == (readable,)
+    assert scan.invalid_files == (unreadable,)
+    assert scan.probes[readable].video_codec == "h264"
+
+
+def test_preview_proxy_key_tracks_file_content(tmp_path: Path) -> None:
+    video = _touch(tmp_path / "episode.mkv")
+    os.utime(video, ns=(1_000_000_000, 1_000_000_000))
+
+    key = AnimeLibraryService._build_preview_proxy_key(video)
+    assert len(key) == 40
+    assert AnimeLibraryService._build_preview_proxy_key(video) == key
+
+    video.write_bytes(b"changed")
+    os.utime(video, ns=(1_000_000_000, 1_000_000_000))
+    assert AnimeLibraryService._build_preview_proxy_key(video) != key
+
+
+def test_load_episode_manifest_reparses_only_after_file_changes() -> None:
+    library_path = AnimeLibraryService.get_library_path(LibraryType.ANIME)
+    _touch(library_path / "Show" / "Show - 01.mp4")
+    scanned = AnimeLibraryService._scan_library_episodes_sync(LibraryType.ANIME)
+    manifest_path = AnimeLibraryService.get_episode_manifest_path(LibraryType.ANIME)
+
+    assert AnimeLibraryService._load_episode_manifest_sync(LibraryType.ANIME) is scanned
+    assert json.loads(manifest_path.read_text())["episodes"] == scanned["episodes"]
+
+    manifest_path.write_text(json.dumps({"episodes": ["/x.mp4"], "by_stem": {}}))
+    os.utime(manifest_path, ns=(1, 1))
+    reloaded = AnimeLibraryService._load_episode_manifest_sync(LibraryType.ANIME)
+    assert reloaded is not scanned
+    assert reloaded["episodes"] == ["/x.mp4"]
+    assert AnimeLibraryService._load_episode_manifest_sync(LibraryType.ANIME) is reloaded
+
+
+def test_refresh_series_rescans_only_that_series() -> None:
+    library_path = AnimeLibraryService.get_library_path(LibraryType.ANIME)
+    other = _touch(library_path / "Other" / "Other - 01.mp4")
+    old = _touch(library_path / "Show" / "Show - 01.mp4")
+    AnimeLibraryService._scan_library_episodes_sync(LibraryType.ANIME)
+
+    old.unlink()
+    new = _touch(library_path / "Show" / "Show - 02.mp4")
+    _touch(library_path / "Other" / "Other - 02.mp4")
+
+    manifest = asyncio.run(AnimeLibraryService.refresh_series("Show", LibraryType.ANIME))
+
+    assert manifest["episodes"] == sorted(
+        [str(other.resolve()), str(new.resolve())]
+    )
+    assert "Show - 01" not in manifest["by_stem"]
+    assert manifest["by_stem"]["show - 02"] == [str(new.resolve())]
+    assert "Other - 02" not in manifest["by_stem"]
+    assert AnimeLibraryService._load_episode_manifest_sync(LibraryType.ANIME) is manifest
+
+
+def test_refresh_series_drops_stale_symlinked_episodes(tmp_path: Path) -> None:
+    library_path = AnimeLibraryService.get_library_path(LibraryType.ANIME)
+    other = _touch(library_path / "Other" / "Other - 01.mp4")
+    target = _touch(tmp_path / "elsewhere" / "Show - 01.mp4")
+    link = library_path / "Show" / "Show - 01.mp4"
+    link.parent.mkdir(parents=True)
+    link.symlink_to(target)
+    manifest = AnimeLibraryService._scan_library_episodes_sync(LibraryType.ANIME)
+    assert str(target.resolve()) in manifest["episodes"]
+
+    link.unlink()
+    new = _touch(library_path / "Show" / "Show - 02.mp4")
+
+    manifest = asyncio.run(AnimeLibraryService.refresh_series("Show", LibraryType.ANIME))
+
+    assert manifest["episodes"] == sorted([str(other.resolve()), str(new.resolve())])
+    assert "show - 01" not in manifest["by_stem"]
+
+
+def test_refresh_series_without_manifest_does_full_scan() -> None:
+    library_path = AnimeLibraryService.get_library_path(LibraryType.ANIME)
+    other = _touch(library_path / "Other" / "Other - 01.mp4")
+
+    manifest = asyncio.run(AnimeLibraryService.refresh_series("Show", LibraryType.ANIME))
+
+    assert manifest["episodes"] == [str(other.resolve())]
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("Ep 01.mkv", True),
+        ("Ep 01.MP4", True),
+        ("Ep.01.m4v", True),
+        ("Ep 01.import.tmp.mp4", False),
+        ("Ep 01.NORMALIZE.TMP.mkv", False),
+        ("Ep 01.srt", False),
+        ("mkv", False),
+    ],
+)
+def test_is_library_video_name(name: str, expected: bool) -> None:
+    assert AnimeLibraryService._is_library_video_name(name) is expected
+    assert AnimeLibraryService.is_transient_library_video_path(Path(name)) is (
+        ".tmp." in name.lower()
+    )
+
+
+def test_memoized_paths_follow_settings_changes(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    first = AnimeLibraryService.get_library_path("simpsons")
+    assert first == tmp_path / "library" / "simpsons"
+    assert AnimeLibraryService.get_library_path(LibraryType.SIMPSONS) == first
+
+    monkeypatch.setattr(settings, "anime_library_path", tmp_path / "other")
+    monkeypatch.setattr(settings, "cache_dir", tmp_path / "other-cache")
+
+    assert AnimeLibraryService.get_library_path("simpsons") == tmp_path / "other" / "simpsons"
+    assert AnimeLibraryService.get_episode_manifest_path() == (
+        tmp_path / "other-cache" / "episodes_manifest__anime.json"
+    )
+
+
+def test_list_episode_paths_trusts_fresh_manifest_only() -> None:
+    fresh = {
+        "generated_at": datetime.now(timezone.utc).isoformat(),
+        "episodes": ["/missing/a.mp4"],
+        "by_stem": {},
+    }
+    stale = {
+        "generated_at": (datetime.now(timezone.utc) - timedelta(hours=1)).isoformat(),
+        "episodes": ["/missing/a.mp4"],
+        "by_stem": {},
+    }
+
+    assert AnimeLibraryService.list_episode_paths(fresh) == ["/missing/a.mp4"]
+    assert AnimeLibraryService.list_episode_paths(stale) == []
+    assert AnimeLibraryService.list_episode_paths({"episodes": ["/missing/a.mp4"]}) == []
+
+
+def test_resolve_episode_path_lookup_order(tmp_path: Path) -> None:
+    library_path = AnimeLibraryService.get_library_path(LibraryType.ANIME)
+    episode = _touch(library_path / "Show" / "Show - 01.mp4")
+    manifest = AnimeLibraryService._scan_library_episodes_sync(LibraryType.ANIME)
+    resolved = episode.resolve()
+
+    assert AnimeLibraryService.resolve_episode_path(str(episode)) == episode
+    assert AnimeLibraryService.resolve_episode_path("Show/Show - 01.mp4") == resolved
+    assert AnimeLibraryService.resolve_episode_path("show - 01", manifest) == resolved
+    assert AnimeLibraryService.resolve_episode_path("Other/Show - 01.mkv", manifest) == resolved
+    assert AnimeLibraryService.resolve_episode_path("Show - 02.mp4", manifest) is None
+    assert AnimeLibraryService.resolve_episode_path(str(tmp_path / "x.mp4"), manifest) is None
+
+
+def _collect_prepare_progress(
+    video_files: list[Path],
+    dest_dir: Path,
+) -> tuple[list[Path], list[str]]:
+    prepared: list[Path] = []
+
+    async def run() -> list[str]:
+        return [
+            progress.message
+            async for progress in AnimeLibraryService._prepare_sources_for_library(
+                video_files=video_files,
+                dest_dir=dest_dir,
+                probes={},
+                anime_name="Show",
+                prepared_files=prepared,
+            )
+        ]
+
+    return prepared, asyncio.run(run())
+
+
+def test_prepare_sources_runs_concurrently_and_keeps_source_order(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    sources = [tmp_path / f"Ep {n}.mkv" for n in range(4)] + [tmp_path / "ep 0.mp4"]
+    active: dict[str, int] = {"now": 0, "peak": 0}
+    same_stem_overlap: list[str] = []
+    running_stems: set[str] = set()
+
+    async def fake_prepare(cls, *, source_path, dest_dir, source_probe=None, slots=None):
+        stem = source_path.stem.lower()
+        if stem in running_stems:
+            same_stem_overlap.append(stem)
+        running_stems.add(stem)
+        active["now"] += 1
+        active["peak"] = max(active["peak"], active["now"])
+        await asyncio.sleep(0.01 * (5 - len(source_path.stem)))
+        active["now"] -= 1
+        running_stems.discard(stem)
+        return dest_dir / f"{source_path.stem}.{source_path.suffix[1:]}.mp4", "Copying", True
+
+    monkeypatch.setattr(
+        AnimeLibraryService, "_prepare_single_source_for_library", classmethod(fake_prepare)
+    )
+
+    prepared, messages = _collect_prepare_progress(sources, tmp_path / "dest")
+
+    assert prepared == [
+        tmp_path / "dest" / f"{source.stem}.{source.suffix[1:]}.mp4" for source in sources
+    ]
+    assert active["peak"] > 1
+    assert same_stem_overlap == []
+    assert sum(message.startswith("Copying") for message in messages) == len(sources)
+
+
+def test_prepare_sources_propagates_first_failure(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    async def fake_prepare(cls, *, source_path, dest_dir, source_probe=None, slots=None):
+        if source_path.name == "bad.mkv":
+            raise RuntimeError("Source file is unreadable: bad.mkv")
+        await asyncio.sleep(0.05)
+        return dest_dir / source_path.name, "Copying", True
+
+    monkeypatch.setattr(
+        AnimeLibraryService, "_prepare_single_source_for_library", classmethod(fake_prepare)
+    )
+
+    with pytest.raises(RuntimeError, match="bad.mkv"):
+        _collect_prepare_progress([tmp_path / "good.mkv", tmp_path / "bad.mkv"], tmp_path)
+
+
+def test_cancelled_copy_waits_for_thread_and_removes_tmp(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    source = _touch(tmp_path / "src" / "Ep 01.mp4")
+    dest_dir = tmp_path / "library" / "Show"
+    dest_dir.mkdir(parents=True)
+    probe = SourceMediaProbe(
+        source_path=source,
+        container_suffix=".mp4",
+        format_name="mov,mp4,m4a,3gp,3g2,mj2",
+        video_codec="h264",
+        audio_codec=None,
+        pix_fmt="yuv420p",
+        fps=24.0,
+        duration=10.0,
+        has_audio=False,
+    )
+    started = threading.Event()
+    release = threading.Event()
+    finished = threading.Event()
+
+    def slow_copy(source_path: Path, dest_path: Path) -> bool:
+        dest_path.write_bytes(b"partial")
+        started.set()
+        release.wait(5)
+        dest_path.write_bytes(b"partial, then more")
+        finished.set()
+        return False
+
+    monkeypatch.setattr(AnimeLibraryService, "_link_or_copy_sync", staticmethod(slow_copy))
+
+    async def run() -> None:
+        task = asyncio.create_task(
+            AnimeLibraryService._prepare_single_source_for_library(
+                source_path=source,
+                dest_dir=dest_dir,
+                source_probe=probe,
+            )
+        )
+        assert await asyncio.to_thread(started.wait, 5)
+        task.cancel()
+        await asyncio.sleep(0.05)
+        assert not task.done()
+        release.set()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(run())
+
+    assert finished.is_set()
+    assert list(dest_dir.iterdir()) == []
+
+
+def test_link_or_copy_links_on_same_device_and_copies_over_existing(tmp_path: Path) -> None:
+    source = tmp_path / "src" / "Ep 01.mp4"
+    _touch(source).write_bytes(b"video")
+    dest_dir = tmp_path / "library"
+    dest_dir.mkdir()
+
+    linked = dest_dir / "Ep 01.mp4"
+    AnimeLibraryService._link_or_copy_sync(source, linked)
+    assert linked.read_bytes() == b"video"
+    assert os.path.samefile(source, linked)
+
+    existing = dest_dir / "Ep 02.mp4"
+    existing.write_bytes(b"old")
+    AnimeLibraryService._link_or_copy_sync(source, existing)
+    assert existing.read_bytes() == b"video"
+    assert not os.path.samefile(source, existing)
+
+
+def test_link_or_copy_respects_hardlink_setting(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "anime_library_hardlink", False)
+    monkeypatch.setattr(AnimeLibraryService, "_reflink_sync", staticmethod(lambda *_: False))
+    source = _touch(tmp_path / "Ep 01.mp4")
+    source.write_bytes(b"video")
+    dest = tmp_path / "library" / "Ep 01.mp4"
+    dest.parent.mkdir()
+
+    assert AnimeLibraryService._link_or_copy_sync(source, dest) is False
+    assert dest.read_bytes() == b"video"
+    assert not os.path.samefile(source, dest)
+
+    monkeypatch.setattr(settings, "anime_library_hardlink", True)
+    relinked = dest.with_name("Ep 02.mp4")
+    assert AnimeLibraryService._link_or_copy_sync(source, relinked) is True
+    assert os.path.samefile(source, relinked)
+
+
+@pytest.mark.parametrize(
+    "refused",
+    [(), ("copy_file_range",), ("copy_file_range", "sendfile")],
+)
+def test_fast_copy_copies_bytes_and_metadata(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+    refused: tuple[str, ...],
+) -> None:
+    def _refuse(*_args, **_kwargs):
+        raise OSError(anime_library.errno.EXDEV, "cross-device")
+
+    for name in refused:
+        monkeypatch.setattr(anime_library.os, name, _refuse, raising=False)
+    kernel_copy = len(refused) < 2
+    monkeypatch.setattr(AnimeLibraryService, "FAST_COPY_BUFSIZE", 7)
+    monkeypatch.setattr(AnimeLibraryService, "FAST_COPY_SENDFILE_CHUNK", 100)
+    source = tmp_path / "Ep 01.mp4"
+    payload = bytes(range(256)) * 5
+    source.write_bytes(payload)
+    os.utime(source, ns=(1_000_000_000, 1_000_000_000))
+    dest = tmp_path / "copy.mp4"
+    dest.write_bytes(b"stale contents that are longer than nothing" * 100)
+
+    AnimeLibraryService._fast_copy(source, dest)
+
+    assert dest.read_bytes() == payload
+    assert dest.stat().st_mtime_ns == 1_000_000_000
+
+    if not kernel_copy:
+        buffer = AnimeLibraryService._fast_copy_buffer()
+        AnimeLibraryService._fast_copy(source, tmp_path / "again.mp4")
+        assert AnimeLibraryService._fast_copy_buffer() is buffer
+        assert (tmp_path / "again.mp4").read_bytes() == payload
+
+
+def test_preview_proxy_validation_uses_single_probe(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    proxy = tmp_path / "proxy.mp4"
+    proxy.write_bytes(b"data")
+    calls: list[Path] = []
+
+    def fake_probe(path: Path) -> dict:
+        calls.append(path)
+        return {"codec_name": "h264", "pix_fmt": "yuv420p", "format_duration": "12.5"}
+
+    monkeypatch.setattr(
+        AnimeLibraryService, "_run_video_stream_probe_sync", staticmethod(fake_probe)
+    )
+    monkeypatch.setattr(
+        AnimeLibraryService,
+        "_probe_video_duration_sync",
+        staticmethod(lambda path: pytest.fail("duration should come from the stream probe")),
+    )
+
+    assert AnimeLibraryService._is_valid_preview_proxy_sync(proxy)
+    assert calls == [proxy]
+
+
+class _FakeContainer:
+    def __init__(self, codec_name: str | None, pix_fmt: str | None) -> None:
+        codec = SimpleNamespace(canonical_name=codec_name)
+        codec_context = SimpleNamespace(codec=codec, name="decoder", pix_fmt=pix_fmt)
+        self.streams = SimpleNamespace(video=[SimpleNamespace(codec_context=codec_context)])
+        self.duration = 90_500_000
+
+    def __enter__(self) -> "_FakeContainer":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        return None
+
+
+def test_video_stream_probe_prefers_pyav_and_falls_back_to_ffprobe(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    video = tmp_path / "episode.mkv"
+    containers = {"good": _FakeContainer("av1", "yuv420p10le"), "bad": _FakeContainer("h264", None)}
+    current = {"name": "good"}
+    fake_av = SimpleNamespace(open=lambda path: containers[current["name"]])
+    monkeypatch.setattr(anime_library, "av", fake_av)
+    ffprobe_calls: list[Path] = []
+    monkeypatch.setattr(
+        AnimeLibraryService,
+        "_ffprobe_video_stream_probe_sync",
+        staticmethod(lambda path: ffprobe_calls.append(path) or {"codec_name": "h264"}),
+    )
+
+    assert AnimeLibraryService._run_video_stream_probe_sync(video) == {
+        "codec_name": "av1",
+        "pix_fmt": "yuv420p10le",
+        "format_duration": "90.5",
+    }
+    assert ffprobe_calls == []
+
+    current["name"] = "bad"
+    assert AnimeLibraryService._run_video_stream_probe_sync(video) == {"codec_name": "h264"}
+
+    monkeypatch.setattr(settings, "pyav_probe_enabled", False)
+    current["name"] = "good"
+    AnimeLibraryService._run_video_stream_probe_sync(video)
+    assert ffprobe_calls == [video, video]
+
+
+def test_wait_for_preview_proxy_wakes_on_in_process_commit(tmp_path: Path) -> None:
+    source = _touch(tmp_path / "episode.mkv")
+
+    async def run() -> tuple[Path | None, float]:
+        loop = asyncio.get_running_loop()
+        proxy_path = AnimeLibraryService.get_preview_proxy_path(source)
+        started = loop.time()
+        waiter = asyncio.create_task(
+            AnimeLibraryService.wait_for_preview_proxy(
+                source,
+                timeout_seconds=5.0,
+                poll_interval_seconds=5.0,
+            )
+        )
+        await asyncio.sleep(0.05)
+        _touch(proxy_path).write_bytes(b"proxy")
+        await asyncio.to_thread(AnimeLibraryService._notify_preview_proxy_ready, proxy_path)
+        result = await waiter
+        return result, loop.time() - started
+
+    result, elapsed = asyncio.run(run())
+
+    assert result == AnimeLibraryService.get_preview_proxy_path(source)
+    assert elapsed < 1.0
+    assert AnimeLibraryService._preview_proxy_waiters == {}
+
+
+def test_wait_for_preview_proxy_times_out(tmp_path: Path) -> None:
+    source = _touch(tmp_path / "episode.mkv")
+
+    result = asyncio.run(
+        AnimeLibraryService.wait_for_preview_proxy(
+            source,
+            timeout_seconds=0.1,
+            poll_interval_seconds=0.05,
+        )
+    )
+
+    assert result is None
+    assert AnimeLibraryService._preview_proxy_waiters == {}
+
+
+def test_trigger_preview_proxy_generation_shares_inflight_future(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    source = _touch(tmp_path / "episode.mkv")
+    proxy = tmp_path / "proxy.mp4"
+    calls: list[Path] = []
+    release = threading.Event()
+
+    def fake_ensure(path: Path) -> Path:
+        calls.append(path)
+        release.wait(5)
+        return proxy
+
+    monkeypatch.setattr(AnimeLibraryService, "ensure_preview_proxy_sync", staticmethod(fake_ensure))
+
+    async def run() -> tuple[Path | None, Path, Path | None]:
+        first = await AnimeLibraryService.trigger_preview_proxy_generation(source)
+        second = await AnimeLibraryService.trigger_preview_proxy_generation(source)
+        assert first is second
+        waiter = asyncio.create_task(
+            AnimeLibraryService.wait_for_preview_proxy(source, timeout_seconds=5.0)
+        )
+        resolver = asyncio.create_task(AnimeLibraryService.resolve_source_preview_path(source))
+        await asyncio.sleep(0.05)
+        release.set()
+        return await waiter, await resolver, await first
+
+    waited, resolved, generated = asyncio.run(run())
+
+    assert calls == [source]
+    assert waited == resolved == generated == proxy
+    assert AnimeLibraryService._preview_generation_futures == {}
+
+
+@pytest.mark.parametrize(
+    ("codec", "decoder_args"),
+    [
+        ("AV1", ["-c:v", "av1_cuvid"]),
+        ("h264", ["-c:v", "h264_cuvid"]),
+        ("hevc", ["-c:v", "hevc_cuvid"]),
+        ("vp9", []),
+        (None, []),
+    ],
+)
+def test_build_gpu_h264_base_cmd(codec: str | None, decoder_args: list[str]) -> None:
+    cmd = AnimeLibraryService._build_gpu_h264_base_cmd(Path("/in.mkv"), source_codec=codec)
+
+    assert cmd == [
+        "ffmpeg", "-y", "-hwaccel", "cuda", "-hwaccel_output_format", "cuda",
+        *decoder_args,
+        "-i", "/in.mkv",
+        "-map", "0:v:0", "-vf", "scale_cuda=format=nv12", "-c:v", "h264_nvenc",
+        "-preset", "p5", "-rc", "constqp", "-qp", "23", "-b:v", "0",
+        "-profile:v", "high", "-movflags", "+faststart",
+    ]
+    cmd.append("mutated")
+    assert "mutated" not in AnimeLibraryService._build_gpu_h264_base_cmd(
+        Path("/in.mkv"), source_codec=codec
+    )
+
+
+def test_resolve_episode_path_prefers_exact_case_within_folded_bucket() -> None:
+    library_path = AnimeLibraryService.get_library_path(LibraryType.ANIME)
+    lower = _touch(library_path / "A" / "ep 01.mp4")
+    upper = _touch(library_path / "B" / "EP 01.mp4")
+    manifest = AnimeLibraryService._scan_library_episodes_sync(LibraryType.ANIME)
+
+    assert manifest["by_stem"] == {
+        "ep 01": [str(lower.resolve()), str(upper.resolve())]
+    }
+    assert AnimeLibraryService.resolve_episode_path("EP 01", manifest) == upper.resolve()
+    assert AnimeLibraryService.resolve_episode_path("Ep 01", manifest) == lower.resolve()
+
+
+def test_manifest_write_is_atomic(monkeypatch: pytest.MonkeyPatch) -> None:
+    library_path = AnimeLibraryService.get_library_path(LibraryType.ANIME)
+    _touch(library_path / "Show" / "Show - 01.mp4")
+    AnimeLibraryService._scan_library_episodes_sync(LibraryType.ANIME)
+    manifest_path = AnimeLibraryService.get_episode_manifest_path(LibraryType.ANIME)
+    before = manifest_path.read_bytes()
+    assert list(manifest_path.parent.glob("*.tmp")) == []
+
+    def fail_replace(self: Path, target: Path) -> None:
+        raise OSError("disk full")
+
+    monkeypatch.setattr(Path, "replace", fail_replace)
+    _touch(library_path / "Show" / "Show - 02.mp4")
+    with pytest.raises(OSError):
+        AnimeLibraryService._scan_library_episodes_sync(LibraryType.ANIME)
+
+    assert manifest_path.read_bytes() == before
+
+
+def test_iter_video_files_can_keep_symlink_paths(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    root = tmp_path / "root"
+    target = _touch(tmp_path / "elsewhere" / "Target.mp4")
+    link = root / "Show" / "Link.mp4"
+    link.parent.mkdir(parents=True)
+    link.symlink_to(target)
+
+    assert list(AnimeLibraryService._iter_video_files(str(root))) == [
+        (str(target.resolve()), "Link")
+    ]
+    monkeypatch.setattr(settings, "anime_library_resolve_symlinks", False)
+    assert list(AnimeLibraryService._iter_video_files(str(root))) == [
+        (str(root.resolve() / "Show" / "Link.mp4"), "Link")
+    ]
+
+
+def test_indexed_series_fps_reuses_manifest_parse_until_it_changes() -> None:
+    index_dir = AnimeLibraryService.get_library_path(None) / AnimeLibraryService.INDEX_DIR_NAME
+    index_dir.mkdir(parents=True)
+    manifest_path = index_dir / AnimeLibraryService.MANIFEST_FILE
+
+    def write_manifest(fps: float, mtime_ns: int) -> None:
+        manifest_path.write_text(
+            json.dumps(
+                {
+                    "version": AnimeLibraryService.SEARCHER_INDEX_FORMAT_VERSION,
+                    "engine_profile": AnimeLibraryService.SEARCHER_ENGINE_PROFILE,
+                    "config": {"default_fps": 24.0},
+                    "series": {"Show": {"fps": fps}, "Other": {}},
+                }
+            )
+        )
+        os.utime(manifest_path, ns=(mtime_ns, mtime_ns))
+
+    write_manifest(23.976, mtime_ns=1_000_000_000)
+    assert AnimeLibraryService._get_indexed_series_fps_sync("Show") == 23.976
+    first = AnimeLibraryService._index_metadata_cache[manifest_path][1]
+    assert AnimeLibraryService._get_indexed_series_fps_sync("Other") == 24.0
+    assert AnimeLibraryService._index_metadata_cache[manifest_path][1] is first
+
+    write_manifest(30.0, mtime_ns=2_000_000_000)
+    assert AnimeLibraryService._get_indexed_series_fps_sync("Show") == 30.0
+
+    manifest_path.unlink()
+    assert AnimeLibraryService._get_indexed_series_fps_sync("Show") is None
+    with pytest.raises(OSError):
+        AnimeLibraryService._load_json_cached(manifest_path)
+    assert manifest_path not in AnimeLibraryService._index_metadata_cache
+
+
+def test_source_folder_listings_use_scandir_entries(tmp_path: Path) -> None:
+    source = tmp_path / "source"
+    _touch(source / "Show A" / "Ep 01.mp4")
+    _touch(source / ".hidden" / "Ep 01.mp4")
+    (source / "Linked Show").symlink_to(source / "Show A", target_is_directory=True)
+    _touch(source / "loose.mp4")
+
+    assert asyncio.run(AnimeLibraryService.get_available_folders(source)) == [
+        "Linked Show",
+        "Show A",
+    ]
+    assert asyncio.run(AnimeLibraryService.get_available_folders(tmp_path / "missing")) == []
+
+    _touch(source / "Show A" / "Ep 02.MP4")
+    _touch(source / "Show A" / "Ep 03.import.tmp.mp4")
+    (source / "Show A" / "Dir.mp4").mkdir()
+    assert AnimeLibraryService._list_direct_video_files_sync(source / "Show A") == [
+        source / "Show A" / "Ep 01.mp4",
+        source / "Show A" / "Ep 02.MP4",
+    ]
+
+
+def test_list_indexed_anime_reuses_cli_result_until_index_changes(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    calls: list[LibraryType] = []
+
+    async def fake_list(scoped_type: LibraryType) -> list[str]:
+        calls.append(scoped_type)
+        await asyncio.sleep(0)
+        return ["Show"]
+
+    monkeypatch.setattr(AnimeLibraryService, "_list_indexed_anime_uncached", fake_list)
+    library_path = AnimeLibraryService.get_library_path(None)
+    manifest_path = library_path / AnimeLibraryService.INDEX_DIR_NAME / AnimeLibraryService.MANIFEST_FILE
+    _touch(manifest_path)
+    os.utime(manifest_path, ns=(1_000_000_000, 1_000_000_000))
+
+    async def list_twice() -> list[list[str]]:
+        return list(
+            await asyncio.gather(
+                AnimeLibraryService.list_indexed_anime(),
+                AnimeLibraryService.list_indexed_anime(),
+            )
+        )
+
+    assert asyncio.run(list_twice()) == [["Show"], ["Show"]]
+    assert len(calls) == 1
+
+    listed = asyncio.run(AnimeLibraryService.list_indexed_anime())
+    listed.append("mutated")
+    assert asyncio.run(AnimeLibraryService.list_indexed_anime()) == ["Show"]
+    assert len(calls) == 1
+
+    os.utime(manifest_path, ns=(2_000_000_000, 2_000_000_000))
+    asyncio.run(AnimeLibraryService.list_indexed_anime())
+    assert len(calls) == 2
+
+
+def test_list_indexed_anime_uses_in_process_index_manager(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    loaded: list[Path] = []
+
+    class FakeIndexManager:
+        def __init__(self, library_path: Path) -> None:
+            self.library_path = library_path
+
+        def load_or_create(self) -> None:
+            loaded.append(self.library_path)
+
+        def get_series_list(self) -> list[str]:
+            return ["Zeta", "Alpha"]
+
+    module = SimpleNamespace(IndexManager=FakeIndexManager)
+    monkeypatch.setitem(sys.modules, "anime_searcher", SimpleNamespace())
+    monkeypatch.setitem(sys.modules, "anime_searcher.indexer", SimpleNamespace())
+    monkeypatch.setitem(sys.modules, "anime_searcher.indexer.index_manager", module)
+    monkeypatch.setattr(AnimeLibraryService, "_searcher_inprocess_unavailable", False)
+
+    async def fail_command(*_args, **_kwargs):
+        raise AssertionError("CLI should not run")
+
+    monkeypatch.setattr(anime_library, "run_command", fail_command)
+    library_path = AnimeLibraryService.get_library_path(LibraryType.ANIME)
+
+    library_path.mkdir(parents=True)
+    assert asyncio.run(AnimeLibraryService._list_indexed_anime_uncached(LibraryType.ANIME)) == []
+    assert loaded == []
+
+    _touch(library_path / AnimeLibraryService.INDEX_DIR_NAME / AnimeLibraryService.MANIFEST_FILE)
+    assert asyncio.run(
+        AnimeLibraryService._list_indexed_anime_uncached(LibraryType.ANIME)
+    ) == ["Alpha", "Zeta"]
+    assert loaded == [library_path]
+
+
+def test_purge_counts_and_removes_only_video_files() -> None:
+    library_path = AnimeLibraryService.get_library_path(LibraryType.ANIME)
+    _touch(library_path / "Show" / "Ep 01.mp4").write_bytes(b"12345")
+    _touch(library_path / "Show" / "Ep 02.MKV").write_bytes(b"123")
+    _touch(library_path / "Show" / "notes.txt").write_bytes(b"keep")
+    (library_path / "Show" / "Extras.mp4").mkdir()
+    _touch(library_path / "Empty" / "cover.jpg")
+    _touch(library_path / ".index" / "Ep 01.mp4")
+
+    assert AnimeLibraryService._estimate_purge_size_sync([LibraryType.ANIME]) == {
+        "estimated_bytes": 8,
+        "source_count": 1,
+    }
+
+    result = AnimeLibraryService._purge_library_sync([LibraryType.ANIME])
+
+    assert result["freed_bytes"] == 8
+    assert sorted(result["purged_sources"]) == ["Empty", "Show"]
+    assert sorted(path.name for path in (library_path / "Show").iterdir()) == [
+        "Extras.mp4",
+        "notes.txt",
+    ]
+    assert (library_path / ".index" / "Ep 01.mp4").exists()
+
+
+def test_purge_does_not_count_hard_linked_imports_as_freed(tmp_path: Path) -> None:
+    library_path = AnimeLibraryService.get_library_path(LibraryType.ANIME)
+    _touch(library_path / "Show" / "Ep 01.mp4").write_bytes(b"12345")
+    user_source = tmp_path / "downloads" / "Ep 02.mkv"
+    _touch(user_source).write_bytes(b"1234567")
+    os.link(user_source, library_path / "Show" / "Ep 02.mkv")
+
+    assert AnimeLibraryService._estimate_purge_size_sync([LibraryType.ANIME]) == {
+        "estimated_bytes": 5,
+        "source_count": 1,
+    }
+
+    result = AnimeLibraryService._purge_library_sync([LibraryType.ANIME])
+
+    assert result["freed_bytes"] == 5
+    assert not (library_path / "Show" / "Ep 02.mkv").exists()
+    assert user_source.read_bytes() == b"1234567"
+
+
+def test_fast_copy_resumes_after_a_partial_kernel_copy(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    real_copy_file_range = os.copy_file_range
+    calls = 0
+
+    def _copy_once_then_refuse(src_fd, dst_fd, count):
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            raise OSError(anime_library.errno.EINVAL, "unsupported")
+        return real_copy_file_range(src_fd, dst_fd, min(count, 300))
+
+    monkeypatch.setattr(anime_library.os, "copy_file_range", _copy_once_then_refuse)
+    monkeypatch.setattr(AnimeLibraryService, "FAST_COPY_SENDFILE_CHUNK", 128)
+    source = tmp_path / "Ep 01.mp4"
+    payload = bytes(range(256)) * 5
+    source.write_bytes(payload)
+
+    AnimeLibraryService._fast_copy(source, tmp_path / "copy.mp4")
+
+    assert (tmp_path / "copy.mp4").read_bytes() == payload
+
+
+def test_fast_copy_advises_sequential_read_then_drops_pages(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    advice: list[int] = []
+    monkeypatch.setattr(
+        anime_library.os,
+        "posix_fadvise",
+        lambda _fd, _offset, _length, value: advice.append(value),
+        raising=False,
+    )
+    monkeypatch.setattr(anime_library.os, "POSIX_FADV_SEQUENTIAL", 2, raising=False)
+    monkeypatch.setattr(anime_library.os, "POSIX_FADV_DONTNEED", 4, raising=False)
+    source = tmp_path / "Ep 01.mp4"
+    source.write_bytes(b"video")
+
+    AnimeLibraryService._fast_copy(source, tmp_path / "copy.mp4")
+
+    assert advice == [2, 4, 4]
+    assert (tmp_path / "copy.mp4").read_bytes() == b"video"
+
+
+def test_source_match_rejects_stale_manifest_before_probing(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    probed: list[Path] = []
+
+    def fake_probe(path: Path):
+        probed.append(path)
+        return None
+
+    monkeypatch.setattr(AnimeLibraryService, "_probe_media_sync", staticmethod(fake_probe))
+    source = _touch(tmp_path / "src" / "Ep 01.mp4")
+    source.write_bytes(b"video")
+    prepared = _touch(tmp_path / "library" / "Ep 01.mp4")
+    prepared.write_bytes(b"vid")
+
+    assert AnimeLibraryService._source_matches_prepared_sync(source, prepared) is False
+    assert probed == []
+
+    AnimeLibraryService.get_source_import_manifest_path(prepared).write_text(
+        json.dumps(
+            {
+                "source_path": str(source.resolve()),
+                "source_size": 999,
+                "source_mtime_ns": source.stat().st_mtime_ns,
+            }
+        )
+    )
+    assert AnimeLibraryService._source_matches_prepared_sync(source, prepared) is False
+    assert probed == []
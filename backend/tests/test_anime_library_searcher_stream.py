@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from app.config import settings
+from app.library_types import LibraryType
+from app.services import anime_library
+from app.services.anime_library import AnimeLibraryService
+
+
+def _parse(line: bytes, text_line_index: int = 1):
+    return AnimeLibraryService._parse_searcher_progress_line(
+        line=line,
+        status="indexing",
+        total_files=2,
+        progress_start=0.3,
+        progress_span=0.6,
+        text_line_index=text_line_index,
+    )
+
+
+def test_parse_searcher_progress_line_skips_blank_lines() -> None:
+    assert _parse(b"  \n") is None
+
+
+def test_parse_searcher_progress_line_reports_text_lines() -> None:
+    progress = _parse(b"Loading model\xff\n", text_line_index=50)
+
+    assert progress is not None
+    assert progress.status == "indexing"
+    assert progress.message == "Loading model�"
+    assert progress.progress == 0.3 + 0.6 * (50 / 200)
+
+
+def test_parse_searcher_progress_line_reads_text_counters() -> None:
+    progress = _parse(b"Indexing episode 3 / 12\n", text_line_index=1)
+    assert progress is not None
+    assert progress.progress == 0.3 + 0.6 * (3 / 12)
+
+    # Counters that are not a fraction fall back to the line-count estimate.
+    progress = _parse(b"batch 128/64\n", text_line_index=1_000)
+    assert progress is not None
+    assert progress.progress == 0.3 + 0.6
+
+
+def test_parse_searcher_progress_line_treats_non_event_json_as_text() -> None:
+    progress = _parse(b'{"frames": 3}\n')
+
+    assert progress is not None
+    assert progress.message == '{"frames": 3}'
+
+
+def test_parse_searcher_progress_line_reads_error_events() -> None:
+    progress = _parse(b'{"event": "error", "error": "CUDA out of memory"}\n')
+
+    assert progress is not None
+    assert progress.status == "error"
+    assert progress.error == "CUDA out of memory"
+
+
+def test_cli_json_output_is_parsed_from_bytes(monkeypatch: pytest.MonkeyPatch) -> None:
+    outputs = {
+        "list": b'{"series": [{"name": "Show", "frames": 10}]}\n',
+        "search": b'{"results": [{"series": "Show", "similarity": 0.9}]}\n',
+    }
+
+    async def fake_run_command(cmd, **_kwargs):
+        return SimpleNamespace(returncode=0, stdout=outputs[cmd[6]], stderr=b"")
+
+    monkeypatch.setattr(settings, "anime_searcher_inprocess", False)
+    monkeypatch.setattr(anime_library, "run_command", fake_run_command)
+
+    assert asyncio.run(
+        AnimeLibraryService._list_indexed_anime_uncached(LibraryType.ANIME)
+    ) == ["Show"]
+    assert asyncio.run(AnimeLibraryService.search_frame(Path("query.png"))) == [
+        {"series": "Show", "similarity": 0.9}
+    ]
+
+    outputs["search"] = b"\xff not json"
+    assert asyncio.run(AnimeLibraryService.search_frame(Path("query.png"))) == []
+
+
+def test_stream_searcher_command_coalesces_progress_within_a_step(tmp_path: Path) -> None:
+    script = (
+        "import json\n"
+        "for i in range(200):\n"
+        "    print(json.dumps({'event': 'progress', 'message': str(i),"
+        " 'current_file': 'ep1.mp4', 'completed_files': 0}), flush=True)\n"
+        "print(json.dumps({'event': 'progress', 'message': 'next',"
+        " 'current_file': 'ep2.mp4', 'completed_files': 1}), flush=True)\n"
+        "print(json.dumps({'event': 'progress', 'message': 'last',"
+        " 'current_file': 'ep2.mp4', 'completed_files': 1}), flush=True)\n"
+    )
+
+    async def collect() -> list[str]:
+        return [
+            progress.message
+            async for progress in AnimeLibraryService._stream_searcher_command(
+                cmd=[sys.executable, "-c", script],
+                cwd=tmp_path,
+                total_files=2,
+                status="indexing",
+                progress_start=0.3,
+                progress_span=0.6,
+            )
+        ]
+
+    messages = asyncio.run(collect())
+
+    assert messages[0] == "0"
+    assert "next" in messages
+    assert messages[-1] == "last"
+    assert len(messages) < 50
+
+
+def test_list_indexed_anime_reads_current_manifest_without_cli(
+    tmp_path: Path,
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    monkeypatch.setattr(settings, "anime_library_path", tmp_path / "library")
+    monkeypatch.setattr(settings, "anime_searcher_inprocess", False)
+    monkeypatch.setattr(AnimeLibraryService, "_index_metadata_cache", {})
+    calls: list[list[str]] = []
+
+    async def fake_run_command(cmd, **_kwargs):
+        calls.append(cmd)
+        return SimpleNamespace(returncode=0, stdout=b'{"series": ["FromCli"]}', stderr=b"")
+
+    monkeypatch.setattr(anime_library, "run_command", fake_run_command)
+    index_dir = AnimeLibraryService.get_library_path(LibraryType.ANIME) / ".index"
+    index_dir.mkdir(parents=True)
+    manifest_path = index_dir / AnimeLibraryService.MANIFEST_FILE
+    manifest_path.write_text(
+        json.dumps(
+            {
+                "version": AnimeLibraryService.SEARCHER_INDEX_FORMAT_VERSION,
+                "series": {"Zeta": {}, "Alpha": {"fps": 2.0}},
+            }
+        )
+    )
+
+    assert asyncio.run(
+        AnimeLibraryService._list_indexed_anime_uncached(LibraryType.ANIME)
+    ) == ["Alpha", "Zeta"]
+    assert calls == []
+
+    manifest_path.write_text(json.dumps({"version": 1, "series": {"Old": {}}}))
+    os.utime(manifest_path, ns=(5_000_000_000, 5_000_000_000))
+    assert asyncio.run(
+        AnimeLibraryService._list_indexed_anime_uncached(LibraryType.ANIME)
+    ) == ["FromCli"]
+    assert len(calls) == 1
@@ -0,0 +1,66 @@
+import asyncio
+import sys
+from pathlib import Path
+
+import orjson
+import pytest
+from fastapi import HTTPException
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.api.routes import anime as anime_routes
+from app.library_types import LibraryType
+
+
+def _stream_lines(library_type: LibraryType) -> list[dict]:
+    async def read():
+        response = await anime_routes.stream_indexed_anime(library_type=library_type)
+        return [chunk async for chunk in response.body_iterator]
+
+    chunks = asyncio.run(read())
+    return [orjson.loads(line) for line in b"".join(chunks).splitlines()]
+
+
+def test_list_ndjson_raises_500_when_catalog_fails(monkeypatch):
+    async def failing(**kwargs):
+        raise RuntimeError("catalog unavailable")
+        yield  # pragma: no cover
+
+    monkeypatch.setattr(
+        anime_routes.LibraryHydrationService, "iter_source_details", failing
+    )
+
+    with pytest.raises(HTTPException) as exc_info:
+        asyncio.run(anime_routes.stream_indexed_anime(library_type=LibraryType.ANIME))
+
+    assert exc_info.value.status_code == 500
+    assert "catalog unavailable" in exc_info.value.detail
+
+
+def test_list_ndjson_ends_with_error_line_on_late_failure(monkeypatch):
+    async def partial(**kwargs):
+        yield {"name": "Show A"}
+        yield {"name": "Show B"}
+        raise RuntimeError("sync failed")
+
+    monkeypatch.setattr(
+        anime_routes.LibraryHydrationService, "iter_source_details", partial
+    )
+
+    assert _stream_lines(LibraryType.ANIME) == [
+        {"name": "Show A"},
+        {"name": "Show B"},
+        {"error": "sync failed"},
+    ]
+
+
+def test_list_ndjson_empty_library(monkeypatch):
+    async def empty(**kwargs):
+        return
+        yield  # pragma: no cover
+
+    monkeypatch.setattr(
+        anime_routes.LibraryHydrationService, "iter_source_details", empty
+    )
+
+    assert _stream_lines(LibraryType.ANIME) == []
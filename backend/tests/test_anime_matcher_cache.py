@@ -319,13 +319,16 @@ def test_extract_frames_uses_presentation_timestamps_for_vfr(monkeypatch) -> Non
                 self.last_index = None
             return True
 
-        def read(self):
+        def grab(self) -> bool:
             if self.next_index >= len(self.pts):
-                return False, None
+                return False
             self.last_index = self.next_index
             self.next_index += 1
-            frame = np.full((2, 2, 3), self.last_index, dtype=np.uint8)
-            return True, frame
+            return True
+
+        def retrieve(self):
+            self.retrieved.append(self.last_index)
+            return True, np.full((2, 2, 3), self.last_index, dtype=np.uint8)
 
     monkeypatch.setattr(
         AnimeMatcherService,
@@ -333,12 +336,142 @@ def test_extract_frames_uses_presentation_timestamps_for_vfr(monkeypatch) -> Non
         classmethod(lambda cls: FakeCV2),
     )
 
+    cap = FakeCapture()
+    cap.retrieved = []
     frames = AnimeMatcherService._extract_frames_from_capture(
-        FakeCapture(),
+        cap,
         [0.0, 2.0, 10.0],
     )
 
     assert [int(np.asarray(frame)[0, 0, 0]) for frame in frames] == [0, 2, 3]
+    assert cap.retrieved == [0, 1, 2, 3]
+
+
+def test_extract_frames_only_retrieves_frames_near_targets(monkeypatch) -> None:
+    class FakeCV2:
+        CAP_PROP_FPS = 1
+        CAP_PROP_POS_FRAMES = 2
+        CAP_PROP_POS_MSEC = 3
+        COLOR_BGR2RGB = 4
+
+        @staticmethod
+        def cvtColor(frame, code):
+            return frame
+
+    class FakeCapture:
+        def __init__(self) -> None:
+            self.next_index = 0
+            self.retrieved: list[int] = []
+
+        def get(self, prop: int) -> float:
+            if prop == FakeCV2.CAP_PROP_FPS:
+                return 10.0
+            if prop == FakeCV2.CAP_PROP_POS_FRAMES:
+                return float(self.next_index)
+            if prop == FakeCV2.CAP_PROP_POS_MSEC:
+                return (self.next_index - 1) * 100.0
+            return 0.0
+
+        def set(self, prop: int, value: float) -> bool:
+            self.next_index = int(round(float(value) / 100.0))
+            return True
+
+        def grab(self) -> bool:
+            if self.next_index >= 100:
+                return False
+            self.next_index += 1
+            return True
+
+        def retrieve(self):
+            index = self.next_index - 1
+            self.retrieved.append(index)
+            return True, np.full((2, 2, 3), index, dtype=np.uint8)
+
+    monkeypatch.setattr(
+        AnimeMatcherService,
+        "_require_cv2",
+        classmethod(lambda cls: FakeCV2),
+    )
+
+    cap = FakeCapture()
+    frames = AnimeMatcherService._extract_frames_from_capture(cap, [5.0])
+
+    assert int(np.asarray(frames[0])[0, 0, 0]) == 50
+    assert cap.retrieved == [47, 48, 49, 50]
+
+
+def _seekable_pts_capture(cv2, pts: list[float], fps: float):
+    class FakeCapture:
+        def __init__(self) -> None:
+            self.next_index = 0
+
+        def get(self, prop: int) -> float:
+            if prop == cv2.CAP_PROP_FPS:
+                return fps
+            if prop == cv2.CAP_PROP_POS_FRAMES:
+                return float(self.next_index)
+            if prop == cv2.CAP_PROP_POS_MSEC:
+                return pts[self.next_index - 1] * 1000.0 if self.next_index else 0.0
+            return 0.0
+
+        def set(self, prop: int, value: float) -> bool:
+            if prop == cv2.CAP_PROP_POS_FRAMES:
+                self.next_index = int(value)
+            else:
+                self.next_index = next(
+                    (i for i, t in enumerate(pts) if t >= float(value) / 1000.0 - 1e-9),
+                    len(pts),
+                )
+            return True
+
+        def grab(self) -> bool:
+            if self.next_index >= len(pts):
+                return False
+            self.next_index += 1
+            return True
+
+        def retrieve(self):
+            return True, np.full((2, 2, 3), (self.next_index - 1) % 256, dtype=np.uint8)
+
+        def read(self):
+            if not self.grab():
+                return False, None
+            return self.retrieve()
+
+    return FakeCapture()
+
+
+def test_extract_frames_decodes_skipped_frames_that_win(monkeypatch) -> None:
+    class FakeCV2:
+        CAP_PROP_FPS = 1
+        CAP_PROP_POS_FRAMES = 2
+        CAP_PROP_POS_MSEC = 3
+
+    monkeypatch.setattr(
+        AnimeMatcherService,
+        "_require_cv2",
+        classmethod(lambda cls: FakeCV2),
+    )
+
+    # Target past the last frame: the final frame is grabbed but outside the
+    # retrieve window, and must still be returned.
+    cap = _seekable_pts_capture(FakeCV2, [index / 24.0 for index in range(240)], 24.0)
+    frames, indices = AnimeMatcherService._extract_frames_with_indices_from_capture(
+        cap,
+        [5.0, 10.5],
+    )
+    assert indices == [120, 239]
+    assert [int(np.asarray(frame)[0, 0, 0]) for frame in frames] == [120, 239]
+
+    # VFR gap: the frame before the target is far outside the average-FPS
+    # window yet closer than the next presented frame.
+    cap = _seekable_pts_capture(FakeCV2, [0.0, 0.04, 0.08, 5.0], 24.0)
+    frames, indices = AnimeMatcherService._extract_frames_with_indices_from_capture(
+        cap,
+        [0.5, 4.9],
+    )
+    assert indices == [2, 3]
+    assert [int(np.asarray(frame)[0, 0, 0]) for frame in frames] == [2, 3]
 
 
 def test_scene_merger_frame_diffs_use_presentation_timestamps(monkeypatch) -> None:
@@ -1362,3 +1495,315 @@ def test_release_matching_resources_drops_model_indices_and_project_caches(
     assert AnimeMatcherService._query_processor is None
     assert AnimeMatcherService._episode_paths_cache == {}
     assert AnimeMatcherService._video_frame_embedding_cache == {}
+
+
+def test_bgr_frame_to_image_swaps_channels_without_aliasing() -> None:
+    frame = np.zeros((2, 3, 3), dtype=np.uint8)
+    frame[..., 0] = 200  # blue
+    frame[..., 2] = 10  # red
+
+    image = AnimeMatcherService._bgr_frame_to_image(frame[:, ::-1])
+    frame[...] = 0
+
+    assert image.mode == "RGB"
+    assert image.size == (3, 2)
+    assert image.getpixel((0, 0)) == (10, 0, 200)
+
+
+def test_flipped_image_search_shares_one_embedding_and_faiss_call(monkeypatch) -> None:
+    embed_calls: list[int] = []
+    search_calls: list[int] = []
+
+    class FakeIndexManager:
+        def search_batch(self, embeddings, top_n, threshold, series=None):
+            search_calls.append(len(embeddings))
+            return [[(float(row[0]), f"meta-{int(row[0])}")] for row in embeddings]
+
+    class FakeProcessor:
+        index_manager = FakeIndexManager()
+
+        @staticmethod
+        def _merge_results(original, flipped, top_n):
+            return (original + flipped)[:top_n]
+
+        @staticmethod
+        def _format_result(rank, similarity, metadata):
+            return (rank, similarity, metadata)
+
+    def fake_embed(cls, images):
+        embed_calls.append(len(images))
+        return np.arange(len(images), dtype=np.float32).reshape(-1, 1)
+
+    monkeypatch.setattr(AnimeMatcherService, "_query_processor", FakeProcessor())
+    monkeypatch.setattr(AnimeMatcherService, "_embed_pil_batch", classmethod(fake_embed))
+
+    results = AnimeMatcherService._search_image_batch(
+        [Image.new("RGB", (4, 4), "red"), Image.new("RGB", (4, 4), "blue")],
+        top_n=5,
+        flip=True,
+    )
+
+    assert embed_calls == [4]
+    assert search_calls == [4]
+    assert results == [
+        [(1, 0.0, "meta-0"), (2, 2.0, "meta-2")],
+        [(1, 1.0, "meta-1"), (2, 3.0, "meta-3")],
+    ]
+
+
+def test_batched_probe_search_embeds_identical_frames_once(monkeypatch) -> None:
+    gradient = Image.fromarray(
+        np.tile(np.arange(16, dtype=np.uint8) * 16, (16, 1)).repeat(3).reshape(16, 16, 3)
+    )
+    shifted = Image.fromarray(np.asarray(gradient) + 1)
+    probe_frames = {
+        0: (gradient, gradient.copy(), shifted),
+        1: (gradient.copy(), Image.new("RGB", (16, 16), "black"), shifted.copy()),
+    }
+    searched: list[int] = []
+
+    class Result:
+        def __init__(self, index: int) -> None:
+            self.episode = f"ep-{index}"
+            self.timestamp = float(index)
+            self.similarity = 0.9
+            self.series = "Series"
+
+    def fake_search(cls, images, **kwargs):
+        start = len(searched)
+        searched.extend(range(start, start + len(images)))
+        return [[Result(start + offset)] for offset in range(len(images))]
+
+    monkeypatch.setattr(
+        AnimeMatcherService,
+        "_search_image_batch",
+        classmethod(fake_search),
+    )
+
+    results = AnimeMatcherService._search_scene_probe_candidates_batch(
+        probe_frames,
+        top_n=25,
+        threshold=None,
+        flip=True,
+        series="Series",
+    )
+
+    # Gradient and its +1 shift share a dHash but differ in pixels.
+    assert searched == [0, 1, 2]
+    assert [candidates[0].episode for candidates in results[0]] == ["ep-0", "ep-0", "ep-1"]
+    assert [candidates[0].episode for candidates in results[1]] == ["ep-0", "ep-2", "ep-1"]
+    assert results[0][0] is not results[0][1]
+
+
+def test_temporal_proposal_picks_first_best_consistent_triple() -> None:
+    def candidate(episode: str, timestamp: float, similarity: float) -> MatchCandidate:
+        return MatchCandidate(
+            episode=episode,
+            timestamp=timestamp,
+            similarity=similarity,
+            series="Series",
+        )
+
+    start = [candidate("E2", 10.0, 0.99), candidate("E1", 10.0, 0.9), candidate("E1", 10.0, 0.9)]
+    middle = [candidate("E1", 9.0, 0.99), candidate("E1", 11.0, 0.9)]
+    end = [candidate("E1", 12.0, 0.9), candidate("E1", 40.0, 0.99)]
+
+    proposal = AnimeMatcherService._find_temporal_proposal(start, middle, end, 2.0)
+
+    assert proposal is not None
+    assert (proposal.episode, proposal.start_time, proposal.end_time) == ("E1", 10.0, 12.0)
+    assert abs(proposal.confidence - 0.91) < 1e-9
+    assert proposal.debug["speed_ratio"] == 1.0
+    assert AnimeMatcherService._find_temporal_proposal([], middle, end, 2.0) is None
+    assert AnimeMatcherService._find_temporal_proposal(start, middle, end, 200.0) is None
+
+
+def test_best_ordered_interval_prefers_triples_in_speed_range() -> None:
+    best = AnimeMatcherService._best_ordered_interval(
+        np.array([(10.0, 0.9), (30.0, 0.99)]),
+        np.array([(11.0, 0.9), (5.0, 0.99)]),
+        np.array([(12.0, 0.9), (31.0, 0.99)]),
+        2.0,
+        0.5,
+        1.6,
+    )
+    assert best == (10.0, 12.0, 1.0)
+
+    # Without the middle probe the (30, 31) pair wins on similarity.
+    assert AnimeMatcherService._best_ordered_interval(
+        np.array([(10.0, 0.9), (30.0, 0.99)]),
+        None,
+        np.array([(12.0, 0.9), (31.0, 0.99)]),
+        1.0,
+        0.4,
+        1.6,
+    ) == (30.0, 31.0, 1.0)
+    assert AnimeMatcherService._best_ordered_interval(
+        np.array([(10.0, 0.9)]), None, np.array([(9.0, 0.9)]), 1.0, 0.5, 1.6
+    ) is None
+
+
+def test_single_frame_alternatives_share_one_pooled_ranking() -> None:
+    def candidate(episode: str, timestamp: float, similarity: float) -> MatchCandidate:
+        return MatchCandidate(
+            episode=episode,
+            timestamp=timestamp,
+            similarity=similarity,
+            series="Series",
+        )
+
+    alternatives = AnimeMatcherService._compute_alternatives(
+        [candidate("E1", 10.0, 0.95), candidate("E2", 50.0, 0.94)],
+        [candidate("E3", 81.0, 0.6)],
+        [candidate("E4", 120.0, 0.97)],
+        2.0,
+    )
+
+    best_frame = [alt for alt in alternatives if alt.algorithm == "best_frame"]
+    union_topk = [alt for alt in alternatives if alt.algorithm == "union_topk"]
+    assert [(alt.episode, alt.start_time, alt.end_time) for alt in best_frame] == [
+        ("E4", 118.0, 120.0),
+        ("E1", 10.0, 12.0),
+    ]
+    # Union top-k proposals for E4/E1 duplicate the best-frame intervals and
+    # are dropped by dedup, leaving only distinct intervals.
+    assert all(alt.episode not in {"E4", "E1"} for alt in union_topk)
+
+
+def test_probe_pipeline_searches_each_decoded_chunk(monkeypatch) -> None:
+    released: list[bool] = []
+
+    class FakeCapture:
+        def release(self) -> None:
+            released.append(True)
+
+    class FakeCV2:
+        @staticmethod
+        def VideoCapture(path):
+            return FakeCapture()
+
+    def fake_extract(cls, video_path, scene_items, *, cap=None):
+        assert isinstance(cap, FakeCapture)
+        frames = {index: (Image.new("RGB", (2, 2)),) * 3 for index, _ in scene_items}
+        indices = {index: (index, index, index) for index, _ in scene_items}
+        return frames, indices
+
+    searched_chunks: list[list[int]] = []
+
+    def fake_search(cls, probe_frames, **kwargs):
+        searched_chunks.append(sorted(probe_frames))
+        assert kwargs["probe_frame_indices"].keys() == probe_frames.keys()
+        return {index: ([index], [], []) for index in probe_frames}
+
+    monkeypatch.setattr(AnimeMatcherService, "_require_cv2", classmethod(lambda cls: FakeCV2))
+    monkeypatch.setattr(
+        AnimeMatcherService,
+        "_extract_scene_probe_frames_with_indices",
+        classmethod(fake_extract),
+    )
+    monkeypatch.setattr(
+        AnimeMatcherService,
+        "_search_scene_probe_candidates_batch",
+        classmethod(fake_search),
+    )
+
+    scene_items = [
+        (index, Scene(index=index, start_time=float(index), end_time=index + 1.0))
+        for index in range(5)
+    ]
+    frames, candidates = AnimeMatcherService._extract_and_search_scene_probes(
+        Path("video.mp4"),
+        scene_items,
+        series="Series",
+        chunk_scenes=2,
+    )
+
+    assert searched_chunks == [[0, 1], [2, 3], [4]]
+    assert sorted(frames) == [0, 1, 2, 3, 4]
+    assert candidates[3] == ([3], [], [])
+    assert released == [True]
+
+
+def test_probe_pipeline_surfaces_decode_errors(monkeypatch) -> None:
+    class FakeCV2:
+        @staticmethod
+        def VideoCapture(path):
+            return types.SimpleNamespace(release=lambda: None)
+
+    def failing_extract(cls, video_path, scene_items, *, cap=None):
+        raise RuntimeError("decode failed")
+
+    monkeypatch.setattr(AnimeMatcherService, "_require_cv2", classmethod(lambda cls: FakeCV2))
+    monkeypatch.setattr(
+        AnimeMatcherService,
+        "_extract_scene_probe_frames_with_indices",
+        classmethod(failing_extract),
+    )
+
+    try:
+        AnimeMatcherService._extract_and_search_scene_probes(
+            Path("video.mp4"),
+            [(0, Scene(index=0, start_time=0.0, end_time=1.0))],
+            series=None,
+        )
+    except RuntimeError as exc:
+        assert str(exc) == "decode failed"
+    else:
+        raise AssertionError("decode errors should propagate")
+
+
+def test_as_rgb_reuses_rgb_images_and_converts_others() -> None:
+    rgb = Image.new("RGB", (2, 2), "red")
+    gray = Image.new("L", (2, 2), 128)
+
+    assert AnimeMatcherService._as_rgb(rgb) is rgb
+    converted = AnimeMatcherService._as_rgb(gray)
+    assert converted.mode == "RGB"
+    assert converted.getpixel((0, 0)) == (128, 128, 128)
+
+
+def test_probe_pipeline_stops_decoding_when_search_fails(monkeypatch) -> None:
+    class FakeCV2:
+        @staticmethod
+        def VideoCapture(path):
+            return types.SimpleNamespace(release=lambda: None)
+
+    extracted: list[int] = []
+
+    def fake_extract(cls, video_path, scene_items, *, cap=None):
+        extracted.append(scene_items[0][0])
+        return {index: (None, None, None) for index, _ in scene_items}, {}
+
+    def failing_search(cls, probe_frames, **kwargs):
+        raise RuntimeError("search failed")
+
+    monkeypatch.setattr(AnimeMatcherService, "_require_cv2", classmethod(lambda cls: FakeCV2))
+    monkeypatch.setattr(
+        AnimeMatcherService,
+        "_extract_scene_probe_frames_with_indices",
+        classmethod(fake_extract),
+    )
+    monkeypatch.setattr(
+        AnimeMatcherService,
+        "_search_scene_probe_candidates_batch",
+        classmethod(failing_search),
+    )
+
+    scene_items = [
+        (index, Scene(index=index, start_time=float(index), end_time=index + 1.0))
+        for index in range(100)
+    ]
+    try:
+        AnimeMatcherService._extract_and_search_scene_probes(
+            Path("video.mp4"),
+            scene_items,
+            series=None,
+            chunk_scenes=1,
+        )
+    except RuntimeError as exc:
+        assert str(exc) == "search failed"
+    else:
+        raise AssertionError("search errors should propagate")
+
+    # At most the queued chunks plus one in flight are decoded after failure.
+    assert len(extracted) <= 5
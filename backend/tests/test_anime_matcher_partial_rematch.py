@@ -68,7 +68,7 @@ def test_partial_rematch_preserves_untargeted_and_rematches_target(
         AnimeMatcherService,
         "_extract_scene_probe_frames_with_indices",
         classmethod(
-            lambda cls, video_path, items: (
+            lambda cls, video_path, items, cap=None: (
                 {i: (img, img, img) for i, _ in items},
                 {i: (0, 1, 2) for i, _ in items},
             )
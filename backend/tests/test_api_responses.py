@@ -0,0 +1,57 @@
+from __future__ import annotations
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import numpy as np
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from app.api.responses import LargeFileResponse, ORJSONResponse
+from app.api.routes import api_router
+
+
+def test_orjson_response_renders_numpy_and_int_keys() -> None:
+    response = ORJSONResponse({1: np.float32(0.5), "ids": np.arange(2)})
+    assert response.body == b'{"1":0.5,"ids":[0,1]}'
+    assert response.headers["content-type"] == "application/json"
+
+
+def test_api_router_defaults_to_orjson_response(monkeypatch) -> None:
+    rendered: list[object] = []
+    original_render = ORJSONResponse.render
+
+    def _render(self, content):
+        rendered.append(content)
+        return original_render(self, content)
+
+    monkeypatch.setattr(ORJSONResponse, "render", _render)
+    app = FastAPI()
+    app.include_router(api_router)
+
+    response = TestClient(app).get("/api/accounts")
+
+    assert response.status_code == 200
+    assert rendered == [response.json()]
+
+
+def test_large_file_response_keeps_range_support(tmp_path: Path) -> None:
+    payload = bytes(range(256)) * 8192
+    bundle = tmp_path / "bundle.zip"
+    bundle.write_bytes(payload)
+    app = FastAPI()
+
+    @app.get("/bundle")
+    async def _bundle():
+        return LargeFileResponse(bundle, media_type="application/zip")
+
+    client = TestClient(app)
+    full = client.get("/bundle")
+    partial = client.get("/bundle", headers={"Range": "bytes=10-19"})
+
+    assert full.content == payload
+    assert full.headers["content-length"] == str(len(payload))
+    assert partial.status_code == 206
+    assert partial.content == payload[10:20]
@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import sys
+from collections import Counter
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from fastapi.routing import APIRoute
+
+from app.api.routes import api_router
+
+
+def _iter_api_routes(routes):
+    for route in routes:
+        if isinstance(route, APIRoute):
+            yield route
+        included = getattr(route, "original_router", None)
+        if included is not None:
+            yield from _iter_api_routes(included.routes)
+
+
+def test_every_api_route_is_registered_once() -> None:
+    registrations = Counter(
+        (route.path, method)
+        for route in _iter_api_routes(api_router.routes)
+        for method in route.methods
+    )
+
+    assert registrations
+    assert [key for key, count in registrations.items() if count > 1] == []
@@ -0,0 +1,94 @@
+from __future__ import annotations
+
+import json
+import os
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from app.api.routes import gaps
+
+
+@pytest.fixture(autouse=True)
+def _clear_cache() -> None:
+    gaps._TRANS_CACHE.clear()
+    gaps._TRANS_PATH_CACHE.clear()
+
+
+def _write(path: Path, payload: dict, mtime_ns: int) -> None:
+    path.write_text(json.dumps(payload))
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+def test_load_transcription_reuses_parse_until_file_changes(tmp_path: Path) -> None:
+    path = tmp_path / "gap_detection_transcription.json"
+    _write(path, {"scenes": [{"scene_index": 0}]}, mtime_ns=1_000_000_000)
+
+    first = gaps._load_transcription(path)
+    assert gaps._load_transcription(path) is first
+
+    _write(path, {"scenes": [{"scene_index": 1}]}, mtime_ns=2_000_000_000)
+    second = gaps._load_transcription(path)
+    assert second is not first
+    assert second["scenes"][0]["scene_index"] == 1
+
+
+def test_load_transcription_evicts_deleted_file(tmp_path: Path) -> None:
+    path = tmp_path / "gap_detection_transcription.json"
+    _write(path, {"scenes": []}, mtime_ns=1_000_000_000)
+    gaps._load_transcription(path)
+    assert str(path) in gaps._TRANS_CACHE
+
+    path.unlink()
+    with pytest.raises(OSError):
+        gaps._load_transcription(path)
+    assert str(path) not in gaps._TRANS_CACHE
+
+
+def test_load_transcription_propagates_invalid_json(tmp_path: Path) -> None:
+    path = tmp_path / "gap_detection_transcription.json"
+    path.write_text("{not json")
+
+    with pytest.raises(json.JSONDecodeError):
+        gaps._load_transcription(path)
+    assert str(path) not in gaps._TRANS_CACHE
+
+
+def test_load_project_transcription_prefers_primary_and_falls_back_after_delete(
+    tmp_path: Path,
+) -> None:
+    assert gaps._load_project_transcription(tmp_path) is None
+
+    fallback = tmp_path / "output" / "transcription_timing.json"
+    fallback.parent.mkdir()
+    _write(fallback, {"scenes": ["fallback"]}, mtime_ns=1_000_000_000)
+    assert gaps._load_project_transcription(tmp_path) == {"scenes": ["fallback"]}
+    assert str(tmp_path) not in gaps._TRANS_PATH_CACHE
+
+    primary = tmp_path / "gap_detection_transcription.json"
+    _write(primary, {"scenes": ["primary"]}, mtime_ns=1_000_000_000)
+    assert gaps._load_project_transcription(tmp_path) == {"scenes": ["primary"]}
+    assert gaps._TRANS_PATH_CACHE[str(tmp_path)] == str(primary)
+
+    primary.unlink()
+    assert gaps._load_project_transcription(tmp_path) == {"scenes": ["fallback"]}
+    assert str(tmp_path) not in gaps._TRANS_PATH_CACHE
+
+
+def test_load_transcription_evicts_safely_from_concurrent_workers(tmp_path: Path) -> None:
+    from concurrent.futures import ThreadPoolExecutor
+
+    paths = []
+    for index in range(gaps._TRANS_CACHE_MAX_ENTRIES * 4):
+        path = tmp_path / f"transcription_{index}.json"
+        _write(path, {"scenes": [index]}, mtime_ns=1_000_000_000)
+        paths.append(path)
+
+    with ThreadPoolExecutor(8) as pool:
+        results = list(pool.map(gaps._load_transcription, paths))
+
+    assert [result["scenes"][0] for result in results] == list(range(len(paths)))
+    assert len(gaps._TRANS_CACHE) <= gaps._TRANS_CACHE_MAX_ENTRIES
@@ -182,3 +182,20 @@ def test_subframe_window_still_produces_a_decodable_clip(
     )
     frames = int((probe.stdout.strip() or "0"))
     assert frames >= 1, "sub-frame window produced a clip with no video frames"
+
+
+def test_search_episode_finds_nested_file_in_single_walk(tmp_path: Path) -> None:
+    nested = tmp_path / "Season 1" / "extras"
+    nested.mkdir(parents=True)
+    (nested / "Episode 02.txt").write_bytes(b"")
+    target = nested / "Episode 02.mkv"
+    target.write_bytes(b"")
+
+    found = MatchPlaybackService._search_episode_sync(
+        "Episode 02",
+        [tmp_path],
+        {".mp4", ".mkv"},
+    )
+
+    assert found == target
+    assert MatchPlaybackService._search_episode_sync("Episode 03", [tmp_path], {".mkv"}) is None
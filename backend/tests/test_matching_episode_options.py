@@ -1,6 +1,9 @@
 from __future__ import annotations
 
 import asyncio
+import json
+import os
+import re
 import sys
 from pathlib import Path
 
@@ -79,11 +82,6 @@ def test_batch_auto_fill_does_not_overwrite_existing_match(monkeypatch):
         ]
     )
 
-    monkeypatch.setattr(
-        matching.ProjectService,
-        "load",
-        lambda project_id: Project(id=project_id, library_type="anime"),
-    )
     monkeypatch.setattr(
         matching.ProjectService,
         "load_matches",
@@ -116,11 +114,13 @@ def test_batch_auto_fill_does_not_overwrite_existing_match(monkeypatch):
                     )
                 ]
             ),
+            project=Project(id="project-1", library_type="anime"),
         ),
     )
 
-    assert result["matches"][0]["episode"] == "Manual Episode"
-    assert result["matches"][0]["start_time"] == 10.0
+    payload = json.loads(result.body)
+    assert payload["matches"][0]["episode"] == "Manual Episode"
+    assert payload["matches"][0]["start_time"] == 10.0
     assert saved_matches[0].matches[0].episode == "Manual Episode"
 
 
@@ -144,11 +144,6 @@ def test_update_match_rejects_end_time_before_start_time():
 
 
 def test_update_matches_batch_rejects_equal_start_and_end_time(monkeypatch):
-    monkeypatch.setattr(
-        matching.ProjectService,
-        "load",
-        lambda project_id: Project(id=project_id, library_type="anime"),
-    )
     monkeypatch.setattr(
         matching.ProjectService,
         "load_matches",
@@ -189,6 +184,7 @@ def test_update_matches_batch_rejects_equal_start_and_end_time(monkeypatch):
                         )
                     ]
                 ),
+                project=Project(id="project-1", library_type="anime"),
             ),
         )
 
@@ -273,3 +269,94 @@ def test_playback_manifest_rejects_stale_active_fingerprint(monkeypatch, tmp_pat
     manifest = asyncio.run(MatchPlaybackService.get_manifest("project-1"))
 
     assert manifest["ready"] is False
+
+
+def test_iter_episode_videos_skips_symlinked_dirs_like_glob(tmp_path: Path):
+    root = tmp_path / "series"
+    season = root / "Season 1"
+    season.mkdir(parents=True)
+    elsewhere = tmp_path / "elsewhere"
+    elsewhere.mkdir()
+    (elsewhere / "Outside 01.mp4").write_bytes(b"")
+    (elsewhere / "Linked 03.mp4").write_bytes(b"")
+    (root / "Episode 01.MKV").write_bytes(b"")
+    (season / "Episode 02.mp4").write_bytes(b"")
+    (season / "notes.txt").write_bytes(b"")
+    (season / "loop").symlink_to(root, target_is_directory=True)
+    (root / "extras").symlink_to(elsewhere, target_is_directory=True)
+    (season / "Episode 03.mp4").symlink_to(elsewhere / "Linked 03.mp4")
+
+    found = sorted(Path(p).name for p in matching._iter_episode_videos(root))
+
+    assert found == ["Episode 01.MKV", "Episode 02.mp4", "Episode 03.mp4"]
+    assert found == sorted(p.name for p in root.glob("**/*.*") if p.suffix.lower() in {".mp4", ".mkv"})
+
+
+def test_resolve_anime_source_dir_uses_normalized_index_and_sees_new_folders(tmp_path: Path):
+    (tmp_path / "S-Rank Musume").mkdir()
+
+    assert matching._resolve_anime_source_dir(tmp_path, "s rank musume") == tmp_path / "S-Rank Musume"
+    assert matching._resolve_anime_source_dir(tmp_path, "Frieren") is None
+
+    (tmp_path / "Frieren!").mkdir()
+    os.utime(tmp_path, ns=(1, tmp_path.stat().st_mtime_ns + 1))
+
+    assert matching._resolve_anime_source_dir(tmp_path, "Frieren") == tmp_path / "Frieren!"
+
+
+@pytest.mark.parametrize(
+    "value",
+    ["[Judas] S-Rank Musume - S01E01", "Kimetsu no Yaiba: Yuukaku-hen (2021)", "Shingeki — Final Séason", ""],
+)
+def test_normalize_name_fast_path_matches_regex(value: str):
+    assert matching._normalize_name(value) == re.sub(r"[^a-z0-9]+", "", value.lower())
+
+
+def test_get_matches_serializes_match_list_directly(monkeypatch):
+    current_matches = MatchList(
+        matches=[
+            SceneMatch(
+                scene_index=0,
+                episode="Episode 01",
+                start_time=10.0,
+                end_time=11.0,
+                confidence=1.0,
+                speed_ratio=1.0,
+                confirmed=True,
+            )
+        ]
+    )
+    monkeypatch.setattr(
+        matching.ProjectService,
+        "load_matches",
+        lambda project_id: current_matches,
+    )
+
+    response = asyncio.run(matching.get_matches("project-1"))
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == {
+        "matches": [m.model_dump(mode="json") for m in current_matches.matches]
+    }
+
+
+def test_match_and_scene_lists_get_by_index_with_positional_fast_path():
+    def _match(scene_index: int) -> SceneMatch:
+        return SceneMatch(
+            scene_index=scene_index,
+            episode="",
+            start_time=0.0,
+            end_time=0.0,
+            confidence=0.0,
+            speed_ratio=1.0,
+        )
+
+    ordered = MatchList(matches=[_match(0), _match(1), _match(2)])
+    shifted = MatchList(matches=[_match(1), _match(3)])
+    scenes = SceneList(scenes=[Scene(index=0, start_time=0.0, end_time=1.0)])
+
+    assert ordered.get(1) is ordered.matches[1]
+    assert shifted.get(3) is shifted.matches[1]
+    assert shifted.get(0) is None
+    assert scenes.get(0) is scenes.scenes[0]
+    assert scenes.get(5) is None
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import sys
+import wave
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+from app.api.routes import processing
+
+
+def _write_wav(path: Path, frames: bytes, *, framerate: int = 16000) -> None:
+    with wave.open(str(path), "wb") as wav_file:
+        wav_file.setnchannels(1)
+        wav_file.setsampwidth(2)
+        wav_file.setframerate(framerate)
+        wav_file.writeframes(frames)
+
+
+def test_same_format_wav_parts_are_appended_frame_for_frame(tmp_path: Path) -> None:
+    first = tmp_path / "part_1.wav"
+    second = tmp_path / "part_2.wav"
+    _write_wav(first, b"\x01\x00\x02\x00")
+    _write_wav(second, b"\x03\x00")
+    output = tmp_path / "combined.wav"
+
+    processing._concat_audio_parts_to_wav([first, second], output)
+
+    with wave.open(str(output), "rb") as wav_file:
+        assert wav_file.getframerate() == 16000
+        assert wav_file.readframes(wav_file.getnframes()) == b"\x01\x00\x02\x00\x03\x00"
+
+
+def test_mismatched_wav_parts_skip_the_pcm_fast_path(tmp_path: Path) -> None:
+    first = tmp_path / "part_1.wav"
+    second = tmp_path / "part_2.wav"
+    _write_wav(first, b"\x01\x00")
+    _write_wav(second, b"\x02\x00", framerate=22050)
+    output = tmp_path / "combined.wav"
+
+    assert processing._concat_same_format_wavs([first, second], output) is False
+    assert not output.exists()
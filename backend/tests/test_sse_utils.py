@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from app.utils.sse import EventSourceResponse, _with_pings, sse_data
+
+
+def test_sse_data_encodes_single_frame() -> None:
+    assert sse_data({"status": "indexing", "progress": 0.5}) == (
+        b'data: {"status":"indexing","progress":0.5}\n\n'
+    )
+
+
+@pytest.mark.asyncio
+async def test_with_pings_emits_comment_while_source_is_idle() -> None:
+    async def slow_source():
+        yield b"data: 1\n\n"
+        await asyncio.sleep(0.05)
+        yield b"data: 2\n\n"
+
+    frames = [frame async for frame in _with_pings(slow_source(), 0.01)]
+
+    assert frames[0] == b"data: 1\n\n"
+    assert frames[-1] == b"data: 2\n\n"
+    assert b": ping\n\n" in frames[1:-1]
+
+
+@pytest.mark.asyncio
+async def test_with_pings_propagates_source_errors() -> None:
+    async def failing_source():
+        yield b"data: 1\n\n"
+        raise RuntimeError("boom")
+
+    frames = []
+    with pytest.raises(RuntimeError, match="boom"):
+        async for frame in _with_pings(failing_source(), 1.0):
+            frames.append(frame)
+    assert frames == [b"data: 1\n\n"]
+
+
+@pytest.mark.asyncio
+async def test_with_pings_closes_source_when_consumer_stops() -> None:
+    closed = asyncio.Event()
+
+    async def endless_source():
+        try:
+            while True:
+                yield b"data: x\n\n"
+                await asyncio.sleep(0)
+        finally:
+            closed.set()
+
+    stream = _with_pings(endless_source(), 1.0)
+    assert await stream.__anext__() == b"data: x\n\n"
+    await stream.aclose()
+
+    await asyncio.wait_for(closed.wait(), timeout=1.0)
+
+
+def test_event_source_response_sets_streaming_headers() -> None:
+    async def source():
+        yield b"data: {}\n\n"
+
+    response = EventSourceResponse(source(), ping=None)
+
+    assert response.media_type == "text/event-stream"
+    assert response.headers["cache-control"] == "no-cache"
+    assert response.headers["x-accel-buffering"] == "no"
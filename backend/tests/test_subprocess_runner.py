@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import asyncio
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+import pytest
+
+from app.utils.subprocess_runner import CommandTimeoutError, run_command
+
+
+def test_run_command_captures_both_streams_and_exit_code() -> None:
+    script = (
+        "import sys\n"
+        "sys.stdout.write('x' * 200000)\n"
+        "sys.stderr.write('warn')\n"
+        "sys.exit(3)\n"
+    )
+
+    result = asyncio.run(run_command([sys.executable, "-c", script]))
+
+    assert result.returncode == 3
+    assert result.stdout == b"x" * 200000
+    assert result.stderr == b"warn"
+
+
+def test_run_command_times_out_and_terminates() -> None:
+    with pytest.raises(CommandTimeoutError):
+        asyncio.run(
+            run_command(
+                [sys.executable, "-c", "import time; time.sleep(30)"],
+                timeout_seconds=0.2,
+            )
+        )